@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import argparse
+from datetime import timedelta
 from pathlib import Path
 
 from catalyst_radar.config.logging import setup_logging
 from catalyst_radar.config.settings import Settings
+from catalyst_radar.core.time import parse_utc, utc_now
 from catalyst_radar.pipeline.runner import PipelineRunner
+from catalyst_radar.storage.factory import open_event_store
+from catalyst_radar.watchlist.builder import WatchlistBuilder
 
 
 def _default_fixtures_path() -> str:
@@ -20,6 +24,17 @@ def main(argv=None) -> int:
     hello = sub.add_parser("hello", help="Run end-to-end pipeline with stub fixtures")
     hello.add_argument("--fixtures", default=_default_fixtures_path(), help="Path to stub fixture JSON")
 
+    sub.add_parser("compact", help="Merge sealed ledger segments and drop superseded event versions")
+
+    events = sub.add_parser("events", help="List one ticker's stored events, oldest first")
+    events.add_argument("--ticker", required=True)
+    window = events.add_mutually_exclusive_group()
+    window.add_argument("--days", type=int, help="Only events from the last N days")
+    window.add_argument("--since", help="Only events at or after this ISO-8601 time")
+    events.add_argument("--until", help="Only events before this ISO-8601 time")
+
+    sub.add_parser("watchlist", help="Print the watchlist recomputed from the event store (live window only)")
+
     args = parser.parse_args(argv)
     settings = Settings()
     setup_logging(settings.log_level)
@@ -35,6 +50,39 @@ def main(argv=None) -> int:
         print(f"watchlist_path: {result.watchlist_path}")
         return 0
 
+    if args.cmd == "compact":
+        with open_event_store(settings) as store:
+            if not hasattr(store, "compact"):
+                print(f"Nothing to compact for the {settings.ledger_backend} backend")
+                return 0
+            stats = store.compact()
+        print("OK")
+        print(f"segments: {stats.segments_before} -> {stats.segments_after}")
+        print(f"sealed lines: {stats.lines_before} -> {stats.lines_after}")
+        return 0
+
+    if args.cmd == "events":
+        start = parse_utc(args.since) if args.since else None
+        if args.days is not None:
+            start = utc_now() - timedelta(days=args.days)
+        end = parse_utc(args.until) if args.until else None
+        with open_event_store(settings) as store:
+            if not hasattr(store, "iter_ticker_range"):
+                print(f"Ticker lookups are not supported by the {settings.ledger_backend} backend")
+                return 1
+            for ev in store.iter_ticker_range(args.ticker, start, end):
+                print(f"{ev.event_timestamp_utc.isoformat()}  {ev.overall_score:3d}  {ev.confidence.value:<6}  {ev.event_id}  {ev.title}")
+        return 0
+
+    if args.cmd == "watchlist":
+        with open_event_store(settings) as store:
+            entries = WatchlistBuilder().build_from_store(store, now_utc=utc_now(), settings=settings)
+        for w in entries:
+            print(f"{w.ticker:<8} {w.rank_score:3d}  {w.confidence.value:<6}  {', '.join(w.top_events)}")
+        if not entries:
+            print("No actionable catalysts detected")
+        return 0
+
     return 1
 
 
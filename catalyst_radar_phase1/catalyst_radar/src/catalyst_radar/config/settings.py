@@ -47,6 +47,27 @@ class Settings:
     # Output + storage
     out_dir: str = _get_env("CATRADAR_OUT_DIR", "./out") or "./out"
     ledger_path: str = _get_env("CATRADAR_LEDGER_PATH", "./out/event_ledger.jsonl") or "./out/event_ledger.jsonl"
+    # Event store backend: "jsonl" (segmented ledger at ledger_path), "sqlite" (sqlite_path)
+    # or "postgres" (the Phase 2 events tables at database_url).
+    ledger_backend: str = (_get_env("CATRADAR_LEDGER_BACKEND", "jsonl") or "jsonl").lower()
+    sqlite_path: str = _get_env("CATRADAR_SQLITE_PATH", "./out/events.sqlite") or "./out/events.sqlite"
+    database_url: str | None = _get_env("CATRADAR_DATABASE_URL") or _get_env("DATABASE_URL")
+    # When ledger appends are fsynced: never / batch / event (see storage.local_jsonl_store).
+    ledger_fsync: str = (_get_env("CATRADAR_LEDGER_FSYNC", "batch") or "batch").lower()
+    # Ledger segments rotate at this size (0: never by size) or age in hours (unset: never by age).
+    ledger_segment_max_mb: int = _get_env_int("CATRADAR_LEDGER_SEGMENT_MAX_MB", 64)
+    ledger_segment_max_hours: int | None = _get_env_optional_int("CATRADAR_LEDGER_SEGMENT_MAX_HOURS")
+    # The active segment's columnar snapshot is rewritten on close after this many new events (0: only at sealing).
+    ledger_snapshot_every: int = _get_env_int("CATRADAR_LEDGER_SNAPSHOT_EVERY", 50000)
+
+    # Incremental watchlist state (per-ticker candidates + digest), rebuilt from the store when missing.
+    watchlist_state_path: str = (
+        _get_env("CATRADAR_WATCHLIST_STATE_PATH", "./out/watchlist_state.json") or "./out/watchlist_state.json"
+    )
+
+    # Sources are fetched concurrently; each gets this many seconds (adapters may set `timeout_s`).
+    source_timeout_s: int = _get_env_int("CATRADAR_SOURCE_TIMEOUT_S", 30)
+    source_workers: int = _get_env_int("CATRADAR_SOURCE_WORKERS", 8)
 
     # Logging
     log_level: str = (_get_env("CATRADAR_LOG_LEVEL", "INFO") or "INFO").upper()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import functools
+import sys
+from dataclasses import fields
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from catalyst_radar.core.models import (
+    Confidence,
+    CorroborationFields,
+    Event,
+    EventType,
+    FederalAwardFields,
+    GeopoliticsFields,
+    NotesFields,
+    PoliticianDisclosureFields,
+    PreOpMilestoneFields,
+    SourceType,
+)
+from catalyst_radar.core.time import parse_utc
+
+# Hand-written Event <-> dict codec for the ledgers. It produces exactly what the
+# dataclasses.asdict-based encoding produced (same keys, same order, None kept),
+# without asdict's recursive deep copies.
+
+_NESTED: Tuple[Tuple[str, Type[Any], Tuple[str, ...]], ...] = tuple(
+    (name, cls, tuple(f.name for f in fields(cls)))
+    for name, cls in (
+        ("politician_disclosure", PoliticianDisclosureFields),
+        ("federal_award", FederalAwardFields),
+        ("geopolitics", GeopoliticsFields),
+        ("preop_milestone", PreOpMilestoneFields),
+        ("corroboration", CorroborationFields),
+        ("notes", NotesFields),
+    )
+)
+
+_EVENT_TYPES = {m.value: m for m in EventType}
+_SOURCE_TYPES = {m.value: m for m in SourceType}
+_CONFIDENCES = {m.value: m for m in Confidence}
+
+_intern = sys.intern
+
+
+def _copy(value: Any) -> Any:
+    # Nested fields hold strings, lists of strings or lists of {"name", "url"} dicts.
+    if isinstance(value, list):
+        return [dict(v) if isinstance(v, dict) else v for v in value]
+    return value
+
+
+def _iso(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def event_to_dict(ev: Event) -> Dict[str, Any]:
+    """JSON-ready dict of an Event (enums as values, timestamps as ISO-8601 UTC)."""
+    d: Dict[str, Any] = {
+        "event_id": ev.event_id,
+        "event_type": ev.event_type.value,
+        "title": ev.title,
+        "summary": ev.summary,
+        "event_timestamp_utc": _iso(ev.event_timestamp_utc),
+        "discovered_timestamp_utc": _iso(ev.discovered_timestamp_utc),
+        "source_type": ev.source_type.value,
+        "source_name": ev.source_name,
+        "source_url": ev.source_url,
+        "source_hash": ev.source_hash,
+        "entities": list(ev.entities),
+        "tickers": list(ev.tickers),
+        "theme_tags": list(ev.theme_tags),
+        "confidence": ev.confidence.value,
+        "confidence_rationale": ev.confidence_rationale,
+        "credibility_score": ev.credibility_score,
+        "freshness_score": ev.freshness_score,
+        "materiality_score": ev.materiality_score,
+        "overall_score": ev.overall_score,
+    }
+    for name, _, names in _NESTED:
+        sub = getattr(ev, name)
+        d[name] = None if sub is None else {n: _copy(getattr(sub, n)) for n in names}
+    return d
+
+
+@functools.lru_cache(maxsize=65536)
+def _timestamp(text: str) -> datetime:
+    # Interned: events sharing a timestamp string share one datetime (e.g. date-only filings).
+    return parse_utc(text)
+
+
+def _strings(values: Optional[List[Any]]) -> List[str]:
+    return [_intern(str(v)) for v in values] if values else []
+
+
+def _nested(value: Any, cls: Type[Any]) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, cls):
+        return value
+    if isinstance(value, dict):
+        return cls(**value)
+    return None
+
+
+def event_from_dict(d: Dict[str, Any]) -> Event:
+    """Event from `event_to_dict` output (missing optional fields get their defaults)."""
+    return Event(
+        event_id=str(d["event_id"]),
+        event_type=_EVENT_TYPES.get(d["event_type"]) or EventType(d["event_type"]),
+        title=str(d["title"]),
+        summary=str(d["summary"]),
+        event_timestamp_utc=_timestamp(d["event_timestamp_utc"]),
+        discovered_timestamp_utc=_timestamp(d["discovered_timestamp_utc"]),
+        source_type=_SOURCE_TYPES.get(d["source_type"]) or SourceType(d["source_type"]),
+        source_name=_intern(str(d["source_name"])),
+        source_url=str(d["source_url"]),
+        source_hash=str(d["source_hash"]),
+        entities=_strings(d.get("entities")),
+        tickers=_strings(d.get("tickers")),
+        theme_tags=_strings(d.get("theme_tags")),
+        confidence=_CONFIDENCES.get(d.get("confidence")) or Confidence(d.get("confidence")),
+        confidence_rationale=_intern(str(d.get("confidence_rationale") or "TBD")),
+        credibility_score=int(d.get("credibility_score", 0)),
+        freshness_score=int(d.get("freshness_score", 0)),
+        materiality_score=int(d.get("materiality_score", 0)),
+        overall_score=int(d.get("overall_score", 0)),
+        politician_disclosure=_nested(d.get("politician_disclosure"), PoliticianDisclosureFields),
+        federal_award=_nested(d.get("federal_award"), FederalAwardFields),
+        geopolitics=_nested(d.get("geopolitics"), GeopoliticsFields),
+        preop_milestone=_nested(d.get("preop_milestone"), PreOpMilestoneFields),
+        corroboration=_nested(d.get("corroboration"), CorroborationFields),
+        notes=_nested(d.get("notes"), NotesFields),
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 from typing import Any, Optional, List, Dict
 
@@ -30,7 +30,7 @@ class Confidence(str, Enum):
     HIGH = "HIGH"
 
 
-@dataclass
+@dataclass(slots=True)
 class PoliticianDisclosureFields:
     reporting_person: Optional[str] = None
     filing_date: Optional[str] = None
@@ -40,7 +40,7 @@ class PoliticianDisclosureFields:
     asset_description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FederalAwardFields:
     award_id: Optional[str] = None
     contract_number: Optional[str] = None
@@ -52,14 +52,14 @@ class FederalAwardFields:
     prime_or_sub: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GeopoliticsFields:
     region_country_tags: Optional[List[str]] = None
     policy_action: Optional[str] = None
     affected_commodities: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PreOpMilestoneFields:
     project_name: Optional[str] = None
     location: Optional[str] = None
@@ -69,19 +69,19 @@ class PreOpMilestoneFields:
     offtake_counterparty: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CorroborationFields:
     corroborating_sources: Optional[List[Dict[str, str]]] = None  # [{"name":...,"url":...}]
     contradiction_flags: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NotesFields:
     parsing_notes: Optional[str] = None
     ambiguity_notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     # Required fields (Phase 0)
     event_id: str
@@ -113,25 +113,13 @@ class Event:
     notes: Optional[NotesFields] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        def convert(obj: Any) -> Any:
-            if isinstance(obj, datetime):
-                return obj.astimezone(timezone.utc).isoformat()
-            if isinstance(obj, Enum):
-                return obj.value
-            if hasattr(obj, "__dataclass_fields__"):
-                return {k: convert(v) for k, v in asdict(obj).items() if v is not None}
-            if isinstance(obj, list):
-                return [convert(v) for v in obj]
-            if isinstance(obj, dict):
-                return {k: convert(v) for k, v in obj.items()}
-            return obj
-
-        base = asdict(self)
-        # asdict already expands nested dataclasses; we still need to convert enums/datetimes
-        return convert(base)
-
-
-@dataclass
+        # Hand-written codec (no asdict deep copies); imported here to avoid a cycle.
+        from catalyst_radar.core.codec import event_to_dict
+
+        return event_to_dict(self)
+
+
+@dataclass(slots=True)
 class WatchlistEntry:
     # Phase 0 watchlist requirements
     ticker: str
@@ -3,31 +3,53 @@ from __future__ import annotations
 import json
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 
 from catalyst_radar.core.models import Event, WatchlistEntry
 
 
-def write_watchlist(path: str | Path, *, generated_at_utc: datetime, message: str, entries: List[WatchlistEntry], digest_events: List[Event]) -> None:
+DIGEST_SIZE = 25
+
+
+def digest_item(ev: Event) -> Dict[str, Any]:
+    return {
+        "event_id": ev.event_id,
+        "event_type": ev.event_type.value,
+        "title": ev.title,
+        "event_timestamp_utc": ev.event_timestamp_utc.astimezone(timezone.utc).isoformat(),
+        "source_url": ev.source_url,
+        "tickers": ev.tickers,
+        "confidence": ev.confidence.value,
+    }
+
+
+def recent_digest(events: Iterable[Event]) -> List[Dict[str, Any]]:
+    """Digest items of the DIGEST_SIZE most recently discovered events (ties keep input order)."""
+    recent = sorted(events, key=lambda x: x.discovered_timestamp_utc, reverse=True)[:DIGEST_SIZE]
+    return [digest_item(ev) for ev in recent]
+
+
+def write_watchlist(
+    path: str | Path,
+    *,
+    generated_at_utc: datetime,
+    message: str,
+    entries: List[WatchlistEntry],
+    digest_events: Iterable[Event] = (),
+    digest: Optional[List[Dict[str, Any]]] = None,
+) -> None:
+    """Write watchlist.json; the digest is either given or built from `digest_events`."""
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
 
+    if digest is None:
+        digest = recent_digest(digest_events)
+
     obj: Dict[str, Any] = {
         "generated_at_utc": generated_at_utc.astimezone(timezone.utc).isoformat(),
         "message": message,
         "watchlist": [e.to_dict() for e in entries],
-        "digest": [
-            {
-                "event_id": ev.event_id,
-                "event_type": ev.event_type.value,
-                "title": ev.title,
-                "event_timestamp_utc": ev.event_timestamp_utc.astimezone(timezone.utc).isoformat(),
-                "source_url": ev.source_url,
-                "tickers": ev.tickers,
-                "confidence": ev.confidence.value,
-            }
-            for ev in sorted(digest_events, key=lambda x: x.discovered_timestamp_utc, reverse=True)[:25]
-        ],
+        "digest": digest,
     }
 
     p.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
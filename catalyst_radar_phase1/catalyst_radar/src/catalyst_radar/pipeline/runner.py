@@ -12,20 +12,26 @@ from catalyst_radar.core.time import utc_now
 from catalyst_radar.dedupe.deduplicator import Deduplicator
 from catalyst_radar.dedupe.fingerprint import Fingerprinter
 from catalyst_radar.normalize.normalizer import CanonicalEventNormalizer
-from catalyst_radar.output.writer import write_watchlist
+from catalyst_radar.output.writer import DIGEST_SIZE, recent_digest, write_watchlist
 from catalyst_radar.scoring.base import ScoringEngine
 from catalyst_radar.sources.base import RawEvent
+from catalyst_radar.sources.concurrent_fetch import fetch_all
 from catalyst_radar.sources.stubs.politician_disclosure_stub import PoliticianDisclosureStub
 from catalyst_radar.sources.stubs.federal_award_stub import FederalAwardStub
 from catalyst_radar.sources.stubs.geopolitics_news_stub import GeopoliticsNewsStub
 from catalyst_radar.sources.stubs.energy_resources_stub import EnergyResourcesStub
 from catalyst_radar.sources.stubs.preop_milestone_stub import PreOpMilestoneStub
-from catalyst_radar.storage.local_jsonl_store import LocalJsonlEventStore
+from catalyst_radar.storage.factory import event_store_path, open_event_store
 from catalyst_radar.watchlist.builder import WatchlistBuilder
+from catalyst_radar.watchlist.incremental import IncrementalWatchlist
 
 
 logger = get_logger(__name__)
 
+# Backends other writers append to (Phase 4 writes to Postgres), so no watchlist
+# state can be kept for them: each run ranks the store (`build_from_store`) instead.
+_STATELESS_BACKENDS = ("postgres",)
+
 
 @dataclass
 class PipelineResult:
@@ -43,12 +49,9 @@ class PipelineRunner:
 
     def run(self, *, since_utc: Optional[datetime] = None) -> PipelineResult:
         now = utc_now()
-        store = LocalJsonlEventStore(self.settings.ledger_path)
-        deduper = Deduplicator(store)
         fingerprinter = Fingerprinter()
         normalizer = CanonicalEventNormalizer(fingerprinter=fingerprinter)
         scorer = ScoringEngine()
-        watchlist_builder = WatchlistBuilder()
 
         sources = [
             PoliticianDisclosureStub(self.fixtures_path),
@@ -59,24 +62,57 @@ class PipelineRunner:
         ]
 
         raw_events: List[RawEvent] = []
-        for s in sources:
-            fetched = s.fetch(since_utc=since_utc)
-            logger.info("source=%s fetched=%d", s.name, len(fetched))
-            raw_events.extend(fetched)
+        fetched = fetch_all(
+            sources,
+            since_utc=since_utc,
+            timeout_s=self.settings.source_timeout_s,
+            max_workers=self.settings.source_workers,
+        )
+        for r in fetched:
+            if r.error is None:
+                logger.info("source=%s fetched=%d elapsed=%.2fs", r.source, len(r.events), r.elapsed_s)
+            raw_events.extend(r.events)
+
+        state_path = self.settings.watchlist_state_path
+        store_key = event_store_path(self.settings)
+        keep_state = self.settings.ledger_backend not in _STATELESS_BACKENDS
+        watchlist = None
+        if keep_state:
+            watchlist = IncrementalWatchlist.load(state_path, self.settings, source=store_key)
+        rebuild = keep_state and watchlist is None
 
         events_new = 0
-        for raw in raw_events:
-            ev = normalizer.normalize(raw)
-            ev = scorer.score(ev, now_utc=now)
-            validate_event(ev)
-
-            ev, is_new = deduper.apply(ev)
-            if is_new:
-                store.append(ev)
-                events_new += 1
-
-        all_events = list(store.iter_all())
-        watchlist_entries = watchlist_builder.build(all_events, now_utc=now, settings=self.settings)
+        # One store handle for the run; closing flushes (and fsyncs per CATRADAR_LEDGER_FSYNC).
+        with open_event_store(self.settings) as store:
+            deduper = Deduplicator(store)
+            for raw in raw_events:
+                ev = normalizer.normalize(raw)
+                ev = scorer.score(ev, now_utc=now)
+                validate_event(ev)
+
+                ev, is_new = deduper.apply(ev)
+                if is_new:
+                    if watchlist is not None:
+                        if events_new == 0:
+                            # Until the clean save below, a crash leaves the state unusable (rebuilt next run).
+                            watchlist.save(state_path, dirty=True)
+                        watchlist.add(ev)
+                    store.append(ev)
+                    events_new += 1
+
+            if rebuild:
+                watchlist = IncrementalWatchlist(self.settings, source=store_key)
+                n = watchlist.add_many(store.iter_all())
+                logger.info("watchlist state rebuilt from %d stored events", n)
+            if watchlist is None:
+                watchlist_entries = WatchlistBuilder().build_from_store(store, now_utc=now, settings=self.settings)
+                recent = store.iter_recent(DIGEST_SIZE) if hasattr(store, "iter_recent") else store.iter_all()
+                digest = recent_digest(recent)
+        if watchlist is not None:
+            watchlist.expire(now)
+            watchlist_entries = watchlist.entries(now)
+            digest = watchlist.digest()
+            watchlist.save(state_path)
 
         out_dir = Path(self.settings.out_dir)
         out_dir.mkdir(parents=True, exist_ok=True)
@@ -93,7 +129,7 @@ class PipelineRunner:
             generated_at_utc=now,
             message=msg,
             entries=watchlist_entries,
-            digest_events=all_events,
+            digest=digest,
         )
 
         logger.info(
@@ -107,6 +143,6 @@ class PipelineRunner:
             events_seen=len(raw_events),
             events_new=events_new,
             watchlist_count=len(watchlist_entries),
-            ledger_path=str(self.settings.ledger_path),
+            ledger_path=str(event_store_path(self.settings)),
             watchlist_path=str(watchlist_path),
         )
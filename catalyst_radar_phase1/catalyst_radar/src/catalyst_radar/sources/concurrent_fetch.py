@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+from catalyst_radar.config.logging import get_logger
+from catalyst_radar.sources.base import RawEvent, SourceAdapter
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class FetchResult:
+    source: str
+    events: List[RawEvent] = field(default_factory=list)
+    error: Optional[str] = None  # "timeout after Ns" or the exception text
+    elapsed_s: float = 0.0
+
+
+def fetch_all(
+    sources: Sequence[SourceAdapter],
+    *,
+    since_utc: Optional[datetime] = None,
+    timeout_s: float = 30.0,
+    max_workers: int = 8,
+) -> List[FetchResult]:
+    """Fetch every source concurrently; results are in `sources` order.
+
+    Each source gets `timeout_s` (or its own `timeout_s` attribute) from the
+    moment its fetch starts, so sources queued behind busy workers are not
+    charged for the wait. A source that times out or raises contributes no
+    events and is reported in its FetchResult; the others are unaffected.
+    Timed-out fetches cannot be interrupted: their threads are abandoned, not
+    joined (interpreter exit still waits for them). Sources still queued when
+    every worker is held by an abandoned fetch are reported as not started.
+    """
+    if not sources:
+        return []
+    workers = max(1, min(max_workers, len(sources)))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="source")
+    cond = threading.Condition()
+    starts: List[Optional[float]] = [None] * len(sources)
+
+    def run(i: int, source: SourceAdapter) -> List[RawEvent]:
+        with cond:
+            starts[i] = time.monotonic()
+            cond.notify()
+        return list(source.fetch(since_utc=since_utc))
+
+    def notify(_: Future) -> None:
+        with cond:
+            cond.notify()
+
+    budgets = [float(getattr(s, "timeout_s", None) or timeout_s) for s in sources]
+    results: List[Optional[FetchResult]] = [None] * len(sources)
+    abandoned: List[Future] = []
+    try:
+        futures = [pool.submit(run, i, s) for i, s in enumerate(sources)]
+        for fut in futures:
+            fut.add_done_callback(notify)
+        pending = set(range(len(sources)))
+        with cond:
+            while pending:
+                now = time.monotonic()
+                for i in sorted(pending):
+                    s, fut, started = sources[i], futures[i], starts[i]
+                    if fut.done():
+                        elapsed = now - (started if started is not None else now)
+                        exc = fut.exception()
+                        if exc is None:
+                            results[i] = FetchResult(s.name, fut.result(), elapsed_s=elapsed)
+                        else:
+                            logger.error("source=%s failed: %s", s.name, exc)
+                            results[i] = FetchResult(s.name, error=str(exc), elapsed_s=elapsed)
+                    elif started is not None and now >= started + budgets[i]:
+                        logger.warning("source=%s timed out after %.1fs", s.name, budgets[i])
+                        results[i] = FetchResult(s.name, error=f"timeout after {budgets[i]:g}s", elapsed_s=budgets[i])
+                        abandoned.append(fut)
+                    else:
+                        continue
+                    pending.discard(i)
+                if not pending:
+                    break
+                deadlines = [starts[i] + budgets[i] for i in pending if starts[i] is not None]
+                if not deadlines and sum(not f.done() for f in abandoned) >= workers:
+                    # Nothing running but abandoned fetches: the queued sources can never start.
+                    for i in sorted(pending):
+                        futures[i].cancel()
+                        logger.warning("source=%s not started: all workers hold timed-out fetches", sources[i].name)
+                        results[i] = FetchResult(sources[i].name, error="not started: workers busy with timed-out sources")
+                    break
+                cond.wait(max(0.0, min(deadlines) - now) if deadlines else None)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return [r for r in results if r is not None]
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 from catalyst_radar.core.time import parse_utc
 from catalyst_radar.core.models import SourceType
 from .base import RawEvent
 
 
-def load_fixture_raw_events(path: str | Path) -> List[RawEvent]:
-    p = Path(path)
+# Parsed fixtures shared by every adapter reading the same file:
+# resolved path -> ((st_mtime_ns, st_size), events).
+_CACHE: Dict[str, Tuple[Tuple[int, int], List[RawEvent]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _parse_fixture(p: Path) -> List[RawEvent]:
     data = json.loads(p.read_text(encoding="utf-8"))
     out: List[RawEvent] = []
     for item in data:
@@ -24,3 +30,27 @@ def load_fixture_raw_events(path: str | Path) -> List[RawEvent]:
             )
         )
     return out
+
+
+def load_fixture_raw_events(path: str | Path) -> List[RawEvent]:
+    """RawEvents of a fixture file, parsed once per (path, mtime, size).
+
+    The RawEvents are shared between callers and must not be mutated; the
+    returned list itself is a fresh copy.
+    """
+    p = Path(path).resolve()
+    st = p.stat()
+    version = (st.st_mtime_ns, st.st_size)
+    key = str(p)
+    # Held while parsing, so adapters fetching concurrently parse the file once.
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, _parse_fixture(p))
+            _CACHE[key] = cached
+    return list(cached[1])
+
+
+def clear_fixture_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
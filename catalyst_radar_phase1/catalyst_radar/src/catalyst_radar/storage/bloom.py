@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Iterable
+
+
+_MAGIC = b"CRBF"
+_HEADER = struct.Struct("<4sBBxxQ")  # magic, format version, k, padding, m (bits)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives).
+
+    Positions come from one BLAKE2b digest per key via double hashing
+    (Kirsch-Mitzenmacher), so `k` costs a single hash call.
+    """
+
+    def __init__(self, m_bits: int, k: int) -> None:
+        self.m = max(int(m_bits), 8)
+        self.k = max(int(k), 1)
+        self.bits = bytearray((self.m + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, n: int, fp_rate: float = 0.001) -> "BloomFilter":
+        """Sized for `n` keys at false-positive rate `fp_rate`."""
+        n = max(n, 1)
+        m = math.ceil(-n * math.log(fp_rate) / (math.log(2) ** 2))
+        k = round(m / n * math.log(2))
+        return cls(m, k)
+
+    @classmethod
+    def of(cls, keys: Iterable[str], n: int, fp_rate: float = 0.001) -> "BloomFilter":
+        bf = cls.for_capacity(n, fp_rate)
+        for key in keys:
+            bf.add(key)
+        return bf
+
+    def _positions(self, key: str) -> Iterable[int]:
+        d = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        m = self.m
+        return ((h1 + i * h2) % m for i in range(self.k))
+
+    def add(self, key: str) -> None:
+        bits = self.bits
+        for p in self._positions(key):
+            bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def to_bytes(self) -> bytes:
+        return _HEADER.pack(_MAGIC, 1, self.k, self.m) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        if len(data) < _HEADER.size:
+            raise ValueError("truncated bloom filter file")
+        magic, version, k, m = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != 1:
+            raise ValueError("not a bloom filter file")
+        bf = cls(m, k)
+        body = data[_HEADER.size:]
+        if len(body) != len(bf.bits):
+            raise ValueError("truncated bloom filter file")
+        bf.bits[:] = body
+        return bf
+
+    def save(self, path: Path) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(self.to_bytes())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BloomFilter":
+        return cls.from_bytes(path.read_bytes())
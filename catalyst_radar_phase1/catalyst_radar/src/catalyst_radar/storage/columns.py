@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, List, Optional, Sequence
+
+from catalyst_radar.core.models import Confidence, Event, EventType, SourceType
+from catalyst_radar.core.time import parse_utc
+
+# Small-integer codes of the enum columns; CONFIDENCES is in gate order (LOW < MEDIUM < HIGH).
+EVENT_TYPES: List[EventType] = list(EventType)
+SOURCE_TYPES: List[SourceType] = list(SourceType)
+CONFIDENCES: List[Confidence] = [Confidence.LOW, Confidence.MEDIUM, Confidence.HIGH]
+
+_EVENT_TYPE_CODE = {m.value: i for i, m in enumerate(EVENT_TYPES)}
+_SOURCE_TYPE_CODE = {m.value: i for i, m in enumerate(SOURCE_TYPES)}
+_CONFIDENCE_CODE = {m.value: i for i, m in enumerate(CONFIDENCES)}
+
+# name -> array typecode; one value per row.
+NUMERIC_COLUMNS = {
+    "offset": "q",
+    "length": "q",
+    "event_ts": "d",  # epoch seconds
+    "discovered_ts": "d",
+    "event_type": "b",
+    "source_type": "b",
+    "confidence": "b",
+    "credibility_score": "h",
+    "freshness_score": "h",
+    "materiality_score": "h",
+    "overall_score": "h",
+}
+_VALUE_COLUMNS = list(NUMERIC_COLUMNS)[2:]
+
+
+class EventColumns:
+    """The ledger's scalar fields, scores and ticker lists as parallel columns.
+
+    Row i describes the ledger line at `offset[i]`. Tickers are stored CSR-style:
+    row i's ticker codes are `ticker_codes[ticker_ptr[i]:ticker_ptr[i + 1]]`,
+    decoded through `ticker_names`. Rows are appended in ledger order, so a
+    re-appended event_id leaves a superseded row behind until `select` drops it.
+    """
+
+    def __init__(self) -> None:
+        self.cols: Dict[str, array] = {name: array(code) for name, code in NUMERIC_COLUMNS.items()}
+        self.event_ids: List[str] = []
+        self.source_hashes: List[str] = []
+        self.ticker_ptr = array("q", [0])
+        self.ticker_codes = array("i")
+        self.ticker_names: List[str] = []
+        self._ticker_code: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.event_ids)
+
+    def ticker_code(self, ticker: str) -> int:
+        code = self._ticker_code.get(ticker)
+        if code is None:
+            code = self._ticker_code[ticker] = len(self.ticker_names)
+            self.ticker_names.append(ticker)
+        return code
+
+    def tickers_of(self, row: int) -> List[str]:
+        names = self.ticker_names
+        return [names[c] for c in self.ticker_codes[self.ticker_ptr[row] : self.ticker_ptr[row + 1]]]
+
+    def _append(self, offset: int, length: int, event_id: str, source_hash: str, values: Sequence[Any], tickers: Sequence[str]) -> None:
+        c = self.cols
+        c["offset"].append(offset)
+        c["length"].append(length)
+        for name, value in zip(_VALUE_COLUMNS, values):
+            c[name].append(value)
+        self.event_ids.append(event_id)
+        self.source_hashes.append(source_hash)
+        for t in dict.fromkeys(tickers):
+            self.ticker_codes.append(self.ticker_code(t))
+        self.ticker_ptr.append(len(self.ticker_codes))
+
+    def append_event(self, offset: int, length: int, ev: Event) -> None:
+        values = (
+            ev.event_timestamp_utc.timestamp(),
+            ev.discovered_timestamp_utc.timestamp(),
+            _EVENT_TYPE_CODE[ev.event_type.value],
+            _SOURCE_TYPE_CODE[ev.source_type.value],
+            _CONFIDENCE_CODE[ev.confidence.value],
+            ev.credibility_score,
+            ev.freshness_score,
+            ev.materiality_score,
+            ev.overall_score,
+        )
+        self._append(offset, length, ev.event_id, ev.source_hash, values, ev.tickers)
+
+    def append_dict(self, offset: int, length: int, d: Dict[str, Any]) -> None:
+        """Row of a decoded ledger line (`event_to_dict` output)."""
+        values = (
+            parse_utc(d["event_timestamp_utc"]).timestamp(),
+            parse_utc(d["discovered_timestamp_utc"]).timestamp(),
+            _EVENT_TYPE_CODE[d["event_type"]],
+            _SOURCE_TYPE_CODE[d["source_type"]],
+            _CONFIDENCE_CODE[d["confidence"]],
+            int(d.get("credibility_score", 0)),
+            int(d.get("freshness_score", 0)),
+            int(d.get("materiality_score", 0)),
+            int(d.get("overall_score", 0)),
+        )
+        self._append(offset, length, str(d["event_id"]), str(d["source_hash"]), values, d.get("tickers") or [])
+
+    def select(self, rows: Optional[Sequence[int]]) -> "EventColumns":
+        """Copy holding only `rows` (all rows when None), in that order."""
+        out = EventColumns()
+        if rows is None:
+            rows = range(len(self))
+        for name, col in self.cols.items():
+            out.cols[name] = array(col.typecode, (col[i] for i in rows))
+        out.event_ids = [self.event_ids[i] for i in rows]
+        out.source_hashes = [self.source_hashes[i] for i in rows]
+        out.ticker_names = list(self.ticker_names)
+        out._ticker_code = dict(self._ticker_code)
+        ptr, codes = self.ticker_ptr, self.ticker_codes
+        for i in rows:
+            out.ticker_codes.extend(codes[ptr[i] : ptr[i + 1]])
+            out.ticker_ptr.append(len(out.ticker_codes))
+        return out
+
+    def extend(self, other: "EventColumns", rows: Sequence[int]) -> None:
+        """Append `rows` of `other` (ticker codes are re-mapped into this table)."""
+        for name, col in self.cols.items():
+            src = other.cols[name]
+            col.extend(src[i] for i in rows)
+        self.event_ids.extend(other.event_ids[i] for i in rows)
+        self.source_hashes.extend(other.source_hashes[i] for i in rows)
+        remap = [self.ticker_code(t) for t in other.ticker_names]
+        ptr, codes = other.ticker_ptr, other.ticker_codes
+        for i in rows:
+            self.ticker_codes.extend(remap[c] for c in codes[ptr[i] : ptr[i + 1]])
+            self.ticker_ptr.append(len(self.ticker_codes))
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Union
+from urllib.parse import urlsplit
+
+from catalyst_radar.config.settings import Settings
+from catalyst_radar.storage.postgres_store import PostgresEventStore
+from catalyst_radar.storage.segmented_store import SegmentedJsonlEventStore
+from catalyst_radar.storage.sqlite_store import SqliteEventStore
+
+BACKENDS = ("jsonl", "sqlite", "postgres")
+
+AnyEventStore = Union[SegmentedJsonlEventStore, SqliteEventStore, PostgresEventStore]
+
+
+def open_event_store(settings: Settings) -> AnyEventStore:
+    """The event store selected by `settings.ledger_backend` (close it, or use it as a context manager)."""
+    if settings.ledger_backend == "sqlite":
+        return SqliteEventStore(settings.sqlite_path, fsync=settings.ledger_fsync)
+    if settings.ledger_backend == "postgres":
+        return PostgresEventStore(settings.database_url or "")
+    if settings.ledger_backend != "jsonl":
+        raise ValueError(f"CATRADAR_LEDGER_BACKEND must be one of {BACKENDS}, got {settings.ledger_backend!r}")
+    hours = settings.ledger_segment_max_hours
+    return SegmentedJsonlEventStore(
+        settings.ledger_path,
+        fsync=settings.ledger_fsync,
+        max_segment_bytes=max(settings.ledger_segment_max_mb, 0) << 20,
+        max_segment_age_s=hours * 3600 if hours else None,
+        snapshot_every=settings.ledger_snapshot_every,
+    )
+
+
+def event_store_path(settings: Settings) -> str:
+    """Where the selected backend keeps its data (database URLs without credentials)."""
+    if settings.ledger_backend == "postgres":
+        return _redact(settings.database_url or "")
+    return settings.sqlite_path if settings.ledger_backend == "sqlite" else settings.ledger_path
+
+
+def _redact(dsn: str) -> str:
+    parts = urlsplit(dsn)
+    if not parts.scheme or not parts.hostname:
+        return "postgres"  # key=value DSNs may carry a password anywhere
+    host = parts.hostname + (f":{parts.port}" if parts.port else "")
+    return f"{parts.scheme}://{host}{parts.path}"
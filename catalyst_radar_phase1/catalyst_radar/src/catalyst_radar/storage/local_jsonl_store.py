@@ -1,22 +1,31 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Set
-
-from catalyst_radar.core.models import (
-    Confidence,
-    CorroborationFields,
-    Event,
-    EventType,
-    FederalAwardFields,
-    GeopoliticsFields,
-    NotesFields,
-    PoliticianDisclosureFields,
-    PreOpMilestoneFields,
-    SourceType,
-)
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from catalyst_radar.config.logging import get_logger
+from catalyst_radar.core.codec import event_from_dict
+from catalyst_radar.core.models import Event
 from catalyst_radar.core.time import parse_utc
+from catalyst_radar.storage.columns import EventColumns
+from catalyst_radar.storage.snapshot import SNAPSHOT_SUFFIX, live_rows, read_snapshot, write_snapshot
+from catalyst_radar.storage.ticker_index import Posting, TickerTimeIndex, epoch
+
+
+logger = get_logger(__name__)
+
+# Sidecar index next to the ledger: one JSON array per line,
+# [byte offset, byte length, event_id, source_hash, event timestamp (epoch s), tickers],
+# appended with each event. Older 4-field indexes are rebuilt on open.
+INDEX_SUFFIX = ".idx"
+
+# When appended events are forced to disk: "never" (left to the OS), "batch" (on each
+# flush(): every `batch_size` events, before reads, on close) or "event" (every append).
+FSYNC_POLICIES = ("never", "batch", "event")
 
 
 class LocalJsonlEventStore:
@@ -26,81 +35,336 @@ class LocalJsonlEventStore:
     - append-only persistence
     - simple indices for event_id and source_hash to enable dedupe
 
+    The indices are loaded from a sidecar file (`<ledger>.idx`) rather than by
+    parsing the ledger; events are decoded from a memory map of the ledger only
+    when `get` / `iter_all` reach them. Ledger lines the index does not cover yet
+    (older ledgers, a crash between the two writes) are indexed on open.
+
+    Appends go through one buffered handle per store and reach the file on
+    `flush()` (every `batch_size` events, before reads, on `close()`); use the
+    store as a context manager so the tail is never left in the buffer. The
+    ledger is written before its index entries, so a crash leaves at worst
+    unindexed lines, which the next open indexes.
+
+    A columnar snapshot (`<ledger>.snap`, see storage.snapshot) of the scalar
+    fields, scores and tickers makes reopening cheap: when it is valid, the
+    indices come from it and only ledger lines after it are parsed. It is
+    written by `write_snapshot()` and, with `snapshot_every`, on `close()`
+    once that many events were added since the last one.
+
     Versioning semantics are TBD in Phase 1.
     """
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, *, fsync: str = "batch", batch_size: int = 1000, snapshot_every: int = 0) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        self._fsync = fsync
+        self._batch_size = max(batch_size, 1)
         self._path = Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
         if not self._path.exists():
             self._path.write_text("", encoding="utf-8")
-        self._by_id: Dict[str, Event] = {}
+        self._index_path = self._path.with_name(self._path.name + INDEX_SUFFIX)
+        self._snapshot_path = self._path.with_name(self._path.name + SNAPSHOT_SUFFIX)
+        self._snapshot_every = max(snapshot_every, 0)
+        # Columns of every ledger line, maintained once complete (snapshot loaded or empty ledger).
+        self._cols: Optional[EventColumns] = None
+        self._since_snapshot = 0
+        # event_id -> (offset, length) of its latest ledger line
+        self._offsets: Dict[str, Tuple[int, int]] = {}
         self._hashes: Set[str] = set()
-        self._load_existing()
+        self._by_ticker = TickerTimeIndex()
+        self._fh = None
+        self._mm: Optional[mmap.mmap] = None
+        self._ledger_out = None
+        self._index_out = None
+        self._pending: List[bytes] = []  # index lines of appended, not yet flushed events
+        if not self._load_snapshot():
+            self._load_index()
+            if self._path.stat().st_size == 0:
+                self._cols = EventColumns()
+            # No snapshot yet: count the whole ledger towards the first one.
+            self._since_snapshot = len(self._offsets)
+        self._end = self._path.stat().st_size
+        self._flushed_end = self._end
+
+    def _add(self, offset: int, length: int, event_id: str, source_hash: str, ts: float, tickers: Sequence[str]) -> None:
+        # Arguments in index-entry order.
+        self._offsets[event_id] = (offset, length)
+        self._hashes.add(source_hash)
+        self._by_ticker.add(event_id, ts, tickers)
+
+    def _reset(self) -> None:
+        self._offsets.clear()
+        self._hashes.clear()
+        self._by_ticker = TickerTimeIndex()
 
-    def _load_existing(self) -> None:
-        text = self._path.read_text(encoding="utf-8")
-        if not text.strip():
+    def _load_index(self) -> None:
+        ledger_size = self._path.stat().st_size
+        covered = 0
+        valid_bytes = 0
+        if self._index_path.exists():
+            with self._index_path.open("rb") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn last entry
+                    if len(entry) != 6:
+                        logger.info("ledger index %s predates ticker/time fields; rebuilding", self._index_path)
+                        self._reset()
+                        covered = valid_bytes = 0
+                        break
+                    offset, length = entry[0], entry[1]
+                    if offset + length > ledger_size:
+                        # The ledger is shorter than the index says (replaced or truncated): rebuild.
+                        logger.warning("ledger index %s is ahead of the ledger; rebuilding", self._index_path)
+                        self._reset()
+                        covered = valid_bytes = 0
+                        break
+                    self._add(*entry)
+                    covered = max(covered, offset + length + 1)
+                    valid_bytes += len(line)
+            if valid_bytes < self._index_path.stat().st_size:
+                with self._index_path.open("r+b") as f:
+                    f.truncate(valid_bytes)
+        if covered < ledger_size:
+            self._index_ledger_from(covered)
+
+    def _load_snapshot(self) -> bool:
+        try:
+            snap = read_snapshot(self._snapshot_path)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as exc:
+            logger.warning("ignoring ledger snapshot %s: %s", self._snapshot_path, exc)
+            return False
+        if snap.ledger_end > self._path.stat().st_size:
+            logger.warning("ledger snapshot %s is ahead of the ledger; ignoring it", self._snapshot_path)
+            return False
+        cols = snap.columns
+        off, length, ts = cols.cols["offset"], cols.cols["length"], cols.cols["event_ts"]
+        if len(cols) and not self._line_is(off[-1], length[-1], cols.event_ids[-1]):
+            logger.warning("ledger snapshot %s does not match the ledger; ignoring it", self._snapshot_path)
+            return False
+        # Snapshot rows are one per event_id (live rows only), so the indices are bulk-built.
+        self._offsets = dict(zip(cols.event_ids, zip(off, length)))
+        self._hashes = set(cols.source_hashes)
+        self._by_ticker = TickerTimeIndex.from_columns(cols.event_ids, ts, cols.ticker_ptr, cols.ticker_codes, cols.ticker_names)
+        # Replay the JSONL tail written after the snapshot.
+        tail = self._scan_ledger(snap.ledger_end)
+        for entry, obj in tail:
+            self._add(*entry)
+            cols.append_dict(entry[0], entry[1], obj)
+        self._cols = cols
+        self._since_snapshot = len(tail)
+        self._sync_index(snap.index_end, [entry for entry, _ in tail])
+        return True
+
+    def _line_is(self, offset: int, length: int, event_id: str) -> bool:
+        # Ledger lines start with the event_id key (event_to_dict order).
+        prefix = json.dumps({"event_id": event_id}, ensure_ascii=False)[:-1].encode("utf-8")
+        with self._path.open("rb") as f:
+            f.seek(offset)
+            return f.read(min(length, len(prefix))) == prefix
+
+    def _sync_index(self, index_end: int, tail: List[list]) -> None:
+        # The index past the snapshot should hold exactly the replayed tail; if not, rewrite it.
+        try:
+            with self._index_path.open("rb") as f:
+                f.seek(index_end)
+                found = [json.loads(line)[0] for line in f]
+            if self._index_path.stat().st_size >= index_end and found == [e[0] for e in tail]:
+                return
+        except (OSError, ValueError, IndexError, TypeError):
+            pass
+        logger.info("ledger index %s is out of step with the snapshot; rewriting it", self._index_path)
+        cols = self._cols
+        off, length, ts = cols.cols["offset"], cols.cols["length"], cols.cols["event_ts"]
+        tmp = self._index_path.with_name(self._index_path.name + ".tmp")
+        with tmp.open("wb") as f:
+            for i, event_id in enumerate(cols.event_ids):
+                entry = [off[i], length[i], event_id, cols.source_hashes[i], ts[i], cols.tickers_of(i)]
+                f.write(encode_index_entry(entry))
+        os.replace(tmp, self._index_path)
+
+    def _scan_ledger(self, start: int) -> List[Tuple[list, dict]]:
+        """(index entry, decoded line) of the ledger lines from byte `start` on."""
+        out: List[Tuple[list, dict]] = []
+        torn_tail = False
+        with self._path.open("rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                length = len(line.rstrip(b"\r\n"))
+                if not line.endswith(b"\n"):
+                    torn_tail = True
+                elif length and line.strip():
+                    try:
+                        obj = json.loads(line)
+                        out.append((index_entry_for_line(offset, length, obj), obj))
+                    except (ValueError, KeyError, TypeError):
+                        logger.warning("skipping unreadable ledger line at byte %d of %s", offset, self._path)
+                offset += len(line)
+        if torn_tail:
+            # Terminate a partially written last line so the next append starts on a fresh line.
+            with self._path.open("ab") as f:
+                f.write(b"\n")
+        return out
+
+    def _index_ledger_from(self, start: int) -> None:
+        entries = [entry for entry, _ in self._scan_ledger(start)]
+        for entry in entries:
+            self._add(*entry)
+        if entries:
+            with self._index_path.open("ab") as f:
+                f.write(b"".join(encode_index_entry(e) for e in entries))
+
+    def _read(self, offset: int, length: int) -> bytes:
+        end = offset + length
+        if end > self._flushed_end:
+            self.flush()
+        if self._mm is None or end > len(self._mm):
+            # (Re)map: the ledger has grown since the last mapping.
+            self._close_map()
+            self._fh = self._path.open("rb")
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mm[offset:end]
+
+    def _close_map(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def flush(self) -> None:
+        """Write buffered appends to the ledger, then their index entries."""
+        if self._ledger_out is None or not self._pending:
             return
-        for line in text.splitlines():
-            if not line.strip():
-                continue
-            obj = json.loads(line)
-            ev = _event_from_dict(obj)
-            self._by_id[ev.event_id] = ev
-            self._hashes.add(ev.source_hash)
+        self._ledger_out.flush()
+        if self._fsync != "never":
+            os.fsync(self._ledger_out.fileno())
+        # The index is rebuildable from the ledger, so it is not fsynced.
+        self._index_out.write(b"".join(self._pending))
+        self._index_out.flush()
+        self._pending.clear()
+        self._flushed_end = self._end
+
+    def close(self) -> None:
+        self.flush()
+        if self._snapshot_every and self._since_snapshot >= self._snapshot_every:
+            self.write_snapshot()
+        for f in (self._ledger_out, self._index_out):
+            if f is not None:
+                f.close()
+        self._ledger_out = self._index_out = None
+        self._close_map()
+
+    def __enter__(self) -> "LocalJsonlEventStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def has_source_hash(self, source_hash: str) -> bool:
         return source_hash in self._hashes
 
+    @property
+    def size_bytes(self) -> int:
+        """Ledger size including buffered appends."""
+        return self._end
+
+    def event_ids(self) -> Iterable[str]:
+        return self._offsets.keys()
+
+    def source_hashes(self) -> Iterable[str]:
+        return self._hashes
+
+    def has_event(self, event_id: str) -> bool:
+        return event_id in self._offsets
+
+    def tickers(self) -> Iterable[str]:
+        return self._by_ticker.tickers()
+
+    def time_span(self) -> Optional[Tuple[float, float]]:
+        """(earliest, latest) event timestamp in the ledger, as epoch seconds."""
+        return self._by_ticker.span()
+
+    def ticker_postings(self, ticker: str, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[Posting]:
+        """(epoch seconds, event_id) of `ticker`'s events in [start, end), oldest first; nothing is decoded."""
+        return self._by_ticker.range(ticker, epoch(start), epoch(end))
+
+    def iter_ticker_range(self, ticker: str, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[Event]:
+        """One ticker's events with start <= event_timestamp_utc < end, oldest first, via the ticker/time index."""
+        postings = self.ticker_postings(ticker, start, end)
+        return self._iter_events([self._offsets[event_id] for _, event_id in postings])
+
+    def raw_lines(self) -> Iterator[Tuple[str, bytes]]:
+        """(event_id, encoded ledger line) of the latest line per event_id, in ledger order."""
+        self.flush()
+        for event_id, (offset, length) in list(self._offsets.items()):
+            yield event_id, self._read(offset, length)
+
+    def columns(self) -> EventColumns:
+        """Columns of the latest line per event_id, in `iter_all` order (decodes the ledger once if no snapshot was loaded)."""
+        self.flush()
+        if self._cols is None:
+            cols = EventColumns()
+            for (offset, length, *_), obj in self._scan_ledger(0):
+                cols.append_dict(offset, length, obj)
+            self._cols = cols
+        rows, superseded = live_rows(self._cols, self._offsets)
+        if superseded:
+            self._cols = self._cols.select(rows)
+        return self._cols
+
+    def write_snapshot(self) -> int:
+        """Snapshot the ledger as it is now; returns the number of events in it."""
+        cols = self.columns()
+        index_end = self._index_path.stat().st_size if self._index_path.exists() else 0
+        write_snapshot(self._snapshot_path, cols, ledger_end=self._end, index_end=index_end)
+        self._since_snapshot = 0
+        return len(cols)
+
     def append(self, event: Event) -> None:
-        with self._path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(event.to_dict(), ensure_ascii=False) + "\n")
-        self._by_id[event.event_id] = event
-        self._hashes.add(event.source_hash)
+        if self._ledger_out is None:
+            self._ledger_out = self._path.open("ab", buffering=1 << 16)
+            self._index_out = self._index_path.open("ab", buffering=1 << 16)
+        line = json.dumps(event.to_dict(), ensure_ascii=False).encode("utf-8")
+        offset = self._end
+        self._ledger_out.write(line + b"\n")
+        self._end += len(line) + 1
+        entry = [offset, len(line), event.event_id, event.source_hash, event.event_timestamp_utc.timestamp(), list(event.tickers)]
+        self._pending.append(encode_index_entry(entry))
+        self._add(*entry)
+        if self._cols is not None:
+            self._cols.append_event(offset, len(line), event)
+        self._since_snapshot += 1
+        if self._fsync == "event" or len(self._pending) >= self._batch_size:
+            self.flush()
 
     def get(self, event_id: str) -> Optional[Event]:
-        return self._by_id.get(event_id)
+        loc = self._offsets.get(event_id)
+        if loc is None:
+            return None
+        return event_from_dict(json.loads(self._read(*loc)))
 
     def iter_all(self) -> Iterable[Event]:
-        return list(self._by_id.values())
-
-
-def _maybe_dc(value, cls):
-    if value is None:
-        return None
-    if isinstance(value, cls):
-        return value
-    if isinstance(value, dict):
-        return cls(**value)
-    return None
-
-
-def _event_from_dict(d: dict) -> Event:
-    return Event(
-        event_id=str(d["event_id"]),
-        event_type=EventType(d["event_type"]),
-        title=str(d["title"]),
-        summary=str(d["summary"]),
-        event_timestamp_utc=parse_utc(d["event_timestamp_utc"]),
-        discovered_timestamp_utc=parse_utc(d["discovered_timestamp_utc"]),
-        source_type=SourceType(d["source_type"]),
-        source_name=str(d["source_name"]),
-        source_url=str(d["source_url"]),
-        source_hash=str(d["source_hash"]),
-        entities=list(d.get("entities") or []),
-        tickers=list(d.get("tickers") or []),
-        theme_tags=list(d.get("theme_tags") or []),
-        confidence=Confidence(d.get("confidence")),
-        confidence_rationale=str(d.get("confidence_rationale") or "TBD"),
-        credibility_score=int(d.get("credibility_score", 0)),
-        freshness_score=int(d.get("freshness_score", 0)),
-        materiality_score=int(d.get("materiality_score", 0)),
-        overall_score=int(d.get("overall_score", 0)),
-        politician_disclosure=_maybe_dc(d.get("politician_disclosure"), PoliticianDisclosureFields),
-        federal_award=_maybe_dc(d.get("federal_award"), FederalAwardFields),
-        geopolitics=_maybe_dc(d.get("geopolitics"), GeopoliticsFields),
-        preop_milestone=_maybe_dc(d.get("preop_milestone"), PreOpMilestoneFields),
-        corroboration=_maybe_dc(d.get("corroboration"), CorroborationFields),
-        notes=_maybe_dc(d.get("notes"), NotesFields),
-    )
+        self.flush()
+        return self._iter_events(list(self._offsets.values()))
+
+    def _iter_events(self, locs: List[Tuple[int, int]]) -> Iterator[Event]:
+        for offset, length in locs:
+            yield event_from_dict(json.loads(self._read(offset, length)))
+
+
+def index_entry_for_line(offset: int, length: int, obj: dict) -> list:
+    """Index entry of a decoded ledger line."""
+    ts = parse_utc(obj["event_timestamp_utc"]).timestamp()
+    return [offset, length, str(obj["event_id"]), str(obj["source_hash"]), ts, list(obj.get("tickers") or [])]
+
+
+def encode_index_entry(entry: list) -> bytes:
+    return json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n"
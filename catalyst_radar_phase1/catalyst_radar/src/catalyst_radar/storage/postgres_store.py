@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+from catalyst_radar.config.logging import get_logger
+from catalyst_radar.core.codec import event_from_dict
+from catalyst_radar.core.models import Confidence, Event, EventType, SourceType
+
+# Optional dependency: prefer psycopg (v3), fall back to psycopg2.
+try:
+    import psycopg  # type: ignore
+
+    _driver: Optional[str] = "psycopg"
+except Exception:
+    try:
+        import psycopg2  # type: ignore
+
+        _driver = "psycopg2"
+    except Exception:
+        _driver = None
+
+
+logger = get_logger(__name__)
+
+# Phase 1 event_ids are free-form strings; Phase 2 keys are UUIDs derived from them.
+EVENT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "catalyst_radar/phase1/event_id")
+
+# event_ticker_links needs a mapping confidence; Phase 1 ticker resolution does not produce one (TBD).
+LINK_MAP_CONFIDENCE = 50
+LINK_MAP_METHOD = "PHASE1_TICKER_RESOLVER"
+
+# Key in events.details_json holding the full Phase 1 Event, so it round-trips exactly.
+PHASE1_KEY = "phase1_event"
+
+_NULL = "\\N"
+
+_STAGE_COLUMNS = (
+    "event_id",
+    "event_fingerprint",
+    "event_type",
+    "title",
+    "summary",
+    "event_timestamp_utc",
+    "discovered_at_utc",
+    "source_type",
+    "source_name",
+    "source_url",
+    "corroborating_sources",
+    "theme_tags",
+    "confidence",
+    "credibility_score",
+    "freshness_score",
+    "materiality_score",
+    "overall_score",
+    "details_json",
+    "ambiguity_notes",
+    "tickers",
+)
+
+SQL_STAGE = """
+CREATE TEMP TABLE IF NOT EXISTS phase1_events_in (
+  event_id uuid, event_fingerprint bytea, event_type text, title text, summary text,
+  event_timestamp_utc timestamptz, discovered_at_utc timestamptz, source_type text,
+  source_name text, source_url text, corroborating_sources jsonb, theme_tags jsonb,
+  confidence text, credibility_score smallint, freshness_score smallint,
+  materiality_score smallint, overall_score smallint, details_json jsonb,
+  ambiguity_notes text, tickers jsonb
+) ON COMMIT DELETE ROWS
+"""
+
+SQL_COPY = f"COPY phase1_events_in ({', '.join(_STAGE_COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '{_NULL}')"
+
+# source_hash doubles as event_fingerprint (both are the Phase 1 fingerprint), so
+# ux_events_event_fingerprint dedupes. A row whose event_id already exists under
+# another fingerprint is skipped: one INSERT can only arbitrate one unique constraint.
+SQL_MERGE = """
+WITH ins AS (
+  INSERT INTO events (
+    event_id, event_type, title, summary, event_timestamp_utc, discovered_at_utc,
+    source_type, source_name, source_url, source_hash, corroborating_sources, theme_tags,
+    confidence, credibility_score, freshness_score, materiality_score, overall_score,
+    details_json, ambiguity_notes, event_fingerprint
+  )
+  SELECT DISTINCT ON (i.event_fingerprint)
+    i.event_id, i.event_type, i.title, i.summary, i.event_timestamp_utc, i.discovered_at_utc,
+    i.source_type, i.source_name, i.source_url, i.event_fingerprint, i.corroborating_sources,
+    ARRAY(SELECT jsonb_array_elements_text(i.theme_tags)),
+    i.confidence, i.credibility_score, i.freshness_score, i.materiality_score, i.overall_score,
+    i.details_json, i.ambiguity_notes, i.event_fingerprint
+  FROM phase1_events_in i
+  WHERE NOT EXISTS (
+    SELECT 1 FROM events e WHERE e.event_id = i.event_id AND e.event_fingerprint <> i.event_fingerprint
+  )
+  ORDER BY i.event_fingerprint
+  ON CONFLICT (event_fingerprint) DO UPDATE SET
+    title = EXCLUDED.title,
+    summary = EXCLUDED.summary,
+    theme_tags = EXCLUDED.theme_tags,
+    confidence = EXCLUDED.confidence,
+    credibility_score = EXCLUDED.credibility_score,
+    freshness_score = EXCLUDED.freshness_score,
+    materiality_score = EXCLUDED.materiality_score,
+    overall_score = EXCLUDED.overall_score,
+    details_json = EXCLUDED.details_json,
+    ambiguity_notes = EXCLUDED.ambiguity_notes
+  RETURNING event_id
+)
+SELECT count(*) FROM ins
+"""
+
+SQL_LINK = """
+INSERT INTO event_ticker_links (event_id, ticker_id, link_role, map_confidence, map_method)
+SELECT e.event_id, t.ticker_id, 'PRIMARY', %s, %s
+FROM phase1_events_in i
+JOIN events e ON e.event_fingerprint = i.event_fingerprint
+CROSS JOIN LATERAL jsonb_array_elements_text(i.tickers) AS s(symbol)
+JOIN tickers t ON t.symbol_normalized = upper(s.symbol) AND t.is_active
+ON CONFLICT (event_id, ticker_id) DO NOTHING
+"""
+
+# Rows written by Phase 4 have no PHASE1_KEY; they are mapped from the columns.
+SQL_SELECT = """
+SELECT e.event_id, e.event_type, e.title, e.summary, e.event_timestamp_utc, e.discovered_at_utc,
+       e.source_type, e.source_name, e.source_url, e.source_hash, e.theme_tags, e.confidence,
+       e.credibility_score, e.freshness_score, e.materiality_score, e.overall_score,
+       e.details_json, tk.symbols
+FROM events e
+LEFT JOIN LATERAL (
+  SELECT array_agg(t.symbol ORDER BY l.map_confidence DESC, t.symbol) AS symbols
+  FROM event_ticker_links l JOIN tickers t ON t.ticker_id = l.ticker_id
+  WHERE l.event_id = e.event_id
+) tk ON TRUE
+"""
+
+
+def pg_event_id(event_id: str) -> uuid.UUID:
+    """Phase 2 UUID of a Phase 1 event_id (UUID strings are used as-is)."""
+    try:
+        return uuid.UUID(event_id)
+    except ValueError:
+        return uuid.uuid5(EVENT_ID_NAMESPACE, event_id)
+
+
+def source_digest(source_hash: str) -> bytes:
+    """32-byte form of a Phase 1 source_hash (SHA-256 hex; anything else is hashed)."""
+    s = source_hash.strip().lower()
+    if len(s) == 64:
+        try:
+            return bytes.fromhex(s)
+        except ValueError:
+            pass
+    return hashlib.sha256(source_hash.encode("utf-8")).digest()
+
+
+def _score(value: int) -> int:
+    return max(0, min(100, int(value)))
+
+
+def _json(value: Any) -> str:
+    return _NULL if value is None else json.dumps(value, ensure_ascii=False)
+
+
+def _stage_row(ev: Event) -> List[str]:
+    d = ev.to_dict()
+    corroboration = (d.get("corroboration") or {}).get("corroborating_sources")
+    notes = (d.get("notes") or {}).get("ambiguity_notes")
+    return [
+        str(pg_event_id(ev.event_id)),
+        "\\x" + source_digest(ev.source_hash).hex(),
+        ev.event_type.value,
+        ev.title,
+        ev.summary,
+        d["event_timestamp_utc"],
+        d["discovered_timestamp_utc"],
+        ev.source_type.value,
+        ev.source_name,
+        ev.source_url,
+        _json(corroboration),
+        _json(list(ev.theme_tags)),
+        ev.confidence.value,
+        str(_score(ev.credibility_score)),
+        str(_score(ev.freshness_score)),
+        str(_score(ev.materiality_score)),
+        str(_score(ev.overall_score)),
+        _json({PHASE1_KEY: d, "entities": [{"name": n} for n in ev.entities]}),
+        _NULL if notes is None else notes,
+        _json(list(ev.tickers)),
+    ]
+
+
+def copy_payload(events: Sequence[Event]) -> str:
+    """CSV body for SQL_COPY."""
+    buf = io.StringIO()
+    w = csv.writer(buf, lineterminator="\n")
+    for ev in events:
+        w.writerow(_stage_row(ev))
+    return buf.getvalue()
+
+
+def _enum(cls: Any, value: Any, default: Any) -> Any:
+    try:
+        return cls(value)
+    except ValueError:
+        return default
+
+
+def event_from_row(row: Sequence[Any]) -> Event:
+    """Event from an SQL_SELECT row: the stored Phase 1 Event, else mapped from the Phase 2 columns."""
+    (event_id, event_type, title, summary, event_ts, discovered_ts, source_type, source_name, source_url,
+     source_hash, theme_tags, confidence, credibility, freshness, materiality, overall, details, symbols) = row
+    details = details or {}
+    if isinstance(details, str):
+        details = json.loads(details)
+    if PHASE1_KEY in details:
+        return event_from_dict(details[PHASE1_KEY])
+
+    entities = [e.get("name") for e in details.get("entities") or [] if isinstance(e, dict) and e.get("name")]
+    return Event(
+        event_id=str(event_id),
+        event_type=_enum(EventType, event_type, EventType.OTHER_PUBLIC_CATALYST),
+        title=title,
+        summary=summary,
+        event_timestamp_utc=event_ts.astimezone(timezone.utc),
+        discovered_timestamp_utc=discovered_ts.astimezone(timezone.utc),
+        # Phase 4 source_type is the connector family (sec, congress, ...), not a Phase 1 SourceType.
+        source_type=_enum(SourceType, (source_type or "").upper(), SourceType.OTHER_PUBLIC),
+        source_name=source_name,
+        source_url=source_url,
+        source_hash=bytes(source_hash).hex(),
+        entities=entities,
+        tickers=list(symbols or []),
+        theme_tags=list(theme_tags or []),
+        confidence=_enum(Confidence, confidence, Confidence.LOW),
+        confidence_rationale="Phase 2 events row",
+        credibility_score=credibility,
+        freshness_score=freshness,
+        materiality_score=materiality,
+        overall_score=overall,
+    )
+
+
+class PostgresEventStore:
+    """Event Ledger on the Phase 2 `events` / `event_ticker_links` tables.
+
+    Appends are buffered and written on `flush()` (every `batch_size` events and on
+    `close()`) with one COPY into a temp staging table and one INSERT ... SELECT,
+    deduped on `event_fingerprint` (the Phase 1 source_hash). Tickers are linked
+    to existing `tickers` rows by normalized symbol; unknown symbols stay only in
+    the stored Event. `iter_all` / `iter_range` / `iter_recent` stream through a server-side cursor
+    and also return events written by Phase 4 (suppressed versions excluded).
+    """
+
+    def __init__(self, dsn: str, *, batch_size: int = 5000, itersize: int = 2000) -> None:
+        if _driver is None:
+            raise ImportError("The postgres event store needs psycopg[binary] or psycopg2-binary.")
+        if not dsn:
+            raise ValueError("The postgres event store needs a DSN (CATRADAR_DATABASE_URL or DATABASE_URL).")
+        self._dsn = dsn
+        self._batch_size = max(batch_size, 1)
+        self._itersize = max(itersize, 1)
+        self._pending: List[Event] = []
+        self._pending_hashes: set = set()
+        self._cursors = 0
+        if _driver == "psycopg":
+            self._conn = psycopg.connect(dsn)
+        else:
+            self._conn = psycopg2.connect(dsn)
+
+    def _fetchone(self, sql: str, params: tuple) -> Optional[tuple]:
+        with self._conn.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.fetchone()
+
+    def has_source_hash(self, source_hash: str) -> bool:
+        if source_hash in self._pending_hashes:
+            return True
+        row = self._fetchone("SELECT 1 FROM events WHERE event_fingerprint = %s", (source_digest(source_hash),))
+        return row is not None
+
+    def get(self, event_id: str) -> Optional[Event]:
+        for ev in reversed(self._pending):
+            if ev.event_id == event_id:
+                return ev
+        row = self._fetchone(SQL_SELECT + " WHERE e.event_id = %s", (str(pg_event_id(event_id)),))
+        return event_from_row(row) if row else None
+
+    def append(self, event: Event) -> None:
+        self._pending.append(event)
+        self._pending_hashes.add(event.source_hash)
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+    def append_many(self, events: Sequence[Event]) -> int:
+        for ev in events:
+            self.append(ev)
+        return len(events)
+
+    def flush(self) -> int:
+        """Write buffered events in one transaction; returns rows inserted or updated."""
+        if not self._pending:
+            return 0
+        payload = copy_payload(self._pending)
+        with self._conn.cursor() as cur:
+            cur.execute(SQL_STAGE)
+            if _driver == "psycopg":
+                with cur.copy(SQL_COPY) as cp:
+                    cp.write(payload)
+            else:
+                cur.copy_expert(SQL_COPY, io.StringIO(payload))
+            cur.execute(SQL_MERGE)
+            written = cur.fetchone()[0]
+            cur.execute(SQL_LINK, (LINK_MAP_CONFIDENCE, LINK_MAP_METHOD))
+        self._conn.commit()
+        if written < len(self._pending):
+            logger.info("postgres store: %d of %d events written (rest deduped)", written, len(self._pending))
+        self._pending.clear()
+        self._pending_hashes.clear()
+        return written
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+    def __enter__(self) -> "PostgresEventStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _stream(self, sql: str, params: tuple = ()) -> Iterator[Event]:
+        self.flush()
+        self._cursors += 1
+        with self._conn.cursor(name=f"phase1_events_{self._cursors}") as cur:
+            cur.itersize = self._itersize
+            cur.execute(sql, params)
+            for row in cur:
+                yield event_from_row(row)
+        self._conn.commit()
+
+    def iter_all(self) -> Iterable[Event]:
+        return self._stream(SQL_SELECT + " WHERE NOT e.is_suppressed ORDER BY e.event_timestamp_utc, e.event_id")
+
+    def iter_recent(self, n: int) -> Iterator[Event]:
+        """The `n` most recently discovered non-suppressed events, newest first; ties in `iter_all` order."""
+        sql = SQL_SELECT + " WHERE NOT e.is_suppressed ORDER BY e.discovered_at_utc DESC, e.event_timestamp_utc, e.event_id LIMIT %s"
+        return self._stream(sql, (n,))
+
+    def tickers(self) -> List[str]:
+        sql = "SELECT DISTINCT t.symbol FROM event_ticker_links l JOIN tickers t ON t.ticker_id = l.ticker_id"
+        with self._conn.cursor() as cur:
+            cur.execute(sql)
+            return [r[0] for r in cur.fetchall()]
+
+    def iter_range(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[Event]:
+        """Non-suppressed events with start <= event_timestamp_utc < end, oldest first (ix_events_not_suppressed)."""
+        return self._stream_window([], [], start, end)
+
+    def iter_ticker_range(self, ticker: str, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[Event]:
+        """One ticker's non-suppressed events in [start, end), oldest first, via event_ticker_links."""
+        where = [
+            "e.event_id IN (SELECT l.event_id FROM event_ticker_links l JOIN tickers t ON t.ticker_id = l.ticker_id"
+            " WHERE t.symbol_normalized = upper(%s))"
+        ]
+        return self._stream_window(where, [ticker], start, end)
+
+    def _stream_window(self, where: List[str], params: List[Any], start: Optional[datetime], end: Optional[datetime]) -> Iterator[Event]:
+        where = ["NOT e.is_suppressed"] + where
+        if start is not None:
+            where.append("e.event_timestamp_utc >= %s")
+            params.append(start)
+        if end is not None:
+            where.append("e.event_timestamp_utc < %s")
+            params.append(end)
+        return self._stream(SQL_SELECT + " WHERE " + " AND ".join(where) + " ORDER BY e.event_timestamp_utc, e.event_id", tuple(params))
@@ -0,0 +1,431 @@
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+from catalyst_radar.config.logging import get_logger
+from catalyst_radar.core.models import Event
+from catalyst_radar.storage.bloom import BloomFilter
+from catalyst_radar.storage.columns import EventColumns
+from catalyst_radar.storage.local_jsonl_store import (
+    INDEX_SUFFIX,
+    LocalJsonlEventStore,
+    encode_index_entry,
+    index_entry_for_line,
+)
+from catalyst_radar.storage.snapshot import SNAPSHOT_SUFFIX
+from catalyst_radar.storage.ticker_index import epoch
+
+
+logger = get_logger(__name__)
+
+BLOOM_SUFFIX = ".bloom"
+# Sidecar of the active segment: {"created_epoch": ...}, for time-based rotation.
+SEGMENT_META_SUFFIX = ".seg"
+# Sidecar of a sealed segment: {"span": [earliest, latest] event timestamp (epoch s), "tickers": [...]},
+# so ticker/time range queries skip segments that cannot match.
+SPAN_SUFFIX = ".span"
+
+
+@dataclass
+class CompactionStats:
+    segments_before: int
+    segments_after: int
+    lines_before: int
+    lines_after: int
+
+
+@dataclass
+class _Sealed:
+    number: int
+    path: Path
+    bloom: BloomFilter
+    span: Optional[Tuple[float, float]] = None
+    tickers: FrozenSet[str] = field(default_factory=frozenset)
+
+    @property
+    def bloom_path(self) -> Path:
+        return _sidecar(self.path, BLOOM_SUFFIX)
+
+    def may_hold(self, ticker: str, start: Optional[float], end: Optional[float]) -> bool:
+        if ticker not in self.tickers or self.span is None:
+            return False
+        lo, hi = self.span
+        return (start is None or hi >= start) and (end is None or lo < end)
+
+
+def _sidecar(path: Path, suffix: str) -> Path:
+    return path.with_name(path.name + suffix)
+
+
+def _id_key(event_id: str) -> str:
+    return "i:" + event_id
+
+
+def _hash_key(source_hash: str) -> str:
+    return "h:" + source_hash
+
+
+class SegmentedJsonlEventStore:
+    """Event Ledger split into JSONL segments.
+
+    `path` (e.g. `out/event_ledger.jsonl`) is the active segment, a
+    LocalJsonlEventStore. When it reaches `max_segment_bytes` or `max_segment_age_s`
+    it is sealed: renamed to `event_ledger.000001.jsonl` (with its index) and given a
+    Bloom filter over its event_ids and source_hashes (`.bloom`).
+
+    Dedupe checks (`has_source_hash`, `get`) consult the active segment's indices,
+    then the sealed segments' Bloom filters; only a filter hit opens that segment's
+    index (at most `open_segments` are kept open). Memory therefore holds the active
+    segment plus ~2 bytes per sealed event. `compact()` merges the sealed segments
+    and drops lines superseded by a later line with the same event_id.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        fsync: str = "batch",
+        batch_size: int = 1000,
+        max_segment_bytes: int = 64 << 20,
+        max_segment_age_s: Optional[float] = None,
+        bloom_fp_rate: float = 0.001,
+        open_segments: int = 2,
+        snapshot_every: int = 0,
+    ) -> None:
+        self._path = Path(path)
+        self._fsync = fsync
+        self._batch_size = batch_size
+        self._max_bytes = max_segment_bytes
+        self._max_age_s = max_segment_age_s
+        self._fp_rate = bloom_fp_rate
+        self._open_limit = max(open_segments, 1)
+        self._snapshot_every = snapshot_every
+        self._open: "OrderedDict[int, LocalJsonlEventStore]" = OrderedDict()
+
+        self._active = self._open_active()
+        self._meta_path = _sidecar(self._path, SEGMENT_META_SUFFIX)
+        self._created = self._load_created()
+        self._sealed: List[_Sealed] = [self._load_sealed(n, p) for n, p in self._sealed_paths()]
+        self._maybe_rotate()
+
+    # --- segments -------------------------------------------------------
+
+    def _open_active(self) -> LocalJsonlEventStore:
+        return LocalJsonlEventStore(
+            str(self._path), fsync=self._fsync, batch_size=self._batch_size, snapshot_every=self._snapshot_every
+        )
+
+    def _sealed_paths(self) -> List[tuple]:
+        stem, suffix = self._path.stem, self._path.suffix
+        pattern = re.compile(re.escape(stem) + r"\.(\d+)" + re.escape(suffix) + "$")
+        found = []
+        for p in self._path.parent.glob(f"{stem}.*{suffix}"):
+            m = pattern.match(p.name)
+            if m:
+                found.append((int(m.group(1)), p))
+        return sorted(found)
+
+    def _segment_path(self, number: int) -> Path:
+        return self._path.with_name(f"{self._path.stem}.{number:06d}{self._path.suffix}")
+
+    def _bloom_for(self, store: LocalJsonlEventStore) -> BloomFilter:
+        ids, hashes = store.event_ids(), store.source_hashes()
+        bf = BloomFilter.for_capacity(len(ids) + len(hashes), self._fp_rate)
+        for event_id in ids:
+            bf.add(_id_key(event_id))
+        for source_hash in hashes:
+            bf.add(_hash_key(source_hash))
+        return bf
+
+    def _load_sealed(self, number: int, path: Path) -> _Sealed:
+        bloom_path = _sidecar(path, BLOOM_SUFFIX)
+        try:
+            bloom = BloomFilter.load(bloom_path)
+        except (OSError, ValueError):
+            # Missing or unreadable (e.g. interrupted compaction): rebuild from the segment's index.
+            with LocalJsonlEventStore(str(path)) as store:
+                bloom = self._bloom_for(store)
+            bloom.save(bloom_path)
+        seg = _Sealed(number, path, bloom)
+        try:
+            meta = json.loads(_sidecar(path, SPAN_SUFFIX).read_text(encoding="utf-8"))
+            seg.span = tuple(meta["span"]) if meta["span"] else None
+            seg.tickers = frozenset(meta["tickers"])
+        except (OSError, ValueError, KeyError, TypeError):
+            with LocalJsonlEventStore(str(path)) as store:
+                _save_span(seg, store)
+        return seg
+
+    def _segment(self, seg: _Sealed) -> LocalJsonlEventStore:
+        store = self._open.pop(seg.number, None)
+        if store is None:
+            store = LocalJsonlEventStore(str(seg.path))
+            while len(self._open) >= self._open_limit:
+                _, evicted = self._open.popitem(last=False)
+                evicted.close()
+        self._open[seg.number] = store
+        return store
+
+    def _close_open_segments(self) -> None:
+        while self._open:
+            _, store = self._open.popitem()
+            store.close()
+
+    def _load_created(self) -> float:
+        try:
+            return float(json.loads(self._meta_path.read_text(encoding="utf-8"))["created_epoch"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return self._reset_created()
+
+    def _reset_created(self) -> float:
+        created = time.time()
+        self._meta_path.write_text(json.dumps({"created_epoch": created}), encoding="utf-8")
+        return created
+
+    def _maybe_rotate(self) -> None:
+        if self._active.size_bytes == 0:
+            return
+        if self._max_bytes and self._active.size_bytes >= self._max_bytes:
+            self.rotate()
+        elif self._max_age_s and time.time() - self._created >= self._max_age_s:
+            self.rotate()
+
+    def rotate(self) -> None:
+        """Seal the active segment and start a new one (no-op when it is empty)."""
+        if self._active.size_bytes == 0:
+            return
+        # Sealed segments never change, so each gets its final snapshot now.
+        self._active.write_snapshot()
+        self._active.close()
+        number = (self._sealed[-1].number if self._sealed else 0) + 1
+        sealed_path = self._segment_path(number)
+        bloom = self._bloom_for(self._active)
+        bloom.save(_sidecar(sealed_path, BLOOM_SUFFIX))
+        for suffix in (INDEX_SUFFIX, SNAPSHOT_SUFFIX):
+            if _sidecar(self._path, suffix).exists():
+                os.replace(_sidecar(self._path, suffix), _sidecar(sealed_path, suffix))
+        # The ledger rename is the commit point; a crash before it leaves the active
+        # segment unindexed, which LocalJsonlEventStore re-indexes on open.
+        os.replace(self._path, sealed_path)
+        seg = _Sealed(number, sealed_path, bloom)
+        _save_span(seg, self._active)
+        self._sealed.append(seg)
+        self._active = self._open_active()
+        self._created = self._reset_created()
+        logger.info("ledger segment sealed: %s", sealed_path.name)
+
+    # --- EventStore -----------------------------------------------------
+
+    def has_source_hash(self, source_hash: str) -> bool:
+        if self._active.has_source_hash(source_hash):
+            return True
+        key = _hash_key(source_hash)
+        return any(key in seg.bloom and self._segment(seg).has_source_hash(source_hash) for seg in reversed(self._sealed))
+
+    def get(self, event_id: str) -> Optional[Event]:
+        ev = self._active.get(event_id)
+        if ev is not None:
+            return ev
+        key = _id_key(event_id)
+        for seg in reversed(self._sealed):
+            if key in seg.bloom:
+                ev = self._segment(seg).get(event_id)
+                if ev is not None:
+                    return ev
+        return None
+
+    def append(self, event: Event) -> None:
+        self._active.append(event)
+        self._maybe_rotate()
+
+    def tickers(self) -> Set[str]:
+        out = set(self._active.tickers())
+        for seg in self._sealed:
+            out.update(seg.tickers)
+        return out
+
+    def _superseded_after(self, event_id: str, position: int) -> bool:
+        """Whether a store after `position` (sealed segments oldest first, then the active one) holds event_id."""
+        if self._active.has_event(event_id):
+            return True
+        key = _id_key(event_id)
+        return any(key in seg.bloom and self._segment(seg).has_event(event_id) for seg in self._sealed[position + 1 :])
+
+    def iter_ticker_range(self, ticker: str, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[Event]:
+        """One ticker's events with start <= event_timestamp_utc < end, oldest first.
+
+        Sealed segments whose time span or ticker set cannot match are skipped
+        without being opened; the others answer from their ticker/time index.
+        """
+        lo, hi = epoch(start), epoch(end)
+        runs = []
+        for i, seg in enumerate(self._sealed):
+            if not seg.may_hold(ticker, lo, hi):
+                continue
+            store = self._segment(seg)
+            postings = [p for p in store.ticker_postings(ticker, start, end) if not self._superseded_after(p[1], i)]
+            runs.append([(ts, event_id, seg.number) for ts, event_id in postings])
+        runs.append([(ts, event_id, -1) for ts, event_id in self._active.ticker_postings(ticker, start, end)])
+        return self._iter_postings(list(heapq.merge(*runs)))
+
+    def _iter_postings(self, postings: List[Tuple[float, str, int]]) -> Iterator[Event]:
+        by_number = {seg.number: seg for seg in self._sealed}
+        for _, event_id, number in postings:
+            store = self._active if number < 0 else self._segment(by_number[number])
+            ev = store.get(event_id)
+            if ev is not None:
+                yield ev
+
+    def flush(self) -> None:
+        self._active.flush()
+
+    def close(self) -> None:
+        self._active.close()
+        self._close_open_segments()
+
+    def __enter__(self) -> "SegmentedJsonlEventStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def iter_all(self) -> Iterable[Event]:
+        self.flush()
+        return self._iter_all()
+
+    def _iter_all(self) -> Iterator[Event]:
+        # Oldest to newest; an event_id that reappears in a later segment is yielded there only.
+        stores = [LocalJsonlEventStore(str(seg.path)) for seg in self._sealed]
+        try:
+            skips = _superseded(stores + [self._active])
+            for store, skip in zip(stores + [self._active], skips):
+                for ev in store.iter_all():
+                    if ev.event_id not in skip:
+                        yield ev
+        finally:
+            for store in stores:
+                store.close()
+
+    def columns(self) -> EventColumns:
+        """Columns of every live event, in `iter_all` order (offsets are relative to each segment's file)."""
+        self.flush()
+        stores = [LocalJsonlEventStore(str(seg.path)) for seg in self._sealed]
+        try:
+            out = EventColumns()
+            for store, skip in zip(stores + [self._active], _superseded(stores + [self._active])):
+                cols = store.columns()
+                out.extend(cols, [i for i, event_id in enumerate(cols.event_ids) if event_id not in skip] if skip else range(len(cols)))
+            return out
+        finally:
+            for store in stores:
+                store.close()
+
+    # --- compaction -----------------------------------------------------
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._sealed) + 1
+
+    def compact(self) -> CompactionStats:
+        """Merge all sealed segments into one, keeping only the latest line per event_id."""
+        self.flush()
+        self._close_open_segments()
+        before = len(self._sealed) + 1
+        if not self._sealed:
+            return CompactionStats(before, before, 0, 0)
+
+        stores = [LocalJsonlEventStore(str(seg.path)) for seg in self._sealed]
+        lines_before = sum(_count_lines(seg.path) for seg in self._sealed)
+        target = self._sealed[-1]
+        tmp = _sidecar(target.path, ".tmp")
+        tmp_index = _sidecar(tmp, INDEX_SUFFIX)
+        ids: Set[str] = set()
+        hashes: Set[str] = set()
+        tickers: Set[str] = set()
+        stamps: List[float] = []
+        try:
+            skips = _superseded(stores + [self._active])
+            offset = 0
+            with tmp.open("wb") as out, tmp_index.open("wb") as out_index:
+                for store, skip in zip(stores, skips):
+                    for event_id, line in store.raw_lines():
+                        if event_id in skip:
+                            continue
+                        entry = index_entry_for_line(offset, len(line), json.loads(line))
+                        out.write(line + b"\n")
+                        out_index.write(encode_index_entry(entry))
+                        offset += len(line) + 1
+                        ids.add(event_id)
+                        hashes.add(entry[3])
+                        stamps.append(entry[4])
+                        tickers.update(entry[5])
+                out.flush()
+                os.fsync(out.fileno())
+        finally:
+            for store in stores:
+                store.close()
+
+        bloom = BloomFilter.for_capacity(len(ids) + len(hashes), self._fp_rate)
+        for event_id in ids:
+            bloom.add(_id_key(event_id))
+        for source_hash in hashes:
+            bloom.add(_hash_key(source_hash))
+
+        # Drop the target's sidecars first: after the ledger replace (the commit point)
+        # a missing index or filter is rebuilt from the new ledger, never used stale.
+        for suffix in (INDEX_SUFFIX, BLOOM_SUFFIX, SPAN_SUFFIX, SNAPSHOT_SUFFIX):
+            _sidecar(target.path, suffix).unlink(missing_ok=True)
+        os.replace(tmp, target.path)
+        os.replace(tmp_index, _sidecar(target.path, INDEX_SUFFIX))
+        bloom.save(target.bloom_path)
+        merged = _Sealed(target.number, target.path, bloom, (min(stamps), max(stamps)) if stamps else None, frozenset(tickers))
+        _write_span(merged)
+        for seg in self._sealed[:-1]:
+            for suffix in ("", INDEX_SUFFIX, BLOOM_SUFFIX, SPAN_SUFFIX, SNAPSHOT_SUFFIX):
+                _sidecar(seg.path, suffix).unlink(missing_ok=True)
+        with LocalJsonlEventStore(str(target.path)) as merged_store:
+            merged_store.write_snapshot()
+
+        self._sealed = [merged]
+        return CompactionStats(before, len(self._sealed) + 1, lines_before, len(ids))
+
+
+def _save_span(seg: _Sealed, store: LocalJsonlEventStore) -> None:
+    seg.span = store.time_span()
+    seg.tickers = frozenset(store.tickers())
+    _write_span(seg)
+
+
+def _write_span(seg: _Sealed) -> None:
+    meta = {"span": list(seg.span) if seg.span else None, "tickers": sorted(seg.tickers)}
+    _sidecar(seg.path, SPAN_SUFFIX).write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+
+
+def _superseded(stores: List[LocalJsonlEventStore]) -> List[Set[str]]:
+    """Per store, the event_ids that a later store also holds."""
+    later: Set[str] = set()
+    skips: List[Set[str]] = []
+    for store in reversed(stores):
+        ids = store.event_ids()
+        skips.append({i for i in ids if i in later})
+        later.update(ids)
+    skips.reverse()
+    return skips
+
+
+def _count_lines(path: Path) -> int:
+    n = 0
+    with path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                n += 1
+    return n
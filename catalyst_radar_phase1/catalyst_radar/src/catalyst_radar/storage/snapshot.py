@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple
+
+from catalyst_radar.storage.columns import NUMERIC_COLUMNS, EventColumns
+
+# Columnar ledger snapshot: `<ledger>.snap`.
+#
+#   header   <4sHHqqqI: magic, version, reserved, rows, ledger_end, index_end, crc32 of the body
+#   body     sections in a fixed order, each <cI (array typecode, item count) + little-endian items:
+#            the NUMERIC_COLUMNS, then event_ids / source_hashes / ticker_names as string
+#            tables (uint32 end offsets + UTF-8 blob), then ticker_ptr and ticker_codes.
+#
+# `ledger_end` is the ledger byte size the snapshot covers; lines after it are
+# replayed from the JSONL. `index_end` is the `.idx` size at the same point.
+SNAPSHOT_SUFFIX = ".snap"
+MAGIC = b"CRSN"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHqqqI")
+_SECTION = struct.Struct("<cI")
+_SWAP = sys.byteorder != "little"
+
+
+@dataclass
+class Snapshot:
+    columns: EventColumns
+    ledger_end: int
+    index_end: int
+
+
+def _pack_array(a: array) -> bytes:
+    if _SWAP:
+        a = array(a.typecode, a)
+        a.byteswap()
+    return _SECTION.pack(a.typecode.encode("ascii"), len(a)) + a.tobytes()
+
+
+def _pack_strings(values: List[str]) -> bytes:
+    blobs = [v.encode("utf-8") for v in values]
+    ends = array("I")
+    pos = 0
+    for b in blobs:
+        pos += len(b)
+        ends.append(pos)
+    blob = b"".join(blobs)
+    return _pack_array(ends) + _pack_array(array("B", blob))
+
+
+class _Reader:
+    def __init__(self, body: bytes) -> None:
+        self._view = memoryview(body)
+        self._pos = 0
+
+    def array(self) -> array:
+        typecode, count = _SECTION.unpack_from(self._view, self._pos)
+        self._pos += _SECTION.size
+        a = array(typecode.decode("ascii"))
+        size = count * a.itemsize
+        if self._pos + size > len(self._view):
+            raise ValueError("snapshot section is truncated")
+        a.frombytes(self._view[self._pos : self._pos + size])
+        self._pos += size
+        if _SWAP:
+            a.byteswap()
+        return a
+
+    def strings(self) -> List[str]:
+        ends = self.array()
+        blob = self.array().tobytes()
+        out: List[str] = []
+        start = 0
+        for end in ends:
+            out.append(blob[start:end].decode("utf-8"))
+            start = end
+        return out
+
+
+def write_snapshot(path: str | Path, columns: EventColumns, *, ledger_end: int, index_end: int) -> None:
+    """Write the snapshot atomically (tmp file, fsync, rename)."""
+    parts = [_pack_array(columns.cols[name]) for name in NUMERIC_COLUMNS]
+    parts += [_pack_strings(columns.event_ids), _pack_strings(columns.source_hashes), _pack_strings(columns.ticker_names)]
+    parts += [_pack_array(columns.ticker_ptr), _pack_array(columns.ticker_codes)]
+    body = b"".join(parts)
+    header = _HEADER.pack(MAGIC, VERSION, 0, len(columns), ledger_end, index_end, zlib.crc32(body))
+    p = Path(path)
+    tmp = p.with_name(p.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(header)
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, p)
+
+
+def read_snapshot(path: str | Path) -> Snapshot:
+    """Load a snapshot; raises OSError / ValueError if it is missing or damaged."""
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        raise ValueError("snapshot is truncated")
+    magic, version, _, rows, ledger_end, index_end, crc = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a version {VERSION} ledger snapshot")
+    body = data[_HEADER.size :]
+    if zlib.crc32(body) != crc:
+        raise ValueError("snapshot checksum mismatch")
+
+    r = _Reader(body)
+    cols = EventColumns()
+    for name, code in NUMERIC_COLUMNS.items():
+        a = r.array()
+        if a.typecode != code or len(a) != rows:
+            raise ValueError(f"snapshot column {name} is malformed")
+        cols.cols[name] = a
+    cols.event_ids = r.strings()
+    cols.source_hashes = r.strings()
+    cols.ticker_names = r.strings()
+    cols.ticker_ptr = r.array()
+    cols.ticker_codes = r.array()
+    cols._ticker_code = {t: i for i, t in enumerate(cols.ticker_names)}
+    if len(cols.event_ids) != rows or len(cols.ticker_ptr) != rows + 1:
+        raise ValueError("snapshot row count mismatch")
+    return Snapshot(cols, ledger_end, index_end)
+
+
+def live_rows(columns: EventColumns, offsets: dict) -> Tuple[List[int], int]:
+    """Rows holding the latest line of each event_id, in `offsets` order, and how many rows were superseded."""
+    if len(columns) == len(offsets):
+        # One line per event_id: every row is live and ledger order is first-seen order.
+        return list(range(len(columns))), 0
+    off = columns.cols["offset"]
+    row_of = {event_id: i for i, event_id in enumerate(columns.event_ids) if offsets.get(event_id, (None,))[0] == off[i]}
+    rows = [row_of[event_id] for event_id in offsets if event_id in row_of]
+    return rows, len(columns) - len(rows)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from catalyst_radar.core.models import Event
+from catalyst_radar.core.codec import event_from_dict
+from catalyst_radar.storage.local_jsonl_store import FSYNC_POLICIES
+
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS events (
+      event_id                 TEXT PRIMARY KEY,
+      source_hash              TEXT NOT NULL,
+      event_type               TEXT NOT NULL,
+      event_timestamp_utc      TEXT NOT NULL,
+      discovered_timestamp_utc TEXT NOT NULL,
+      body                     TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_events_source_hash ON events (source_hash)",
+    "CREATE INDEX IF NOT EXISTS ix_events_event_ts ON events (event_timestamp_utc)",
+    # Covering (ticker, time) order: a ticker's events in a window are one index range.
+    """
+    CREATE TABLE IF NOT EXISTS event_tickers (
+      ticker              TEXT NOT NULL,
+      event_timestamp_utc TEXT NOT NULL,
+      event_id            TEXT NOT NULL,
+      PRIMARY KEY (ticker, event_timestamp_utc, event_id)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_event_tickers_event ON event_tickers (event_id)",
+)
+
+# fsync policy -> PRAGMA synchronous (WAL: NORMAL syncs at checkpoints, FULL at every commit).
+_SYNCHRONOUS = {"never": "OFF", "batch": "NORMAL", "event": "FULL"}
+
+
+def _ts(value: datetime) -> str:
+    # Fixed width so text order is time order.
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+
+
+class SqliteEventStore:
+    """Event Ledger in a single SQLite database (WAL mode).
+
+    `events` holds one row per event_id (the latest append wins) with the
+    Event as JSON in `body`; `event_tickers` links tickers to events by time.
+    Dedupe lookups and time-window scans use indexes instead of in-memory sets.
+    Appends are committed every `batch_size` events, on `flush()` and on `close()`
+    (every event with fsync="event").
+    """
+
+    def __init__(self, path: str, *, fsync: str = "batch", batch_size: int = 1000) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._fsync = fsync
+        self._batch_size = max(batch_size, 1)
+        self._pending = 0
+        self._conn = sqlite3.connect(str(self._path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={_SYNCHRONOUS[fsync]}")
+        for sql in _SCHEMA:
+            self._conn.execute(sql)
+        self._conn.commit()
+
+    @property
+    def path(self) -> str:
+        return str(self._path)
+
+    def has_source_hash(self, source_hash: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM events WHERE source_hash = ? LIMIT 1", (source_hash,)).fetchone()
+        return row is not None
+
+    def get(self, event_id: str) -> Optional[Event]:
+        row = self._conn.execute("SELECT body FROM events WHERE event_id = ?", (event_id,)).fetchone()
+        return event_from_dict(json.loads(row[0])) if row else None
+
+    def append(self, event: Event) -> None:
+        self.append_many([event])
+
+    def append_many(self, events: Sequence[Event]) -> int:
+        """Insert (or replace, by event_id) a batch of events; returns how many were written."""
+        rows = []
+        links = []
+        for ev in events:
+            ts = _ts(ev.event_timestamp_utc)
+            rows.append(
+                (
+                    ev.event_id,
+                    ev.source_hash,
+                    ev.event_type.value,
+                    ts,
+                    _ts(ev.discovered_timestamp_utc),
+                    json.dumps(ev.to_dict(), ensure_ascii=False),
+                )
+            )
+            links.extend((t, ts, ev.event_id) for t in dict.fromkeys(ev.tickers))
+        if not rows:
+            return 0
+        cur = self._conn.cursor()
+        cur.executemany("DELETE FROM event_tickers WHERE event_id = ?", [(r[0],) for r in rows])
+        cur.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?)", rows)
+        cur.executemany("INSERT OR IGNORE INTO event_tickers VALUES (?, ?, ?)", links)
+        self._pending += len(rows)
+        if self._fsync == "event" or self._pending >= self._batch_size:
+            self.flush()
+        return len(rows)
+
+    def flush(self) -> None:
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self) -> "SqliteEventStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def tickers(self) -> List[str]:
+        return [t for (t,) in self._conn.execute("SELECT DISTINCT ticker FROM event_tickers")]
+
+    def _iter_bodies(self, sql: str, params: Sequence = ()) -> Iterator[Event]:
+        # A separate cursor streams rows; appends on the connection stay possible meanwhile.
+        for (body,) in self._conn.cursor().execute(sql, params):
+            yield event_from_dict(json.loads(body))
+
+    def iter_all(self) -> Iterable[Event]:
+        return self._iter_bodies("SELECT body FROM events ORDER BY rowid")
+
+    def ledger_positions(self, event_ids: Sequence[str]) -> Dict[str, int]:
+        """Position of each stored event in `iter_all` order (its rowid)."""
+        out: Dict[str, int] = {}
+        ids = list(event_ids)
+        # Chunked below SQLite's default bound-parameter limit.
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            sql = f"SELECT event_id, rowid FROM events WHERE event_id IN ({', '.join('?' * len(chunk))})"
+            out.update(self._conn.execute(sql, chunk))
+        return out
+
+    def iter_range(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[Event]:
+        """Events with start <= event_timestamp_utc < end (either bound optional), oldest first."""
+        where: List[str] = []
+        params: List[str] = []
+        if start is not None:
+            where.append("event_timestamp_utc >= ?")
+            params.append(_ts(start))
+        if end is not None:
+            where.append("event_timestamp_utc < ?")
+            params.append(_ts(end))
+        sql = "SELECT body FROM events"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return self._iter_bodies(sql + " ORDER BY event_timestamp_utc", params)
+
+    def iter_ticker_range(self, ticker: str, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[Event]:
+        """One ticker's events in [start, end), oldest first, via the event_tickers index."""
+        sql = "SELECT e.body FROM event_tickers t JOIN events e ON e.event_id = t.event_id WHERE t.ticker = ?"
+        params: List[str] = [ticker]
+        if start is not None:
+            sql += " AND t.event_timestamp_utc >= ?"
+            params.append(_ts(start))
+        if end is not None:
+            sql += " AND t.event_timestamp_utc < ?"
+            params.append(_ts(end))
+        return self._iter_bodies(sql + " ORDER BY t.event_timestamp_utc", params)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import bisect
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Posting: (event timestamp as epoch seconds, event_id); sorted per ticker.
+Posting = Tuple[float, str]
+
+
+def epoch(value: Optional[datetime]) -> Optional[float]:
+    return None if value is None else value.timestamp()
+
+
+class TickerTimeIndex:
+    """In-memory secondary index (ticker, event_timestamp_utc) -> event_id.
+
+    Each ticker maps to its postings sorted by time, so "events for T in
+    [start, end)" is two bisections. Re-adding an event_id replaces its
+    postings (the latest ledger line wins, as in the primary index).
+    """
+
+    def __init__(self) -> None:
+        self._by_ticker: Dict[str, List[Posting]] = {}
+        self._events: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, event_id: str, ts: float, tickers: Sequence[str]) -> None:
+        old = self._events.get(event_id)
+        if old is not None:
+            self._remove(event_id, *old)
+        unique = tuple(dict.fromkeys(tickers))
+        self._events[event_id] = (ts, unique)
+        posting = (ts, event_id)
+        for t in unique:
+            postings = self._by_ticker.setdefault(t, [])
+            if not postings or postings[-1] <= posting:
+                postings.append(posting)  # the common case: appends arrive in time order
+            else:
+                bisect.insort(postings, posting)
+
+    @classmethod
+    def from_columns(cls, event_ids: Sequence[str], stamps: Sequence[float], ticker_ptr: Sequence[int], ticker_codes: Sequence[int], ticker_names: Sequence[str]) -> "TickerTimeIndex":
+        """Bulk build from CSR ticker columns (one row per event_id, no repeats)."""
+        idx = cls()
+        by_code: Dict[int, List[Posting]] = {}
+        events = idx._events
+        start = 0
+        for event_id, ts, end in zip(event_ids, stamps, ticker_ptr[1:]):
+            codes = ticker_codes[start:end]
+            start = end
+            events[event_id] = (ts, tuple(ticker_names[c] for c in codes))
+            posting = (ts, event_id)
+            for c in codes:
+                lst = by_code.get(c)
+                if lst is None:
+                    by_code[c] = [posting]
+                else:
+                    lst.append(posting)
+        for c, postings in by_code.items():
+            postings.sort()
+            idx._by_ticker[ticker_names[c]] = postings
+        return idx
+
+    def _remove(self, event_id: str, ts: float, tickers: Tuple[str, ...]) -> None:
+        for t in tickers:
+            postings = self._by_ticker.get(t)
+            if not postings:
+                continue
+            i = bisect.bisect_left(postings, (ts, event_id))
+            if i < len(postings) and postings[i] == (ts, event_id):
+                del postings[i]
+            if not postings:
+                del self._by_ticker[t]
+
+    def tickers(self) -> Iterable[str]:
+        return self._by_ticker.keys()
+
+    def range(self, ticker: str, start: Optional[float] = None, end: Optional[float] = None) -> List[Posting]:
+        """Postings of `ticker` with start <= ts < end (either bound optional), oldest first."""
+        postings = self._by_ticker.get(ticker)
+        if not postings:
+            return []
+        lo = 0 if start is None else bisect.bisect_left(postings, (start,))
+        hi = len(postings) if end is None else bisect.bisect_left(postings, (end,))
+        return postings[lo:hi]
+
+    def span(self) -> Optional[Tuple[float, float]]:
+        """(earliest, latest) indexed event timestamp."""
+        if not self._events:
+            return None
+        stamps = [ts for ts, _ in self._events.values()]
+        return min(stamps), max(stamps)
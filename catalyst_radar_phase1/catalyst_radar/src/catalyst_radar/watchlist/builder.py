@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import datetime
-from typing import Dict, Iterable, List
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Sequence
 
 from catalyst_radar.config.settings import Settings
 from catalyst_radar.core.models import Confidence, Event, WatchlistEntry
@@ -11,6 +11,9 @@ from catalyst_radar.watchlist.compliance_gate import is_event_eligible_for_watch
 
 _CONF_ORDER = {Confidence.LOW: 0, Confidence.MEDIUM: 1, Confidence.HIGH: 2}
 
+# Supporting events kept per ticker.
+TOP_EVENTS = 3
+
 
 def _max_conf(conf_list: List[Confidence]) -> Confidence:
     return max(conf_list, key=lambda c: _CONF_ORDER[c])
@@ -28,36 +31,120 @@ class WatchlistBuilder:
         entries: List[WatchlistEntry] = []
         for ticker, evs in per_ticker.items():
             evs_sorted = sorted(evs, key=lambda x: (x.overall_score, x.event_timestamp_utc), reverse=True)
-            top = evs_sorted[:3]
+            entries.append(entry_for(ticker, evs_sorted[:TOP_EVENTS]))
+
+        return sort_entries(entries)
 
-            # Placeholder aggregation (no scoring formula defined in Phase 0)
-            rank_score = int(max((e.overall_score for e in top), default=0))
-            comp_scores = {
-                "Freshness": int(max((e.freshness_score for e in top), default=0)),
-                "Materiality": int(max((e.materiality_score for e in top), default=0)),
-                "Source Credibility": int(max((e.credibility_score for e in top), default=0)),
-                "Theme Fit": 0,       # TBD (Phase 0 defines component but no formula)
-                "De-risking": 0,      # TBD (Phase 0 defines component but no formula)
-            }
+    def build_from_store(self, store: Any, *, now_utc: datetime, settings: Settings) -> List[WatchlistEntry]:
+        """`build` over the store without decoding every stored event.
 
-            conf = _max_conf([e.confidence for e in top])
-            conf_reason = "Derived from supporting Events (scoring formulas TBD)."
+        Stores with columns (`columns()`) are ranked on them; stores with a
+        ticker/time index (`tickers()` + `iter_ticker_range`) are queried per
+        ticker for the live window; others are scanned in full. Window events
+        are put back in `iter_all` order (`ledger_positions()` where the store
+        has it, else time then event_id) so score and timestamp ties rank the
+        same as in the full build.
+        """
+        if hasattr(store, "columns"):
+            return self.build_from_columns(store, now_utc=now_utc, settings=settings)
+        if not (hasattr(store, "tickers") and hasattr(store, "iter_ticker_range")):
+            return self.build(store.iter_all(), now_utc=now_utc, settings=settings)
+        # Anything older than the longest staleness window is stale for every event type.
+        since = now_utc - timedelta(days=max(settings.news_stale_days, settings.disclosure_stale_days) + 1)
+        events: Dict[str, Event] = {}
+        for ticker in sorted(store.tickers()):
+            for e in store.iter_ticker_range(ticker, since):
+                events.setdefault(e.event_id, e)
+        if hasattr(store, "ledger_positions"):
+            positions = store.ledger_positions(list(events))
+            ordered = sorted(events.values(), key=lambda e: positions[e.event_id])
+        else:
+            ordered = sorted(events.values(), key=lambda e: (e.event_timestamp_utc, e.event_id))
+        return self.build(ordered, now_utc=now_utc, settings=settings)
 
-            company_name = (top[0].entities[0] if top and top[0].entities else "TBD")
-            time_horizon = "TBD"  # Phase 0 requires a horizon tag but no mapping rules yet.
+    def build_from_columns(self, store: Any, *, now_utc: datetime, settings: Settings) -> List[WatchlistEntry]:
+        """`build(store.iter_all())` computed on `store.columns()`; only each ticker's lead event is read."""
+        # Lazy: the columnar module imports TOP_EVENTS from here.
+        from catalyst_radar.storage.columns import CONFIDENCES
+        from catalyst_radar.watchlist.columnar import rank_tickers
 
+        cols = store.columns()
+        leads: Dict[str, Any] = {}
+        entries: List[WatchlistEntry] = []
+        for top in rank_tickers(cols, now_utc=now_utc, settings=settings):
+            event_ids = [cols.event_ids[i] for i in top.rows]
+            if event_ids[0] not in leads:
+                leads[event_ids[0]] = store.get(event_ids[0])
+            lead = leads[event_ids[0]]
             entries.append(
-                WatchlistEntry(
-                    ticker=ticker,
-                    company_name=company_name,
-                    rank_score=rank_score,
-                    component_scores=comp_scores,
-                    top_events=[e.event_id for e in top],
-                    confidence=conf,
-                    confidence_reason=conf_reason,
-                    time_horizon=time_horizon,
+                make_entry(
+                    top.ticker,
+                    event_ids,
+                    company_name=(lead.entities[0] if lead is not None and lead.entities else "TBD"),
+                    overall_score=top.overall_score,
+                    freshness_score=top.freshness_score,
+                    materiality_score=top.materiality_score,
+                    credibility_score=top.credibility_score,
+                    confidence=CONFIDENCES[top.confidence],
                 )
             )
+        return sort_entries(entries)
+
+
+def entry_for(ticker: str, top: Sequence[Any]) -> WatchlistEntry:
+    """WatchlistEntry from a ticker's top events, best first.
+
+    `top` holds Events or anything with the same score / confidence / entities attributes.
+    """
+    return make_entry(
+        ticker,
+        [e.event_id for e in top],
+        company_name=(top[0].entities[0] if top and top[0].entities else "TBD"),
+        overall_score=max((e.overall_score for e in top), default=0),
+        freshness_score=max((e.freshness_score for e in top), default=0),
+        materiality_score=max((e.materiality_score for e in top), default=0),
+        credibility_score=max((e.credibility_score for e in top), default=0),
+        confidence=_max_conf([e.confidence for e in top]),
+    )
+
+
+def make_entry(
+    ticker: str,
+    top_events: List[str],
+    *,
+    company_name: str,
+    overall_score: int,
+    freshness_score: int,
+    materiality_score: int,
+    credibility_score: int,
+    confidence: Confidence,
+) -> WatchlistEntry:
+    """WatchlistEntry from the maxima over a ticker's top events."""
+    # Placeholder aggregation (no scoring formula defined in Phase 0)
+    rank_score = int(overall_score)
+    comp_scores = {
+        "Freshness": int(freshness_score),
+        "Materiality": int(materiality_score),
+        "Source Credibility": int(credibility_score),
+        "Theme Fit": 0,       # TBD (Phase 0 defines component but no formula)
+        "De-risking": 0,      # TBD (Phase 0 defines component but no formula)
+    }
+
+    conf_reason = "Derived from supporting Events (scoring formulas TBD)."
+    time_horizon = "TBD"  # Phase 0 requires a horizon tag but no mapping rules yet.
+
+    return WatchlistEntry(
+        ticker=ticker,
+        company_name=company_name,
+        rank_score=rank_score,
+        component_scores=comp_scores,
+        top_events=top_events,
+        confidence=confidence,
+        confidence_reason=conf_reason,
+        time_horizon=time_horizon,
+    )
+
 
-        # Sort descending by rank_score (ties: alphabetical)
-        return sorted(entries, key=lambda w: (w.rank_score, w.ticker), reverse=True)
+def sort_entries(entries: List[WatchlistEntry]) -> List[WatchlistEntry]:
+    # Sort descending by rank_score (ties: alphabetical)
+    return sorted(entries, key=lambda w: (w.rank_score, w.ticker), reverse=True)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from catalyst_radar.config.settings import Settings
+from catalyst_radar.core.models import EventType
+from catalyst_radar.storage.columns import CONFIDENCES, EVENT_TYPES, EventColumns
+from catalyst_radar.watchlist.builder import TOP_EVENTS
+
+# Optional dependency: NumPy vectorises the ranking; without it the same ranking runs in pure Python.
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None
+
+_DISCLOSURE = EVENT_TYPES.index(EventType.POLITICIAN_DISCLOSURE)
+_DAY_S = 86400.0
+
+
+@dataclass(slots=True)
+class TickerTop:
+    """A ticker's top rows (best first) and the score / confidence maxima over them."""
+
+    ticker: str
+    rows: List[int]
+    overall_score: int
+    freshness_score: int
+    materiality_score: int
+    credibility_score: int
+    confidence: int  # code into CONFIDENCES
+
+
+def rank_tickers(cols: EventColumns, *, now_utc: datetime, settings: Settings, vectorized: Optional[bool] = None) -> List[TickerTop]:
+    """Per ticker, the TOP_EVENTS rows eligible for the watchlist, ranked as `WatchlistBuilder.build` ranks events.
+
+    Eligibility is `is_event_eligible_for_watchlist` on the columns; rows rank by
+    (overall_score, event time) descending, ties going to the earlier row.
+    `vectorized` picks the NumPy implementation (default: when NumPy is installed).
+    """
+    if vectorized is None:
+        vectorized = np is not None
+    if vectorized:
+        if np is None:
+            raise ImportError("vectorized ranking requires numpy (pip install -e .[numpy])")
+        return _rank_numpy(cols, now_utc.timestamp(), settings)
+    return _rank_python(cols, now_utc.timestamp(), settings)
+
+
+def _rank_python(cols: EventColumns, now: float, settings: Settings) -> List[TickerTop]:
+    c = cols.cols
+    ts, overall, etype, conf, cred = c["event_ts"], c["overall_score"], c["event_type"], c["confidence"], c["credibility_score"]
+    min_conf = CONFIDENCES.index(settings.min_confidence)
+    min_cred = settings.min_credibility
+    ptr, codes = cols.ticker_ptr, cols.ticker_codes
+
+    per_ticker: Dict[int, List[int]] = {}
+    for i in range(len(cols)):
+        if ptr[i] == ptr[i + 1] or conf[i] < min_conf:
+            continue
+        limit = settings.disclosure_stale_days if etype[i] == _DISCLOSURE else settings.news_stale_days
+        if math.floor((now - ts[i]) / _DAY_S) > limit:
+            continue
+        if min_cred is not None and cred[i] < min_cred:
+            continue
+        for code in codes[ptr[i] : ptr[i + 1]]:
+            per_ticker.setdefault(code, []).append(i)
+
+    out: List[TickerTop] = []
+    for code, rows in per_ticker.items():
+        top = heapq.nsmallest(TOP_EVENTS, rows, key=lambda i: (-overall[i], -ts[i], i))
+        out.append(
+            TickerTop(
+                cols.ticker_names[code],
+                top,
+                max(overall[i] for i in top),
+                max(c["freshness_score"][i] for i in top),
+                max(c["materiality_score"][i] for i in top),
+                max(cred[i] for i in top),
+                max(conf[i] for i in top),
+            )
+        )
+    return out
+
+
+def _view(a) -> "np.ndarray":
+    # A copy: a live view would pin the array.array, and the store keeps appending to it.
+    return np.frombuffer(a, dtype=a.typecode).copy()
+
+
+def _rank_numpy(cols: EventColumns, now: float, settings: Settings) -> List[TickerTop]:
+    c = {name: _view(a) for name, a in cols.cols.items()}
+    ptr, codes = _view(cols.ticker_ptr), _view(cols.ticker_codes)
+    ts, overall, conf = c["event_ts"], c["overall_score"].astype(np.int32), c["confidence"]
+
+    # Eligibility over all rows at once.
+    limit = np.where(c["event_type"] == _DISCLOSURE, settings.disclosure_stale_days, settings.news_stale_days)
+    counts = np.diff(ptr)
+    ok = (counts > 0) & (conf >= CONFIDENCES.index(settings.min_confidence))
+    ok &= np.floor((now - ts) / _DAY_S) <= limit
+    if settings.min_credibility is not None:
+        ok &= c["credibility_score"] >= settings.min_credibility
+
+    # One (row, ticker) pair per CSR entry of an eligible row.
+    row = np.repeat(np.arange(len(cols), dtype=np.int64), counts)
+    keep = ok[row]
+    row, tick = row[keep], codes[keep]
+    if not len(row):
+        return []
+
+    # Group by ticker, best first within each group, then keep each group's head.
+    order = np.lexsort((row, -ts[row], -overall[row], tick))
+    row, tick = row[order], tick[order]
+    starts = np.flatnonzero(np.r_[True, tick[1:] != tick[:-1]])
+    rank = np.arange(len(row)) - np.repeat(starts, np.diff(np.r_[starts, len(row)]))
+    head = rank < TOP_EVENTS
+    row, tick = row[head], tick[head]
+    starts = np.flatnonzero(np.r_[True, tick[1:] != tick[:-1]])
+
+    maxima = [
+        np.maximum.reduceat(col[row], starts).tolist()
+        for col in (overall, c["freshness_score"], c["materiality_score"], c["credibility_score"], conf)
+    ]
+    bounds = np.r_[starts, len(row)].tolist()
+    rows = row.tolist()
+    names = cols.ticker_names
+    return [
+        TickerTop(names[code], rows[bounds[k] : bounds[k + 1]], *(m[k] for m in maxima))
+        for k, code in enumerate(tick[starts].tolist())
+    ]
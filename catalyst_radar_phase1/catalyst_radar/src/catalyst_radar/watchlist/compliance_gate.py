@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from catalyst_radar.config.settings import Settings
 from catalyst_radar.core.models import Confidence, Event, EventType
@@ -21,6 +21,24 @@ def is_event_stale(event: Event, *, now_utc: datetime, settings: Settings) -> bo
     return age_days > settings.news_stale_days
 
 
+def stale_at(event: Event, *, settings: Settings) -> datetime:
+    """First instant at which `is_event_stale` holds for this event."""
+    days = settings.disclosure_stale_days if event.event_type == EventType.POLITICIAN_DISCLOSURE else settings.news_stale_days
+    return event.event_timestamp_utc + timedelta(days=days + 1)
+
+
+def passes_static_gates(event: Event, *, settings: Settings) -> bool:
+    """The watchlist gates that do not depend on the clock (all but staleness)."""
+    if not event.tickers:
+        return False
+    if not confidence_meets_min(event.confidence, settings.min_confidence):
+        return False
+    if settings.min_credibility is not None:
+        if event.credibility_score < settings.min_credibility:
+            return False
+    return True
+
+
 def is_event_eligible_for_watchlist(event: Event, *, now_utc: datetime, settings: Settings) -> bool:
     """Apply Phase 0 safety gates for watchlist promotion.
 
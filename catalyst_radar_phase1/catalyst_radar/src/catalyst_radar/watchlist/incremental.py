@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import bisect
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from catalyst_radar.config.settings import Settings
+from catalyst_radar.core.models import Confidence, Event, WatchlistEntry
+from catalyst_radar.output.writer import DIGEST_SIZE, digest_item
+from catalyst_radar.watchlist.builder import TOP_EVENTS, entry_for, sort_entries
+from catalyst_radar.watchlist.compliance_gate import passes_static_gates, stale_at
+
+
+STATE_VERSION = 1
+
+
+@dataclass
+class _Candidate:
+    """What a watchlist entry needs from one supporting event."""
+
+    event_id: str
+    overall_score: int
+    freshness_score: int
+    materiality_score: int
+    credibility_score: int
+    confidence: Confidence
+    company: Optional[str]
+    event_ts: str  # ISO UTC
+    expires_at: str  # ISO UTC; stale from then on (compliance_gate.stale_at)
+    seq: int  # arrival order, breaks ties like the stable sort in WatchlistBuilder
+
+    @property
+    def entities(self) -> List[str]:
+        return [self.company] if self.company else []
+
+    def rank(self) -> tuple:
+        return (self.overall_score, self.event_ts, -self.seq)
+
+
+def _iso(dt: datetime) -> str:
+    # Fixed width so text order is time order.
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+
+
+def _prune(cands: List[_Candidate], k: int) -> List[_Candidate]:
+    """Drop candidates that can never reach the top k again, best first.
+
+    A candidate outranked by k others that stay fresh at least as long is
+    shadowed for the rest of its life. What remains is bounded by how
+    scores and staleness interleave, not by the ticker's history.
+    """
+    cands.sort(key=_Candidate.rank, reverse=True)
+    kept: List[_Candidate] = []
+    expiries: List[str] = []  # of kept (higher-ranked) candidates, sorted
+    for c in cands:
+        if len(expiries) - bisect.bisect_left(expiries, c.expires_at) >= k:
+            continue
+        kept.append(c)
+        bisect.insort(expiries, c.expires_at)
+    return kept
+
+
+class IncrementalWatchlist:
+    """Watchlist maintained as events are appended, instead of rebuilt from the ledger.
+
+    Per ticker it keeps only the candidates that can still reach the top
+    `TOP_EVENTS`; stale candidates are expired against `now`. `entries(now)` gives
+    the same result as `WatchlistBuilder.build` over every stored event. The
+    25-item digest is kept the same way. State is persisted as JSON and
+    tied to the settings that shape eligibility; if they change, the
+    state is discarded and rebuilt from the store.
+    """
+
+    def __init__(self, settings: Settings, *, source: str = "", k: int = TOP_EVENTS) -> None:
+        self._settings = settings
+        self._source = source
+        self._k = k
+        self._tickers: Dict[str, List[_Candidate]] = {}
+        self._digest: List[Dict[str, Any]] = []
+        self._seq = 0
+
+    # --- state ----------------------------------------------------------
+
+    def _signature(self) -> Dict[str, Any]:
+        s = self._settings
+        return {
+            "source": self._source,
+            "k": self._k,
+            "min_confidence": s.min_confidence.value,
+            "min_credibility": s.min_credibility,
+            "news_stale_days": s.news_stale_days,
+            "disclosure_stale_days": s.disclosure_stale_days,
+        }
+
+    @classmethod
+    def load(cls, path: str | Path, settings: Settings, *, source: str = "") -> Optional["IncrementalWatchlist"]:
+        """Saved state, or None if it is missing, unreadable, dirty or for other settings."""
+        wl = cls(settings, source=source)
+        try:
+            obj = json.loads(Path(path).read_text(encoding="utf-8"))
+            if obj.get("version") != STATE_VERSION or obj.get("dirty") or obj.get("signature") != wl._signature():
+                return None
+            wl._seq = int(obj["seq"])
+            wl._digest = list(obj["digest"])
+            for ticker, rows in obj["tickers"].items():
+                wl._tickers[ticker] = [_Candidate(**{**r, "confidence": Confidence(r["confidence"])}) for r in rows]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return wl
+
+    def save(self, path: str | Path, *, dirty: bool = False) -> None:
+        """Write the state atomically. `dirty=True` marks it untrustworthy until the next clean save."""
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        obj = {
+            "version": STATE_VERSION,
+            "dirty": dirty,
+            "signature": self._signature(),
+            "seq": self._seq,
+            "digest": self._digest,
+            "tickers": {
+                t: [{**asdict(c), "confidence": c.confidence.value} for c in cands]
+                for t, cands in sorted(self._tickers.items())
+            },
+        }
+        tmp = p.with_name(p.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, p)
+
+    # --- updates --------------------------------------------------------
+
+    def add(self, event: Event) -> None:
+        self._seq += 1
+        self._add_digest(event)
+        if not passes_static_gates(event, settings=self._settings):
+            return
+        ts = _iso(event.event_timestamp_utc)
+        expires = _iso(stale_at(event, settings=self._settings))
+        for ticker in dict.fromkeys(event.tickers):
+            cands = [c for c in self._tickers.get(ticker, ()) if c.event_id != event.event_id]
+            cands.append(
+                _Candidate(
+                    event_id=event.event_id,
+                    overall_score=event.overall_score,
+                    freshness_score=event.freshness_score,
+                    materiality_score=event.materiality_score,
+                    credibility_score=event.credibility_score,
+                    confidence=event.confidence,
+                    company=event.entities[0] if event.entities else None,
+                    event_ts=ts,
+                    expires_at=expires,
+                    seq=self._seq,
+                )
+            )
+            self._tickers[ticker] = _prune(cands, self._k)
+
+    def add_many(self, events: Iterable[Event]) -> int:
+        n = 0
+        for ev in events:
+            self.add(ev)
+            n += 1
+        return n
+
+    def _add_digest(self, event: Event) -> None:
+        item = digest_item(event)
+        item["_discovered"] = _iso(event.discovered_timestamp_utc)
+        item["_seq"] = self._seq
+        items = [d for d in self._digest if d["event_id"] != event.event_id]
+        items.append(item)
+        # Same order as write_watchlist: newest discovery first, ties by arrival.
+        items.sort(key=lambda d: (d["_discovered"], -d["_seq"]), reverse=True)
+        self._digest = items[:DIGEST_SIZE]
+
+    def expire(self, now_utc: datetime) -> int:
+        """Drop candidates stale at `now_utc`; returns how many were dropped."""
+        now = _iso(now_utc)
+        dropped = 0
+        for ticker in list(self._tickers):
+            cands = self._tickers[ticker]
+            live = [c for c in cands if c.expires_at > now]
+            dropped += len(cands) - len(live)
+            if live:
+                self._tickers[ticker] = live
+            else:
+                del self._tickers[ticker]
+        return dropped
+
+    # --- output ---------------------------------------------------------
+
+    def entries(self, now_utc: datetime) -> List[WatchlistEntry]:
+        now = _iso(now_utc)
+        out: List[WatchlistEntry] = []
+        for ticker, cands in self._tickers.items():
+            top = [c for c in cands if c.expires_at > now][: self._k]
+            if top:
+                out.append(entry_for(ticker, top))
+        return sort_entries(out)
+
+    def digest(self) -> List[Dict[str, Any]]:
+        return [{k: v for k, v in d.items() if not k.startswith("_")} for d in self._digest]
+
+    @property
+    def candidate_count(self) -> int:
+        return sum(len(c) for c in self._tickers.values())
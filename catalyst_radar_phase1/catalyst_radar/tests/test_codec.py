@@ -0,0 +1,63 @@
+import json
+import unittest
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+from enum import Enum
+
+from catalyst_radar.core.codec import event_from_dict, event_to_dict
+from catalyst_radar.core.models import CorroborationFields, FederalAwardFields, GeopoliticsFields
+
+from test_local_jsonl_store import _event
+
+
+def _reference_to_dict(ev):
+    # The asdict-based encoding the ledger format was defined by.
+    def convert(obj):
+        if isinstance(obj, datetime):
+            return obj.astimezone(timezone.utc).isoformat()
+        if isinstance(obj, Enum):
+            return obj.value
+        if isinstance(obj, list):
+            return [convert(v) for v in obj]
+        if isinstance(obj, dict):
+            return {k: convert(v) for k, v in obj.items()}
+        return obj
+
+    return convert(asdict(ev))
+
+
+class TestEventCodec(unittest.TestCase):
+    def _rich_event(self):
+        return replace(
+            _event(1),
+            federal_award=FederalAwardFields(agency="DoD", obligated_amount="1000000"),
+            geopolitics=GeopoliticsFields(region_country_tags=["US"]),
+            corroboration=CorroborationFields(corroborating_sources=[{"name": "x", "url": "https://x"}]),
+        )
+
+    def test_encoding_matches_the_asdict_format(self):
+        ev = self._rich_event()
+        self.assertEqual(json.dumps(event_to_dict(ev)), json.dumps(_reference_to_dict(ev)))
+        self.assertEqual(ev.to_dict(), event_to_dict(ev))
+
+    def test_round_trip_and_interning(self):
+        ev = self._rich_event()
+        d = json.loads(json.dumps(event_to_dict(ev)))
+        self.assertEqual(event_from_dict(d), ev)
+
+        a = event_from_dict(json.loads(json.dumps(event_to_dict(ev))))
+        b = event_from_dict(json.loads(json.dumps(event_to_dict(replace(ev, event_id="other")))))
+        self.assertIs(a.event_timestamp_utc, b.event_timestamp_utc)
+        self.assertIs(a.tickers[0], b.tickers[0])
+
+    def test_encoded_lists_are_copies(self):
+        ev = self._rich_event()
+        d = event_to_dict(ev)
+        d["tickers"].append("XOM")
+        d["corroboration"]["corroborating_sources"][0]["name"] = "changed"
+        self.assertEqual(ev.tickers, ["ACME"])
+        self.assertEqual(ev.corroboration.corroborating_sources[0]["name"], "x")
+
+
+if __name__ == "__main__":
+    unittest.main()
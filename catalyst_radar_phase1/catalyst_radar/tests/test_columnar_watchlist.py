@@ -0,0 +1,86 @@
+import random
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from catalyst_radar.config.settings import Settings
+from catalyst_radar.core.models import Confidence, EventType
+from catalyst_radar.storage.local_jsonl_store import LocalJsonlEventStore
+from catalyst_radar.storage.segmented_store import SegmentedJsonlEventStore
+from catalyst_radar.watchlist import columnar
+from catalyst_radar.watchlist.builder import WatchlistBuilder
+from catalyst_radar.watchlist.columnar import rank_tickers
+
+from test_local_jsonl_store import _event
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _random_events(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    for i in range(n):
+        # Whole days and half days, so staleness boundaries and timestamp ties both occur.
+        ts = NOW - timedelta(hours=12 * rng.randrange(0, 100))
+        event_id = f"ev-{rng.randrange(i + 1)}" if i and rng.random() < 0.1 else ""
+        yield replace(
+            _event(i, event_id=event_id),
+            event_type=rng.choice([EventType.FED_AWARD, EventType.POLITICIAN_DISCLOSURE, EventType.GEOPOLITICS_NEWS]),
+            event_timestamp_utc=ts,
+            confidence=rng.choice(list(Confidence)),
+            tickers=rng.sample(["ACME", "XOM", "LMT", "RTX", "NOC"], rng.randrange(0, 3)),
+            entities=[f"Company {i}"],
+            overall_score=rng.randrange(40, 44),
+            freshness_score=rng.randrange(100),
+            materiality_score=rng.randrange(100),
+            credibility_score=rng.randrange(100),
+        )
+
+
+class TestColumnarWatchlist(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.ledger = Path(self._td.name) / "event_ledger.jsonl"
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def _check(self, store, settings):
+        expected = WatchlistBuilder().build(store.iter_all(), now_utc=NOW, settings=settings)
+        self.assertTrue(expected)
+        self.assertEqual(WatchlistBuilder().build_from_columns(store, now_utc=NOW, settings=settings), expected)
+        cols = store.columns()
+        python = rank_tickers(cols, now_utc=NOW, settings=settings, vectorized=False)
+        if columnar.np is not None:
+            vectorized = rank_tickers(cols, now_utc=NOW, settings=settings, vectorized=True)
+            self.assertEqual(sorted(vectorized, key=lambda t: t.ticker), sorted(python, key=lambda t: t.ticker))
+
+    def test_matches_full_build(self):
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            for ev in _random_events(400):
+                store.append(ev)
+            for settings in (Settings(), replace(Settings(), min_confidence=Confidence.HIGH, min_credibility=50)):
+                self._check(store, settings)
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            store.write_snapshot()
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self._check(store, Settings())
+
+    def test_matches_full_build_across_segments(self):
+        with SegmentedJsonlEventStore(str(self.ledger), max_segment_bytes=20000) as store:
+            for ev in _random_events(300, seed=11):
+                store.append(ev)
+            self.assertGreater(store.segment_count, 2)
+            self._check(store, Settings())
+
+    def test_empty_store(self):
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self.assertEqual(WatchlistBuilder().build_from_columns(store, now_utc=NOW, settings=Settings()), [])
+            self.assertEqual(rank_tickers(store.columns(), now_utc=NOW, settings=Settings(), vectorized=False), [])
+            if columnar.np is not None:
+                self.assertEqual(rank_tickers(store.columns(), now_utc=NOW, settings=Settings(), vectorized=True), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
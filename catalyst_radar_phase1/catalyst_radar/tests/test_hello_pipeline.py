@@ -2,9 +2,12 @@ import json
 import os
 import tempfile
 import unittest
+from dataclasses import replace
 from pathlib import Path
+from unittest import mock
 
 from catalyst_radar.config.settings import Settings
+from catalyst_radar.pipeline import runner as runner_module
 from catalyst_radar.pipeline.runner import PipelineRunner
 
 
@@ -32,6 +35,31 @@ class TestHelloPipeline(unittest.TestCase):
             self.assertIn("watchlist", wl)
             self.assertIn("digest", wl)
 
+    def test_stateless_backend_ranks_the_store(self):
+        fixtures = Path(__file__).resolve().parents[1] / "data" / "fixtures" / "stub_events.json"
+        outputs = []
+        with tempfile.TemporaryDirectory() as td:
+            for stateless in ((), ("sqlite",)):
+                out_dir = Path(td) / f"out{len(outputs)}"
+                settings = replace(
+                    Settings(),
+                    out_dir=str(out_dir),
+                    ledger_backend="sqlite",
+                    sqlite_path=str(out_dir / "events.sqlite"),
+                    watchlist_state_path=str(out_dir / "watchlist_state.json"),
+                    # The fixtures are dated; keep them inside the staleness windows.
+                    news_stale_days=36500,
+                    disclosure_stale_days=36500,
+                )
+                with mock.patch.object(runner_module, "_STATELESS_BACKENDS", stateless):
+                    result = PipelineRunner(settings=settings, fixtures_path=str(fixtures)).run()
+                wl = json.loads(Path(result.watchlist_path).read_text(encoding="utf-8"))
+                outputs.append((wl["watchlist"], wl["digest"], (out_dir / "watchlist_state.json").exists()))
+        (state_wl, state_digest, state_saved), (store_wl, store_digest, store_saved) = outputs
+        self.assertEqual((store_wl, store_digest), (state_wl, state_digest))
+        self.assertTrue(store_wl and store_digest)
+        self.assertEqual((state_saved, store_saved), (True, False))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,78 @@
+import random
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from catalyst_radar.config.settings import Settings
+from catalyst_radar.core.models import Confidence, EventType
+from catalyst_radar.output.writer import digest_item
+from catalyst_radar.watchlist.builder import WatchlistBuilder
+from catalyst_radar.watchlist.incremental import IncrementalWatchlist
+
+from test_local_jsonl_store import _event
+
+T0 = datetime(2025, 10, 1, tzinfo=timezone.utc)
+
+
+def _random_events(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        ts = T0 + timedelta(hours=rng.randrange(0, 24 * 90))
+        out.append(
+            replace(
+                _event(i),
+                event_type=rng.choice([EventType.FED_AWARD, EventType.POLITICIAN_DISCLOSURE]),
+                event_timestamp_utc=ts,
+                discovered_timestamp_utc=ts + timedelta(hours=rng.randrange(0, 48)),
+                tickers=rng.sample(["ACME", "XOM", "LMT", "NOC"], rng.randrange(0, 3)),
+                confidence=rng.choice(list(Confidence)),
+                overall_score=rng.randrange(40, 60),
+                freshness_score=rng.randrange(0, 100),
+            )
+        )
+    return out
+
+
+class TestIncrementalWatchlist(unittest.TestCase):
+    def setUp(self):
+        self.settings = Settings()
+
+    def test_matches_a_full_rebuild_as_time_passes(self):
+        events = _random_events(400)
+        wl = IncrementalWatchlist(self.settings)
+        seen = []
+        for batch_start in range(0, len(events), 50):
+            batch = events[batch_start : batch_start + 50]
+            wl.add_many(batch)
+            seen.extend(batch)
+            now = T0 + timedelta(days=10 + batch_start // 10)
+            wl.expire(now)
+            expected = WatchlistBuilder().build(seen, now_utc=now, settings=self.settings)
+            self.assertEqual(wl.entries(now), expected)
+        self.assertLess(wl.candidate_count, 100)
+        recent = sorted(seen, key=lambda e: e.discovered_timestamp_utc, reverse=True)[:25]
+        self.assertEqual(wl.digest(), [digest_item(e) for e in recent])
+
+    def test_state_round_trip_and_invalidation(self):
+        events = _random_events(60)
+        now = T0 + timedelta(days=60)
+        wl = IncrementalWatchlist(self.settings, source="ledger-a")
+        wl.add_many(events)
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "state.json"
+            wl.save(path)
+            loaded = IncrementalWatchlist.load(path, self.settings, source="ledger-a")
+            self.assertEqual(loaded.entries(now), wl.entries(now))
+            self.assertEqual(loaded.digest(), wl.digest())
+
+            self.assertIsNone(IncrementalWatchlist.load(path, self.settings, source="ledger-b"))
+            self.assertIsNone(IncrementalWatchlist.load(path, replace(self.settings, news_stale_days=7), source="ledger-a"))
+            wl.save(path, dirty=True)
+            self.assertIsNone(IncrementalWatchlist.load(path, self.settings, source="ledger-a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import json
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from catalyst_radar.core.models import Confidence, Event, EventType, SourceType
+from catalyst_radar.storage.local_jsonl_store import LocalJsonlEventStore
+
+
+def _event(i: int, *, event_id: str = "") -> Event:
+    ts = datetime(2025, 12, 1, tzinfo=timezone.utc)
+    return Event(
+        event_id=event_id or f"ev-{i}",
+        event_type=EventType.FED_AWARD,
+        title=f"Award {i}",
+        summary="Stub award.",
+        event_timestamp_utc=ts,
+        discovered_timestamp_utc=ts,
+        source_type=SourceType.GOV,
+        source_name="stub",
+        source_url=f"https://example.com/{i}",
+        source_hash=f"hash-{i}",
+        entities=["Acme"],
+        tickers=["ACME"],
+        theme_tags=[],
+        confidence=Confidence.MEDIUM,
+        confidence_rationale="TBD",
+        credibility_score=50,
+        freshness_score=50,
+        materiality_score=50,
+        overall_score=50,
+    )
+
+
+class TestLocalJsonlEventStore(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.ledger = Path(self._td.name) / "event_ledger.jsonl"
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def _fill(self, n: int) -> None:
+        store = LocalJsonlEventStore(str(self.ledger))
+        for i in range(n):
+            store.append(_event(i))
+        store.close()
+
+    def test_reopen_answers_from_index(self):
+        self._fill(5)
+        store = LocalJsonlEventStore(str(self.ledger))
+        self.assertTrue(store.has_source_hash("hash-3"))
+        self.assertFalse(store.has_source_hash("hash-9"))
+        self.assertEqual(store.get("ev-2").title, "Award 2")
+        self.assertIsNone(store.get("ev-9"))
+        self.assertEqual([e.event_id for e in store.iter_all()], [f"ev-{i}" for i in range(5)])
+        store.close()
+
+    def test_get_after_append_sees_grown_ledger(self):
+        store = LocalJsonlEventStore(str(self.ledger))
+        store.append(_event(0))
+        self.assertEqual(store.get("ev-0").title, "Award 0")
+        store.append(_event(1))
+        self.assertEqual(store.get("ev-1").title, "Award 1")
+        store.close()
+
+    def test_missing_or_torn_index_is_rebuilt_from_ledger(self):
+        self._fill(3)
+        index = Path(str(self.ledger) + ".idx")
+        index.unlink()
+        store = LocalJsonlEventStore(str(self.ledger))
+        self.assertEqual(store.get("ev-1").title, "Award 1")
+        store.close()
+        self.assertEqual(len(index.read_text(encoding="utf-8").splitlines()), 3)
+
+        with index.open("ab") as f:
+            f.write(b"[12")
+        with self.ledger.open("ab") as f:
+            f.write(json.dumps(_event(3).to_dict()).encode("utf-8") + b"\n")
+        store = LocalJsonlEventStore(str(self.ledger))
+        self.assertTrue(store.has_source_hash("hash-3"))
+        store.append(_event(4))
+        store.close()
+        reopened = LocalJsonlEventStore(str(self.ledger))
+        self.assertEqual(len(list(reopened.iter_all())), 5)
+        reopened.close()
+
+    def test_buffered_appends_reach_disk_on_flush_and_close(self):
+        with LocalJsonlEventStore(str(self.ledger), fsync="never", batch_size=10) as store:
+            for i in range(3):
+                store.append(_event(i))
+            self.assertEqual(self.ledger.stat().st_size, 0)
+            self.assertEqual(store.get("ev-1").title, "Award 1")  # reads flush first
+            self.assertEqual(len(self.ledger.read_text(encoding="utf-8").splitlines()), 3)
+            store.append(_event(3))
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self.assertEqual(len(list(store.iter_all())), 4)
+
+    def test_unknown_fsync_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            LocalJsonlEventStore(str(self.ledger), fsync="sometimes")
+
+    def test_latest_line_wins_for_repeated_event_id(self):
+        store = LocalJsonlEventStore(str(self.ledger))
+        store.append(_event(0))
+        store.append(_event(1, event_id="ev-0"))
+        store.close()
+        store = LocalJsonlEventStore(str(self.ledger))
+        self.assertEqual(store.get("ev-0").title, "Award 1")
+        self.assertEqual(len(list(store.iter_all())), 1)
+        store.close()
+
+    def test_ticker_time_index_range_queries(self):
+        day = lambda d: datetime(2025, 12, d, tzinfo=timezone.utc)
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            store.append(replace(_event(1), event_timestamp_utc=day(10), tickers=["ACME", "XOM"]))
+            store.append(replace(_event(2), event_timestamp_utc=day(5), tickers=["ACME"]))
+            store.append(replace(_event(3), event_timestamp_utc=day(20), tickers=["XOM"]))
+            store.append(replace(_event(4), event_id="ev-2", event_timestamp_utc=day(25), tickers=["XOM"]))
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self.assertEqual(sorted(store.tickers()), ["ACME", "XOM"])
+            self.assertEqual([e.event_id for e in store.iter_ticker_range("ACME")], ["ev-1"])
+            self.assertEqual([e.event_id for e in store.iter_ticker_range("XOM", day(8))], ["ev-1", "ev-3", "ev-2"])
+            self.assertEqual([e.event_id for e in store.iter_ticker_range("XOM", day(8), day(20))], ["ev-1"])
+            self.assertEqual(list(store.iter_ticker_range("LMT")), [])
+
+    def test_index_without_ticker_fields_is_rebuilt(self):
+        self._fill(2)
+        index = Path(str(self.ledger) + ".idx")
+        index.write_text('[0, 10, "ev-0", "hash-0"]\n', encoding="utf-8")
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self.assertEqual([e.event_id for e in store.iter_ticker_range("ACME")], ["ev-0", "ev-1"])
+        self.assertEqual(len(json.loads(index.read_text(encoding="utf-8").splitlines()[0])), 6)
+
+    def test_build_from_store_matches_full_build(self):
+        from catalyst_radar.config.settings import Settings
+        from catalyst_radar.watchlist.builder import WatchlistBuilder
+
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        settings = Settings()
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            for i in range(40):
+                ts = now - timedelta(days=2 * i)
+                store.append(replace(_event(i), event_timestamp_utc=ts, overall_score=40 + i % 7, tickers=[["ACME"], ["XOM"], ["ACME", "LMT"]][i % 3]))
+            full = WatchlistBuilder().build(store.iter_all(), now_utc=now, settings=settings)
+            windowed = WatchlistBuilder().build_from_store(store, now_utc=now, settings=settings)
+        self.assertEqual(windowed, full)
+        self.assertEqual(sorted(w.ticker for w in full), ["ACME", "LMT", "XOM"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import csv
+import io
+import json
+import unittest
+import uuid
+from datetime import datetime, timezone
+
+from catalyst_radar.core.models import EventType, SourceType
+from catalyst_radar.storage.postgres_store import (
+    PHASE1_KEY,
+    copy_payload,
+    event_from_row,
+    pg_event_id,
+    source_digest,
+)
+
+from test_local_jsonl_store import _event
+
+
+class TestPostgresMapping(unittest.TestCase):
+    """Row mapping only; the SQL paths need a Phase 2 database."""
+
+    def test_ids_and_digests(self):
+        self.assertEqual(pg_event_id("ev-1"), pg_event_id("ev-1"))
+        self.assertNotEqual(pg_event_id("ev-1"), pg_event_id("ev-2"))
+        u = uuid.uuid4()
+        self.assertEqual(pg_event_id(str(u)), u)
+        self.assertEqual(source_digest("ab" * 32), bytes.fromhex("ab" * 32))
+        self.assertEqual(len(source_digest("hash-1")), 32)
+
+    def test_copy_payload_round_trips_the_event(self):
+        ev = _event(1)
+        (row,) = list(csv.reader(io.StringIO(copy_payload([ev]))))
+        self.assertEqual(row[0], str(pg_event_id("ev-1")))
+        self.assertEqual(row[1], "\\x" + source_digest("hash-1").hex())
+        details = json.loads(row[17])
+        self.assertEqual(json.loads(row[19]), ev.tickers)
+
+        db_row = (row[0], "FED_AWARD", "", "", None, None, "GOV", "", "", b"", [], "LOW", 0, 0, 0, 0, details, None)
+        self.assertEqual(event_from_row(db_row), ev)
+
+    def test_phase4_rows_are_mapped_from_columns(self):
+        ts = datetime(2025, 12, 1, tzinfo=timezone.utc)
+        u = uuid.uuid4()
+        row = (
+            u, "POLITICIAN_DISCLOSURE", "PTR", "summary", ts, ts, "congress", "House", "https://x",
+            b"\x01" * 32, ["defense"], "MEDIUM", 60, 70, 80, 75,
+            {"entities": [{"name": "ACME Corp"}]}, ["ACME"],
+        )
+        ev = event_from_row(row)
+        self.assertEqual(ev.event_id, str(u))
+        self.assertEqual(ev.event_type, EventType.POLITICIAN_DISCLOSURE)
+        self.assertEqual(ev.source_type, SourceType.OTHER_PUBLIC)
+        self.assertEqual(ev.source_hash, "01" * 32)
+        self.assertEqual((ev.entities, ev.tickers), (["ACME Corp"], ["ACME"]))
+        self.assertNotIn(PHASE1_KEY, row[16])
+
+
+if __name__ == "__main__":
+    unittest.main()
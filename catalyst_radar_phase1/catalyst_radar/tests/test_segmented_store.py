@@ -0,0 +1,99 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+from catalyst_radar.storage.bloom import BloomFilter
+from catalyst_radar.storage.segmented_store import SegmentedJsonlEventStore
+
+from test_local_jsonl_store import _event
+
+
+class TestBloomFilter(unittest.TestCase):
+    def test_no_false_negatives_and_low_false_positive_rate(self):
+        bf = BloomFilter.of((f"k{i}" for i in range(2000)), 2000, fp_rate=0.01)
+        self.assertTrue(all(f"k{i}" in bf for i in range(2000)))
+        fp = sum(f"x{i}" in bf for i in range(10000))
+        self.assertLess(fp, 300)
+        self.assertEqual(BloomFilter.from_bytes(bf.to_bytes()).bits, bf.bits)
+
+
+class TestSegmentedJsonlEventStore(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.ledger = Path(self._td.name) / "event_ledger.jsonl"
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def _open(self, **kw):
+        return SegmentedJsonlEventStore(str(self.ledger), max_segment_bytes=2000, **kw)
+
+    def test_rotation_and_lookups_across_segments(self):
+        with self._open() as store:
+            for i in range(10):
+                store.append(_event(i))
+            self.assertGreater(store.segment_count, 2)
+        self.assertTrue((Path(self._td.name) / "event_ledger.000001.jsonl.bloom").exists())
+
+        with self._open() as store:
+            self.assertTrue(store.has_source_hash("hash-0"))
+            self.assertFalse(store.has_source_hash("hash-99"))
+            self.assertEqual(store.get("ev-1").title, "Award 1")
+            self.assertIsNone(store.get("ev-99"))
+            self.assertEqual([e.event_id for e in store.iter_all()], [f"ev-{i}" for i in range(10)])
+
+    def test_compact_merges_segments_and_drops_superseded_lines(self):
+        with self._open() as store:
+            for i in range(6):
+                store.append(_event(i))
+            store.rotate()
+            store.append(_event(10, event_id="ev-0"))  # newer version in another segment
+            store.rotate()
+            before = store.segment_count
+            stats = store.compact()
+        self.assertEqual(stats.segments_before, before)
+        self.assertEqual(stats.segments_after, 2)
+        self.assertEqual(stats.lines_before, 7)
+        self.assertEqual(stats.lines_after, 6)
+
+        with self._open() as store:
+            self.assertEqual(store.segment_count, 2)
+            self.assertEqual(store.get("ev-0").title, "Award 10")
+            self.assertTrue(store.has_source_hash("hash-5"))
+            self.assertEqual(sorted(e.event_id for e in store.iter_all()), [f"ev-{i}" for i in range(6)])
+
+    def test_missing_bloom_is_rebuilt(self):
+        with self._open() as store:
+            for i in range(10):
+                store.append(_event(i))
+        bloom = Path(self._td.name) / "event_ledger.000001.jsonl.bloom"
+        bloom.unlink()
+        with self._open() as store:
+            self.assertTrue(store.has_source_hash("hash-0"))
+        self.assertTrue(bloom.exists())
+
+    def test_ticker_range_spans_segments_and_skips_superseded_versions(self):
+        day = lambda d: datetime(2025, 12, d, tzinfo=timezone.utc)
+        with self._open() as store:
+            for i in range(8):
+                store.append(replace(_event(i), event_timestamp_utc=day(i + 1), tickers=["ACME"] if i % 2 else ["XOM"]))
+            store.rotate()
+            store.append(replace(_event(20), event_id="ev-1", event_timestamp_utc=day(30), tickers=["XOM"]))
+            self.assertGreater(store.segment_count, 2)
+        span = Path(self._td.name) / "event_ledger.000001.jsonl.span"
+        span.unlink()  # rebuilt on open
+
+        with self._open() as store:
+            self.assertTrue(span.exists())
+            self.assertEqual(store.tickers(), {"ACME", "XOM"})
+            self.assertEqual([e.event_id for e in store.iter_ticker_range("ACME")], ["ev-3", "ev-5", "ev-7"])
+            self.assertEqual([e.event_id for e in store.iter_ticker_range("XOM", day(5))], ["ev-4", "ev-6", "ev-1"])
+            store.compact()
+            self.assertEqual([e.event_id for e in store.iter_ticker_range("ACME", day(5), day(7))], ["ev-5"])
+        self.assertEqual(len(list(Path(self._td.name).glob("*.span"))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
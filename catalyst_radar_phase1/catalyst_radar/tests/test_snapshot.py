@@ -0,0 +1,100 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from catalyst_radar.storage.local_jsonl_store import LocalJsonlEventStore
+from catalyst_radar.storage.segmented_store import SegmentedJsonlEventStore
+from catalyst_radar.storage.snapshot import read_snapshot
+
+from test_local_jsonl_store import _event
+
+
+class TestLedgerSnapshot(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.ledger = Path(self._td.name) / "event_ledger.jsonl"
+        self.snap = Path(str(self.ledger) + ".snap")
+        self.index = Path(str(self.ledger) + ".idx")
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def _fill(self, ids, **kw):
+        with LocalJsonlEventStore(str(self.ledger), **kw) as store:
+            for i in ids:
+                store.append(replace(_event(i), tickers=["ACME", "XOM"] if i % 2 else ["ACME"]))
+
+    def test_round_trip(self):
+        self._fill(range(5))
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self.assertEqual(store.write_snapshot(), 5)
+        snap = read_snapshot(self.snap)
+        self.assertEqual(snap.ledger_end, self.ledger.stat().st_size)
+        self.assertEqual(snap.columns.event_ids, [f"ev-{i}" for i in range(5)])
+        self.assertEqual(snap.columns.tickers_of(1), ["ACME", "XOM"])
+        self.assertEqual(list(snap.columns.cols["overall_score"]), [50] * 5)
+
+    def test_tail_after_snapshot_is_replayed(self):
+        self._fill(range(3))
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            store.write_snapshot()
+            store.append(_event(3))
+            store.append(_event(4, event_id="ev-0"))
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self.assertEqual(store.get("ev-0").title, "Award 4")
+            self.assertTrue(store.has_source_hash("hash-3"))
+            self.assertEqual([e.event_id for e in store.iter_all()], ["ev-0", "ev-1", "ev-2", "ev-3"])
+            self.assertEqual([e.event_id for e in store.iter_ticker_range("XOM")], ["ev-1"])
+            self.assertEqual(store.columns().event_ids, ["ev-0", "ev-1", "ev-2", "ev-3"])
+            store.write_snapshot()
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self.assertEqual([e.event_id for e in store.iter_all()], ["ev-0", "ev-1", "ev-2", "ev-3"])
+            self.assertEqual(store.get("ev-0").title, "Award 4")
+
+    def test_close_writes_snapshot_every_n_events(self):
+        self._fill(range(3), snapshot_every=5)
+        self.assertFalse(self.snap.exists())
+        self._fill(range(3, 6), snapshot_every=5)
+        self.assertEqual(len(read_snapshot(self.snap).columns), 6)
+
+    def test_index_out_of_step_is_rewritten(self):
+        self._fill(range(3))
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            store.write_snapshot()
+        self.index.write_text("", encoding="utf-8")
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self.assertEqual(store.get("ev-2").title, "Award 2")
+        self.assertEqual(len(self.index.read_text(encoding="utf-8").splitlines()), 3)
+
+    def test_damaged_or_stale_snapshot_is_ignored(self):
+        self._fill(range(3))
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            store.write_snapshot()
+        data = bytearray(self.snap.read_bytes())
+        data[-1] ^= 0xFF
+        self.snap.write_bytes(bytes(data))
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self.assertEqual(len(list(store.iter_all())), 3)
+
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            store.write_snapshot()
+        self.ledger.write_text("", encoding="utf-8")
+        self.index.unlink()
+        self._fill([7])
+        with LocalJsonlEventStore(str(self.ledger)) as store:
+            self.assertEqual([e.event_id for e in store.iter_all()], ["ev-7"])
+
+    def test_sealed_segments_get_a_snapshot(self):
+        with SegmentedJsonlEventStore(str(self.ledger), max_segment_bytes=2000) as store:
+            for i in range(10):
+                store.append(_event(i))
+        sealed = Path(self._td.name) / "event_ledger.000001.jsonl.snap"
+        self.assertTrue(sealed.exists())
+        self.assertGreater(len(read_snapshot(sealed).columns), 0)
+        with SegmentedJsonlEventStore(str(self.ledger), max_segment_bytes=2000) as store:
+            self.assertEqual([e.event_id for e in store.iter_all()], [f"ev-{i}" for i in range(10)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from catalyst_radar.sources.concurrent_fetch import fetch_all
+from catalyst_radar.sources.fixtures_loader import clear_fixture_cache, load_fixture_raw_events
+
+
+def _row(i: int) -> dict:
+    return {
+        "source_name": "fixture",
+        "source_url": f"https://example.com/{i}",
+        "source_type": "GOV",
+        "discovered_timestamp_utc": "2025-12-01T00:00:00Z",
+        "payload": {"event_type": "FED_AWARD"},
+    }
+
+
+class _Source:
+    def __init__(self, name, result=None, *, block=None, delay=0.0, error=None, timeout_s=None):
+        self.name = name
+        self._result = result or []
+        self._block = block
+        self._delay = delay
+        self._error = error
+        if timeout_s is not None:
+            self.timeout_s = timeout_s
+
+    def fetch(self, *, since_utc=None):
+        if self._block is not None:
+            self._block.wait(5)
+        time.sleep(self._delay)
+        if self._error:
+            raise RuntimeError(self._error)
+        return self._result
+
+
+class TestFixtureCache(unittest.TestCase):
+    def setUp(self):
+        clear_fixture_cache()
+        self._td = tempfile.TemporaryDirectory()
+        self.path = Path(self._td.name) / "events.json"
+        self.path.write_text(json.dumps([_row(1), _row(2)]), encoding="utf-8")
+
+    def tearDown(self):
+        self._td.cleanup()
+        clear_fixture_cache()
+
+    def test_parsed_once_until_the_file_changes(self):
+        a = load_fixture_raw_events(self.path)
+        b = load_fixture_raw_events(str(self.path))
+        self.assertIsNot(a, b)
+        self.assertIs(a[0], b[0])
+
+        self.path.write_text(json.dumps([_row(3)]), encoding="utf-8")
+        st = self.path.stat()
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        c = load_fixture_raw_events(self.path)
+        self.assertEqual([e.source_url for e in c], ["https://example.com/3"])
+
+
+class TestFetchAll(unittest.TestCase):
+    def test_results_keep_source_order_and_isolate_failures(self):
+        release = threading.Event()
+        try:
+            sources = [
+                _Source("slow", ["late"], block=release, timeout_s=0.1),
+                _Source("ok", ["a", "b"]),
+                _Source("broken", error="boom"),
+            ]
+            results = fetch_all(sources, timeout_s=2)
+        finally:
+            release.set()
+        self.assertEqual([r.source for r in results], ["slow", "ok", "broken"])
+        self.assertEqual(results[0].events, [])
+        self.assertIn("timeout", results[0].error)
+        self.assertEqual(results[1].events, ["a", "b"])
+        self.assertIsNone(results[1].error)
+        self.assertEqual(results[2].error, "boom")
+
+    def test_budget_starts_when_the_fetch_starts(self):
+        # One worker: "queued" waits 0.3s behind "first" but only runs for a moment itself.
+        sources = [
+            _Source("first", ["a"], delay=0.3, timeout_s=2),
+            _Source("queued", ["b"], timeout_s=0.2),
+        ]
+        results = fetch_all(sources, max_workers=1)
+        self.assertEqual([r.error for r in results], [None, None])
+        self.assertEqual([r.events for r in results], [["a"], ["b"]])
+
+    def test_queued_sources_fail_when_workers_are_stuck(self):
+        release = threading.Event()
+        try:
+            sources = [_Source("stuck", block=release, timeout_s=0.1), _Source("queued", ["b"])]
+            results = fetch_all(sources, max_workers=1)
+        finally:
+            release.set()
+        self.assertIn("timeout", results[0].error)
+        self.assertIn("not started", results[1].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from catalyst_radar.storage.sqlite_store import SqliteEventStore
+
+from test_local_jsonl_store import _event
+
+
+def _at(i: int, day: int, tickers=("ACME",)):
+    ts = datetime(2025, 12, day, tzinfo=timezone.utc)
+    return replace(_event(i), event_timestamp_utc=ts, tickers=list(tickers))
+
+
+class TestSqliteEventStore(unittest.TestCase):
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.db = str(Path(self._td.name) / "events.sqlite")
+
+    def tearDown(self):
+        self._td.cleanup()
+
+    def test_append_get_and_dedupe_lookups(self):
+        with SqliteEventStore(self.db) as store:
+            self.assertEqual(store.append_many([_event(i) for i in range(3)]), 3)
+            store.append(_event(3))
+        with SqliteEventStore(self.db) as store:
+            self.assertTrue(store.has_source_hash("hash-3"))
+            self.assertFalse(store.has_source_hash("hash-9"))
+            self.assertEqual(store.get("ev-1").title, "Award 1")
+            self.assertIsNone(store.get("ev-9"))
+            self.assertEqual([e.event_id for e in store.iter_all()], [f"ev-{i}" for i in range(4)])
+
+    def test_range_scans(self):
+        with SqliteEventStore(self.db) as store:
+            store.append_many([_at(1, 5), _at(2, 10, ("ACME", "XOM")), _at(3, 20, ("XOM",))])
+            start = datetime(2025, 12, 8, tzinfo=timezone.utc)
+            self.assertEqual([e.event_id for e in store.iter_range(start)], ["ev-2", "ev-3"])
+            self.assertEqual([e.event_id for e in store.iter_range(None, start)], ["ev-1"])
+            self.assertEqual([e.event_id for e in store.iter_ticker_range("XOM")], ["ev-2", "ev-3"])
+            self.assertEqual(
+                [e.event_id for e in store.iter_ticker_range("ACME", start, start + timedelta(days=5))],
+                ["ev-2"],
+            )
+
+    def test_replacing_an_event_moves_its_ticker_links(self):
+        with SqliteEventStore(self.db) as store:
+            store.append(_at(1, 5, ("ACME",)))
+            store.append(replace(_at(1, 6, ("XOM",)), title="Corrected"))
+            self.assertEqual(list(store.iter_ticker_range("ACME")), [])
+            self.assertEqual([e.title for e in store.iter_ticker_range("XOM")], ["Corrected"])
+
+    def test_build_from_store_keeps_ledger_order_on_ties(self):
+        from catalyst_radar.config.settings import Settings
+        from catalyst_radar.watchlist.builder import WatchlistBuilder
+
+        now = datetime(2025, 12, 6, tzinfo=timezone.utc)
+        settings = Settings()
+        with SqliteEventStore(self.db) as store:
+            # Same score and timestamp: only the append order separates them.
+            store.append_many([_at(9, 5), _at(1, 5), _at(5, 5, ("ACME", "XOM"))])
+            full = WatchlistBuilder().build(store.iter_all(), now_utc=now, settings=settings)
+            windowed = WatchlistBuilder().build_from_store(store, now_utc=now, settings=settings)
+        self.assertEqual(windowed, full)
+        self.assertEqual(full[1].top_events, ["ev-9", "ev-1", "ev-5"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,13 @@
+-- Phase 3 (Ingestion) - per-record digest index for bulk downloads
+-- Safe to run multiple times.
+
+-- record_key -> record_digest of the last bulk snapshot, per source.
+-- Truncated SHA-256 (16 bytes) keeps the index compact.
+CREATE TABLE IF NOT EXISTS bulk_record_digests (
+  source_name          TEXT NOT NULL,
+  record_key           BYTEA NOT NULL CHECK (octet_length(record_key) = 16),
+  record_digest        BYTEA NOT NULL CHECK (octet_length(record_digest) = 16),
+  last_run_id          UUID,
+  updated_at_utc       TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (source_name, record_key)
+);
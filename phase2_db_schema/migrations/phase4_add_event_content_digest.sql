@@ -0,0 +1,8 @@
+-- Phase 4 (Normalization) - content digest for event dedupe
+-- Safe to run multiple times.
+
+-- SHA-256 of an event's content fields (scores and discovery time excluded).
+-- Lets the normalizer skip rewriting events that have not changed.
+-- Nullable: rows written before this column existed are rewritten once.
+ALTER TABLE events
+  ADD COLUMN IF NOT EXISTS content_digest BYTEA CHECK (octet_length(content_digest) = 32);
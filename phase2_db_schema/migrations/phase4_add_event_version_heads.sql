@@ -0,0 +1,12 @@
+-- Phase 4 (Normalization) - event version index
+-- Safe to run multiple times.
+
+-- version_key -> latest version of that event. New versions link to it via
+-- events.supersedes_event_id and the previous version is marked is_suppressed.
+CREATE TABLE IF NOT EXISTS event_version_heads (
+  version_key          BYTEA PRIMARY KEY CHECK (octet_length(version_key) = 32),
+  event_id             UUID NOT NULL REFERENCES events(event_id) ON DELETE CASCADE,
+  version              INT NOT NULL CHECK (version >= 1),
+  content_digest       BYTEA CHECK (octet_length(content_digest) = 32),
+  updated_at_utc       TIMESTAMPTZ NOT NULL DEFAULT now()
+);
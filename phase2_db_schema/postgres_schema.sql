@@ -60,6 +60,17 @@ CREATE INDEX IF NOT EXISTS ix_raw_documents_source
 CREATE INDEX IF NOT EXISTS ix_raw_documents_canonical_url
   ON raw_documents (canonical_url);
 
+-- Per-record digests of the last bulk snapshot (Phase 3 delta detection):
+-- only records whose digest changed are re-emitted as raw_documents.
+CREATE TABLE IF NOT EXISTS bulk_record_digests (
+  source_name          TEXT NOT NULL,
+  record_key           BYTEA NOT NULL CHECK (octet_length(record_key) = 16),
+  record_digest        BYTEA NOT NULL CHECK (octet_length(record_digest) = 16),
+  last_run_id          UUID,
+  updated_at_utc       TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (source_name, record_key)
+);
+
 
 -- =========================
 -- entities
@@ -156,6 +167,7 @@ CREATE TABLE IF NOT EXISTS events (
   details_json           JSONB,
   ambiguity_notes        TEXT,
   event_fingerprint      BYTEA NOT NULL CHECK (octet_length(event_fingerprint) = 32),
+  content_digest         BYTEA CHECK (octet_length(content_digest) = 32),
   version                INT NOT NULL DEFAULT 1 CHECK (version >= 1),
   supersedes_event_id    UUID REFERENCES events(event_id),
   is_suppressed          BOOLEAN NOT NULL DEFAULT FALSE,
@@ -183,6 +195,16 @@ CREATE INDEX IF NOT EXISTS ix_events_not_suppressed
 CREATE INDEX IF NOT EXISTS ix_events_theme_tags
   ON events USING GIN (theme_tags);
 
+-- Latest version of each event (Phase 4 versioning): version_key is the hash of the
+-- stable identity shared by all versions (award id, accession, person+transaction).
+CREATE TABLE IF NOT EXISTS event_version_heads (
+  version_key          BYTEA PRIMARY KEY CHECK (octet_length(version_key) = 32),
+  event_id             UUID NOT NULL REFERENCES events(event_id) ON DELETE CASCADE,
+  version              INT NOT NULL CHECK (version >= 1),
+  content_digest       BYTEA CHECK (octet_length(content_digest) = 32),
+  updated_at_utc       TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
 CREATE INDEX IF NOT EXISTS ix_events_details_json
   ON events USING GIN (details_json);
 
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .bulk_records import iter_bulk_members
+from .db import execute_values, iter_rows
+from .models import RawRecord, RunStats
+from .utils import now_utc, sha256_bytes, stable_json_dumps
+
+# Keys and digests are truncated SHA-256 (16 bytes): the index stays ~50 bytes per record.
+DIGEST_BYTES = 16
+
+# Fields that identify a disclosure transaction; everything else (amount, comments, ...)
+# is content, so a correction shows up as a changed record rather than a new one.
+KEY_FIELDS = (
+    "transaction_id",
+    "ptr_id",
+    "report_id",
+    "filing_id",
+    "reporting_person",
+    "owner",
+    "transaction_date",
+    "ticker",
+    "asset_description",
+    "transaction_type",
+)
+
+SQL_LOAD = "SELECT record_key, record_digest FROM bulk_record_digests WHERE source_name = %s"
+
+SQL_UPSERT = "INSERT INTO bulk_record_digests (source_name, record_key, record_digest, last_run_id, updated_at_utc)"
+
+UPSERT_TEMPLATE = "(%s, %s, %s, %s::uuid, now())"
+
+SQL_UPSERT_CONFLICT = """
+ON CONFLICT (source_name, record_key)
+DO UPDATE SET
+  record_digest = EXCLUDED.record_digest,
+  last_run_id = EXCLUDED.last_run_id,
+  updated_at_utc = now()
+"""
+
+RECORD_SOURCE_NAME = "senate_disclosure_record"
+
+
+def record_key(rec: Dict[str, Any]) -> bytes:
+    ident = [str(rec.get(f) or "").strip().lower() for f in KEY_FIELDS]
+    return sha256_bytes("|".join(ident).encode("utf-8"))[:DIGEST_BYTES]
+
+
+def record_digest(rec: Dict[str, Any]) -> bytes:
+    return sha256_bytes(stable_json_dumps(rec).encode("utf-8"))[:DIGEST_BYTES]
+
+
+def load_digests(conn: Any, source_name: str) -> Dict[bytes, bytes]:
+    return {bytes(k): bytes(d) for k, d in iter_rows(conn, SQL_LOAD, (source_name,), name="bulk_digests", itersize=10000)}
+
+
+def save_digests(conn: Any, source_name: str, rows: List[Tuple[bytes, bytes]], run_id: str) -> None:
+    if rows:
+        execute_values(
+            conn,
+            SQL_UPSERT,
+            [(source_name, k, d, run_id) for k, d in rows],
+            UPSERT_TEMPLATE,
+            SQL_UPSERT_CONFLICT,
+        )
+
+
+def iter_bulk_delta(
+    bulk: RawRecord,
+    known: Dict[bytes, bytes],
+    stats: Optional[RunStats] = None,
+    *,
+    run_id: str,
+) -> Iterator[Tuple[RawRecord, bytes, bytes]]:
+    """
+    Yield (record, key, digest) for each record of a bulk download that is new or
+    changed relative to `known` (record key -> digest from the previous snapshot).
+    Each record becomes its own JSON RawRecord; its record_id includes the digest and
+    the ingestion run, so every change is stored as a new raw document, including a
+    revert to content stored before (A -> B -> A).
+    """
+    seen: Dict[bytes, int] = {}
+    fetched = now_utc()
+    for member, rec in iter_bulk_members(bulk.raw_bytes or (bulk.text or "").encode("utf-8")):
+        key = record_key(rec)
+        # Identical identities within one snapshot (split fills, repeated rows) are told apart by ordinal.
+        n = seen.get(key, 0)
+        seen[key] = n + 1
+        if n:
+            key = sha256_bytes(key + n.to_bytes(4, "big"))[:DIGEST_BYTES]
+
+        digest = record_digest(rec)
+        if known.get(key) == digest:
+            if stats is not None:
+                stats.unchanged += 1
+            continue
+        yield (
+            RawRecord(
+                source_type=bulk.source_type,
+                source_name=RECORD_SOURCE_NAME,
+                url=bulk.url,
+                record_id=f"{key.hex()}:{digest.hex()}:{run_id}",
+                fetched_at_utc=fetched,
+                title=None,
+                mime_type="application/json",
+                text=stable_json_dumps(rec),
+                http_status=bulk.http_status,
+                canonical_url=bulk.canonical_url,
+                meta={"kind": "bulk_record", "bulk_url": bulk.url, "member": member, "change": "changed" if key in known else "added"},
+            ),
+            key,
+            digest,
+        )
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import csv
+import io
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+
+_ZIP_MAGIC = b"PK\x03\x04"
+_CAMEL_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+
+# Senate field names -> the keys _map_politician looks for (applied only when the target is absent).
+_ALIASES = {
+    "asset_name": "asset_description",
+    "filer_name": "reporting_person",
+    "date_received": "filing_date",
+    "report_date": "filing_date",
+    "filed_date": "filing_date",
+    "amount_range": "amount_band",
+}
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _snake(key: str) -> str:
+    return _NON_WORD_RE.sub("_", _CAMEL_RE.sub("_", key.strip()).lower()).strip("_")
+
+
+def normalize_record(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """snake_case the keys of one Senate record and fill in the names _map_politician expects."""
+    rec: Dict[str, Any] = {}
+    for k, v in fields.items():
+        if k is None:
+            continue
+        v = v.strip() if isinstance(v, str) else v
+        if v not in (None, ""):
+            rec[_snake(k)] = v
+    for src, dst in _ALIASES.items():
+        if src in rec and dst not in rec:
+            rec[dst] = rec[src]
+    if "reporting_person" not in rec:
+        first = rec.get("first_name") or rec.get("filer_first_name") or ""
+        last = rec.get("last_name") or rec.get("filer_last_name") or ""
+        if first or last:
+            rec["reporting_person"] = f"{first} {last}".strip()
+    return rec
+
+
+def iter_xml_records(stream: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    """
+    Incrementally parse an XML stream and yield one flat dict per record.
+
+    A record is an element whose children are all leaves (e.g. <Transaction>).
+    Leaf fields of its ancestors (filer name, report date on the enclosing <Filing>)
+    are merged in. Emitted records, and containers once they end, are detached from
+    their parent, so memory stays bounded by the depth of the document, not its length.
+    """
+    # Each stack entry: [element, had_record_child]
+    stack: List[List[Any]] = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            stack.append([elem, False])
+            continue
+        _, had_records = stack.pop()
+        children = list(elem)
+        if had_records:
+            # A finished container of records (e.g. <Filing>): its fields were merged into
+            # the records already, so drop it like an emitted record.
+            if stack:
+                stack[-1][1] = True
+                stack[-1][0].remove(elem)
+            elem.clear()
+            continue
+        if not children or any(len(c) for c in children):
+            # Leaves stay attached for their parent.
+            continue
+
+        fields: Dict[str, Any] = {}
+        for anc, _ in stack:
+            for c in anc:
+                if len(c) == 0 and c.text and c.text.strip():
+                    fields[_local(c.tag)] = c.text
+        fields.update({_local(k): v for k, v in elem.attrib.items()})
+        fields.update({_local(c.tag): c.text for c in children})
+        yield normalize_record(fields)
+
+        if stack:
+            stack[-1][1] = True
+            stack[-1][0].remove(elem)
+        elem.clear()
+
+
+def iter_csv_records(stream: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace", newline="")
+    for row in csv.DictReader(text):
+        yield normalize_record(row)
+
+
+def _member_kind(name: str) -> Optional[str]:
+    lower = name.lower()
+    if lower.endswith(".xml"):
+        return "xml"
+    if lower.endswith((".csv", ".txt")):
+        return "csv"
+    return None
+
+
+def iter_bulk_members(data: bytes) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield (member_name, record) for every record in a Senate bulk download.
+
+    `data` is a zip archive (members are decompressed one at a time as streams,
+    never extracted in full), or a bare XML / CSV document.
+    """
+    try:
+        if data[:4] == _ZIP_MAGIC:
+            with zipfile.ZipFile(io.BytesIO(data)) as zf:
+                for info in zf.infolist():
+                    kind = _member_kind(info.filename)
+                    if info.is_dir() or kind is None:
+                        continue
+                    with zf.open(info) as member:
+                        records = iter_xml_records(member) if kind == "xml" else iter_csv_records(member)
+                        for rec in records:
+                            yield info.filename, rec
+            return
+        head = data[:512].lstrip(b"\xef\xbb\xbf \t\r\n")
+        records = iter_xml_records(io.BytesIO(data)) if head.startswith(b"<") else iter_csv_records(io.BytesIO(data))
+        for rec in records:
+            yield "", rec
+    except (zipfile.BadZipFile, csv.Error, EOFError) as e:
+        raise ValueError(f"unreadable bulk download: {e}") from e
+
+
+def iter_senate_records(data: bytes) -> Iterator[Dict[str, Any]]:
+    for _, rec in iter_bulk_members(data):
+        yield rec
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import re
 
 from bs4 import BeautifulSoup
@@ -46,26 +47,32 @@ class PoliticianDisclosuresConnector(Connector):
     def fetch_batch(self, checkpoint: Checkpoint, limit: int) -> tuple[list[RawRecord], Checkpoint]:
         records: list[RawRecord] = []
 
-        # --- Senate bulk download (stores file as-is) ---
+        # --- Senate bulk download (expanded into per-record deltas at ingest) ---
         download_url = self._discover_senate_download()
+        senate_sha = (checkpoint.meta or {}).get("senate_bulk_sha256")
         if download_url:
             r = self.client.request("GET", download_url)
-            records.append(
-                RawRecord(
-                    source_type="congress",
-                    source_name="senate_disclosure_db",
-                    url=download_url,
-                    record_id=download_url,
-                    fetched_at_utc=now_utc(),
-                    title="Senate disclosure database download",
-                    mime_type=r.headers.get("Content-Type") or "application/octet-stream",
-                    raw_bytes=r.content,
-                    http_status=r.status_code,
-                    headers=dict(r.headers),
-                    canonical_url=download_url,
-                    meta={"kind": "bulk_db"},
+            # Byte-identical snapshot: nothing to diff. Otherwise ingest expands it into
+            # per-record rows, keeping only records that changed (see bulk_delta).
+            blob_sha = hashlib.sha256(r.content).hexdigest()
+            if blob_sha != senate_sha:
+                senate_sha = blob_sha
+                records.append(
+                    RawRecord(
+                        source_type="congress",
+                        source_name="senate_disclosure_db",
+                        url=download_url,
+                        record_id=download_url,
+                        fetched_at_utc=now_utc(),
+                        title="Senate disclosure database download",
+                        mime_type=r.headers.get("Content-Type") or "application/octet-stream",
+                        raw_bytes=r.content,
+                        http_status=r.status_code,
+                        headers=dict(r.headers),
+                        canonical_url=download_url,
+                        meta={"kind": "bulk_db"},
+                    )
                 )
-            )
 
         # --- House PTR PDFs (ID scan, checkpointed) ---
         cursor = int(checkpoint.meta.get("house_last_checked_id") or checkpoint.last_cursor or str(self.house_start_id))
@@ -113,6 +120,7 @@ class PoliticianDisclosuresConnector(Connector):
                 "house_year": self.house_year,
                 "house_last_checked_id": last_checked,
                 "senate_download_url": download_url,
+                "senate_bulk_sha256": senate_sha,
                 "house_rate_per_sec": self.house_bucket.rate_per_sec,
             },
         )
@@ -60,3 +60,27 @@ def fetchall(conn: Any, sql: str, params: tuple = ()) -> list[tuple]:
     with conn.cursor() as cur:
         cur.execute(sql, params)
         return cur.fetchall()
+
+
+def execute_values(conn: Any, sql_prefix: str, rows: list[tuple], template: str, sql_suffix: str = "", page_size: int = 500) -> None:
+    """Multi-row VALUES insert/update; works the same on psycopg and psycopg2."""
+    with conn.cursor() as cur:
+        for i in range(0, len(rows), page_size):
+            page = rows[i:i + page_size]
+            values = ", ".join([template] * len(page))
+            params = tuple(p for row in page for p in row)
+            cur.execute(f"{sql_prefix} VALUES {values} {sql_suffix}", params)
+
+
+def iter_rows(conn: Any, sql: str, params: tuple = (), name: str = "stream", itersize: int = 500) -> Iterator[tuple]:
+    """Stream rows through a server-side (named) cursor in chunks of `itersize`."""
+    cur = conn.cursor(name=name)
+    try:
+        cur.execute(sql, params)
+        while True:
+            rows = cur.fetchmany(itersize)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        cur.close()
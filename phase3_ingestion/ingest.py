@@ -11,6 +11,7 @@ from .db import connect, fetchall
 from .checkpoints import get_checkpoint, set_checkpoint
 from .runs import start_run, finish_run
 from .storage import store_raw_document
+from .bulk_delta import iter_bulk_delta, load_digests, save_digests
 from .registry import build_connectors
 from .logging_utils import get_logger, log_json
 from .models import RunStats
@@ -36,6 +37,20 @@ def cmd_status(conn, connector: str | None):
     return rows
 
 
+def _store_bulk_delta(conn, rec, run_id: str, stats: RunStats) -> None:
+    # Bulk snapshots are not stored whole: only records added or changed since the last snapshot.
+    known = load_digests(conn, rec.source_name)
+    changed = []
+    for sub, key, digest in iter_bulk_delta(rec, known, stats, run_id=run_id):
+        _, inserted = store_raw_document(conn, sub, ingest_batch_id=run_id)
+        if inserted:
+            stats.stored += 1
+        else:
+            stats.deduped += 1
+        changed.append((key, digest))
+    save_digests(conn, rec.source_name, changed, run_id)
+
+
 def run_connector(conn, connector_name: str, limit: int, dry_run: bool = False, validate_only: bool = False):
     settings = load_settings()
     connectors = build_connectors(settings)
@@ -60,6 +75,9 @@ def run_connector(conn, connector_name: str, limit: int, dry_run: bool = False,
         for rec in records:
             if dry_run or validate_only:
                 continue
+            if (rec.meta or {}).get("kind") == "bulk_db":
+                _store_bulk_delta(conn, rec, run_id, stats)
+                continue
             _, inserted = store_raw_document(conn, rec, ingest_batch_id=run_id)
             if inserted:
                 stats.stored += 1
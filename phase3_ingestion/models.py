@@ -37,4 +37,5 @@ class RunStats:
     fetched: int = 0
     stored: int = 0
     deduped: int = 0
+    unchanged: int = 0
     errors: int = 0
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+from .normalize import NormalizationResult
+
+
+DT_FIELDS = ("discovered_at_utc", "event_timestamp_utc")
+BYTES_FIELDS = ("source_hash", "event_fingerprint", "version_key")
+
+SQL_CREATE = """
+CREATE TABLE IF NOT EXISTS normalization_cache (
+  content_sha256   BLOB NOT NULL,
+  mapper           TEXT NOT NULL,
+  mapper_version   TEXT NOT NULL,
+  outcomes_json    TEXT NOT NULL,
+  created_at_utc   TEXT NOT NULL,
+  PRIMARY KEY (content_sha256, mapper, mapper_version)
+) WITHOUT ROWID
+"""
+
+Outcome = Tuple[Optional[Dict[str, Any]], NormalizationResult]
+
+# Transactions extracted from a PTR PDF are cached in the same table under this mapper name.
+EXTRACTION_MAPPER = "ptr_extract"
+
+
+def _encode_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(event)
+    for k in DT_FIELDS:
+        if isinstance(out.get(k), dt.datetime):
+            out[k] = out[k].isoformat()
+    for k in BYTES_FIELDS:
+        if isinstance(out.get(k), (bytes, bytearray)):
+            out[k] = bytes(out[k]).hex()
+    return out
+
+
+def _decode_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    for k in DT_FIELDS:
+        if isinstance(event.get(k), str):
+            event[k] = dt.datetime.fromisoformat(event[k])
+    for k in BYTES_FIELDS:
+        if isinstance(event.get(k), str):
+            event[k] = bytes.fromhex(event[k])
+    return event
+
+
+class NormalizationCache:
+    """
+    Persistent (SQLite) cache of normalization outcomes.
+
+    Keyed by (content_sha256, mapper, mapper_version); the value is the list of
+    outcomes (event or quarantine/reject decision) the raw document produced.
+    For outcomes the first part is normalize.outcome_key(): the content digest
+    combined with the row metadata (URL, title, timestamps) normalization reads.
+    Entries written under an older mapper version are never read again and can be
+    dropped with prune().
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(SQL_CREATE)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, content_sha256: bytes, mapper: str, mapper_version: str) -> Optional[List[Outcome]]:
+        row = self.conn.execute(
+            "SELECT outcomes_json FROM normalization_cache WHERE content_sha256 = ? AND mapper = ? AND mapper_version = ?",
+            (content_sha256, mapper, mapper_version),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        outcomes: List[Outcome] = []
+        for o in json.loads(row[0]):
+            event = _decode_event(o["event"]) if o.get("event") is not None else None
+            outcomes.append((o.get("record"), NormalizationResult(o["status"], o["reason"], event)))
+        return outcomes
+
+    def put(self, content_sha256: bytes, mapper: str, mapper_version: str, outcomes: List[Outcome]) -> None:
+        # Sub-records are kept only for non-ok outcomes (they are what quarantine output needs).
+        payload = [
+            {
+                "status": res.status,
+                "reason": res.reason,
+                "event": _encode_event(res.event) if res.event is not None else None,
+                "record": rec if res.status != "ok" else None,
+            }
+            for rec, res in outcomes
+        ]
+        self.conn.execute(
+            "INSERT OR REPLACE INTO normalization_cache VALUES (?, ?, ?, ?, ?)",
+            (
+                content_sha256,
+                mapper,
+                mapper_version,
+                json.dumps(payload, ensure_ascii=False, default=str),
+                dt.datetime.now(dt.timezone.utc).isoformat(),
+            ),
+        )
+
+    def get_extraction(self, content_sha256: bytes, parser_version: str) -> Optional[List[Dict[str, Any]]]:
+        """Transactions previously extracted from the PDF with this content digest, or None."""
+        row = self.conn.execute(
+            "SELECT outcomes_json FROM normalization_cache WHERE content_sha256 = ? AND mapper = ? AND mapper_version = ?",
+            (content_sha256, EXTRACTION_MAPPER, parser_version),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put_extraction(self, content_sha256: bytes, parser_version: str, rows: List[Dict[str, Any]]) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO normalization_cache VALUES (?, ?, ?, ?, ?)",
+            (
+                content_sha256,
+                EXTRACTION_MAPPER,
+                parser_version,
+                json.dumps(rows, ensure_ascii=False, default=str),
+                dt.datetime.now(dt.timezone.utc).isoformat(),
+            ),
+        )
+
+    def prune(self, current_versions: Dict[str, str]) -> int:
+        """Delete entries whose mapper version is no longer current. Returns rows deleted."""
+        deleted = 0
+        for mapper, version in current_versions.items():
+            cur = self.conn.execute(
+                "DELETE FROM normalization_cache WHERE mapper = ? AND mapper_version <> ?",
+                (mapper, version),
+            )
+            deleted += cur.rowcount
+        self.conn.commit()
+        return deleted
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self) -> "NormalizationCache":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
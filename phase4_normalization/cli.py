@@ -3,9 +3,15 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from typing import Any, Dict, Iterable, Optional
+import signal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .normalize import normalize_raw_document
+from .cache import EXTRACTION_MAPPER, NormalizationCache
+from .follow import ParsedLine, follow
+from .normalize import normalize_batch
+from .quarantine import QuarantineStore, rejected
+from .ptr_extract import PTR_PARSER_VERSION, PtrExtractionPool, expand_ptr_rows
+from .registry import REGISTRY
 
 
 def _read_jsonl(path: str) -> Iterable[Dict[str, Any]]:
@@ -17,39 +23,282 @@ def _read_jsonl(path: str) -> Iterable[Dict[str, Any]]:
             yield json.loads(s)
 
 
-def _write_jsonl(path: str, rows: Iterable[Dict[str, Any]]) -> int:
+def _write_jsonl(path: str, rows: Iterable[Dict[str, Any]], mode: str = "w") -> int:
     n = 0
-    with open(path, "w", encoding="utf-8") as f:
+    with open(path, mode, encoding="utf-8") as f:
         for r in rows:
             f.write(json.dumps(r, ensure_ascii=False, default=str) + "\n")
             n += 1
     return n
 
 
+def _open_cache(args: argparse.Namespace) -> Optional[NormalizationCache]:
+    if not args.cache_db:
+        return None
+    cache = NormalizationCache(args.cache_db)
+    if args.prune_cache:
+        print(f"Cache entries pruned: {cache.prune({**REGISTRY.versions(), EXTRACTION_MAPPER: PTR_PARSER_VERSION})}")
+    return cache
+
+
+def _report_cache(cache: NormalizationCache) -> None:
+    print(f"Cache hits: {cache.hits}  misses: {cache.misses}")
+
+
+def _open_quarantine(args: argparse.Namespace) -> Optional[QuarantineStore]:
+    return QuarantineStore(args.quarantine_db) if args.quarantine_db else None
+
+
+def _open_ptr_pool(args: argparse.Namespace) -> Optional[PtrExtractionPool]:
+    if args.ptr_workers == 0:
+        return None
+    return PtrExtractionPool(workers=args.ptr_workers, timeout_sec=args.ptr_timeout, mem_limit_mb=args.ptr_mem_mb or None)
+
+
+def _normalize_rows(
+    raws: Iterable[Dict[str, Any]],
+    cache: Optional[NormalizationCache],
+    ptr_pool: Optional[PtrExtractionPool],
+    store: Optional[QuarantineStore],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """(ok events, quarantine rows, reject rows) as written to the file-mode outputs."""
+    if ptr_pool is not None:
+        raws = expand_ptr_rows(raws, ptr_pool, cache=cache)
+    batch = normalize_batch(raws, cache=cache)
+    quarantine = []
+    reject = []
+    for rec, res in batch.failed:
+        if res.status == "quarantine":
+            quarantine.append({"reason": res.reason, "raw": rec})
+            if store is not None:
+                store.add(rec, res)
+        else:
+            reject.append({"reason": res.reason, "raw": rec})
+    return list(batch.events()), quarantine, reject
+
+
+def _run_follow(args: argparse.Namespace) -> int:
+    checkpoint = args.checkpoint or args.input_jsonl + ".offset"
+    cache = _open_cache(args)
+    ptr_pool = _open_ptr_pool(args)
+    store = _open_quarantine(args)
+    totals = [0, 0, 0]
+    stop: List[int] = []
+
+    def request_stop(signum: int, frame: Any) -> None:
+        # Finish the batch in hand (outputs + checkpoint) and exit at the next poll.
+        stop.append(signum)
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, request_stop)
+
+    def handle(lines: List[ParsedLine]) -> None:
+        rows = [row for row, err in lines if err is None]
+        ok_events, quarantine, reject = _normalize_rows(rows, cache, ptr_pool, store)
+        reject += [{"reason": err, "raw": row} for row, err in lines if err is not None]
+        # Outputs first, then the stores: the checkpoint advances only after both (at-least-once).
+        n = (
+            _write_jsonl(args.output_jsonl, ok_events, mode="a"),
+            _write_jsonl(args.quarantine_jsonl, quarantine, mode="a"),
+            _write_jsonl(args.reject_jsonl, reject, mode="a"),
+        )
+        if store is not None:
+            store.commit()
+        if cache is not None:
+            cache.commit()
+        for i, k in enumerate(n):
+            totals[i] += k
+        print(f"{len(lines)} lines: {n[0]} events, {n[1]} quarantined, {n[2]} rejected", flush=True)
+
+    print(f"Following {args.input_jsonl} (checkpoint {checkpoint}); Ctrl-C to stop", flush=True)
+    try:
+        follow(args.input_jsonl, checkpoint, handle, poll_interval=args.poll_interval, should_stop=lambda: bool(stop))
+    finally:
+        if ptr_pool is not None:
+            ptr_pool.close()
+        if store is not None:
+            store.close()
+        if cache is not None:
+            _report_cache(cache)
+            cache.close()
+
+    print(f"OK events: {totals[0]}")
+    print(f"Quarantined: {totals[1]}")
+    print(f"Rejected: {totals[2]}")
+    return 0
+
+
+def _run_db_mode(args: argparse.Namespace) -> int:
+    if not args.database_url:
+        print("ERROR: DB mode needs --database-url (or DATABASE_URL / POSTGRES_DSN).")
+        return 2
+
+    # Imported lazily so file mode works without a Postgres driver installed.
+    from phase3_ingestion.db import connect
+    from .worker import run_worker
+
+    cache = _open_cache(args)
+    ptr_pool = _open_ptr_pool(args)
+    quarantine = _open_quarantine(args)
+    try:
+        with connect(args.database_url) as conn:
+            stats = run_worker(
+                conn,
+                batch_size=max(args.batch_size, 1),
+                max_batches=args.max_batches,
+                cache=cache,
+                ptr_pool=ptr_pool,
+                quarantine=quarantine,
+            )
+    finally:
+        if ptr_pool is not None:
+            ptr_pool.close()
+        if quarantine is not None:
+            quarantine.close()
+        if cache is not None:
+            _report_cache(cache)
+            cache.close()
+
+    print(f"Claimed: {stats.claimed} in {stats.batches} batches")
+    print(f"Parsed: {stats.parsed}")
+    print(f"Failed: {stats.failed} (quarantined {stats.quarantined}, rejected {stats.rejected})")
+    print(f"Events written: {stats.events_written} (changed {stats.events_changed}, new versions {stats.new_versions}, unchanged skipped {stats.duplicates})")
+    return 0
+
+
+def _run_rescore(args: argparse.Namespace) -> int:
+    if not args.database_url:
+        print("ERROR: --rescore needs --database-url (or DATABASE_URL / POSTGRES_DSN).")
+        return 2
+
+    from phase3_ingestion.db import connect
+    from .rescore import rescore
+
+    with connect(args.database_url) as conn:
+        n = rescore(conn)
+    print(f"Events rescored: {n}")
+    return 0
+
+
+def _run_reprocess(args: argparse.Namespace) -> int:
+    if not args.quarantine_db:
+        print("ERROR: reprocess needs --quarantine-db.")
+        return 2
+    # --mapper '' selects the unrouted records.
+    if not (args.reason or args.mapper is not None or args.list):
+        print("ERROR: reprocess needs --reason and/or --mapper (or --list).")
+        return 2
+
+    if args.db and not args.database_url:
+        print("ERROR: --db needs --database-url (or DATABASE_URL / POSTGRES_DSN).")
+        return 2
+
+    with QuarantineStore(args.quarantine_db) as store:
+        if args.list:
+            for mapper, version, reason, n in store.summary():
+                print(f"{n:8d}  {mapper or '-'}@{version or '-'}  {reason}")
+            return 0
+
+        promoted = 0
+        events = []
+        parsed_docs: Dict[str, None] = {}
+        reprocessed = list(store.reprocess(reason=args.reason, mapper=args.mapper, workers=args.workers))
+        selected = len(reprocessed)
+        for _, outcomes in reprocessed:
+            ok = [res.event for _, res in outcomes if res.status == "ok" and res.event]
+            if ok:
+                promoted += 1
+                events.extend(ok)
+                for ev in ok:
+                    if ev.get("raw_document_id"):
+                        parsed_docs[ev["raw_document_id"]] = None
+
+        rejects = rejected(reprocessed)
+        # Persist the promoted events and record the rejects before they leave the store:
+        # a failed write loses nothing.
+        if rejects:
+            _write_jsonl(args.reject_jsonl, [{"reason": res.reason, "raw": rec} for rec, res in rejects], mode="a")
+        if args.db:
+            from phase3_ingestion.db import connect
+            from .dedupe import EventDeduper
+            from .versioning import VersioningEngine
+            from .worker import WorkerStats, mark_parsed, persist_events
+
+            stats = WorkerStats()
+            with connect(args.database_url) as conn:
+                persist_events(conn, events, EventDeduper(conn), VersioningEngine(conn), stats)
+                marks = {doc_id: ("PARSED", None) for doc_id in parsed_docs}
+                for rec, res in rejects:
+                    if rec.get("raw_document_id"):
+                        marks.setdefault(rec["raw_document_id"], ("FAILED", f"reject: {res.reason}"))
+                mark_parsed(conn, [(doc_id, status, error) for doc_id, (status, error) in marks.items()])
+            print(f"Events written: {stats.events_written} (unchanged skipped {stats.duplicates})")
+        else:
+            _write_jsonl(args.output_jsonl, events, mode="a")
+            print(f"Appended {len(events)} events to: {args.output_jsonl}")
+        dropped = store.settle(reprocessed)
+
+    print(f"Reprocessed: {selected}")
+    print(f"Promoted: {promoted}")
+    if dropped:
+        print(f"Rejected records: {dropped} (appended to {args.reject_jsonl})")
+    print(f"Still quarantined or rejected: {selected - promoted}")
+    return 0
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Phase 4 normalization (raw_documents -> canonical events)")
     ap.add_argument("--input-jsonl", help="JSONL file containing raw_document-like rows")
     ap.add_argument("--output-jsonl", default="phase4_normalization\\out_events.jsonl", help="Where to write events JSONL")
     ap.add_argument("--quarantine-jsonl", default="phase4_normalization\\out_quarantine.jsonl", help="Where to write quarantined rows")
     ap.add_argument("--reject-jsonl", default="phase4_normalization\\out_reject.jsonl", help="Where to write rejected rows")
+    ap.add_argument("--quarantine-db", default=None, help="SQLite quarantine store (indexed by reason and mapper) for `reprocess`")
+    ap.add_argument("--cache-db", default=None, help="SQLite normalization cache; unchanged documents are skipped on re-runs")
+    ap.add_argument("--prune-cache", action="store_true", help="Drop cache entries written by older mapper versions")
+    ap.add_argument("--db", action="store_true", help="DB mode: normalize raw_documents WHERE parse_status='RAW' into events")
+    ap.add_argument("--database-url", default=os.getenv("DATABASE_URL") or os.getenv("POSTGRES_DSN"), help="Postgres DSN (DB mode)")
+    ap.add_argument("--batch-size", type=int, default=500, help="Rows claimed per transaction (DB mode)")
+    ap.add_argument("--max-batches", type=int, default=None, help="Stop after N batches (DB mode; default: drain)")
+    ap.add_argument("--rescore", action="store_true", help="Refresh time-dependent scores of events that changed freshness bucket since the last rescore")
+    ap.add_argument("--follow", action="store_true", help="Tail --input-jsonl: resume from a byte-offset checkpoint, append to the outputs, poll for growth")
+    ap.add_argument("--checkpoint", default=None, help="Follow-mode offset checkpoint (default: <input-jsonl>.offset)")
+    ap.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between growth checks in follow mode")
+    ap.add_argument("--ptr-workers", type=int, default=None, help="Processes extracting House PTR PDFs (default: CPU count; 0 disables)")
+    ap.add_argument("--ptr-timeout", type=int, default=30, help="Per-PDF extraction timeout in seconds")
+    ap.add_argument("--ptr-mem-mb", type=int, default=512, help="Address-space limit per extraction process in MB (0: unlimited)")
+    sub = ap.add_subparsers(dest="cmd")
+    rp = sub.add_parser("reprocess", help="Re-normalize quarantined records from --quarantine-db (e.g. after a mapper upgrade)")
+    rp.add_argument("--reason", default=None, help="Only records whose quarantine reason starts with this text")
+    rp.add_argument("--mapper", default=None, help="Only records routed to this mapper ('' for unrouted)")
+    rp.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    rp.add_argument("--list", action="store_true", help="Show quarantine counts by mapper and reason, then exit")
     args = ap.parse_args()
 
+    if args.cmd == "reprocess":
+        return _run_reprocess(args)
+    if args.rescore:
+        return _run_rescore(args)
+    if args.db:
+        return _run_db_mode(args)
+
     if not args.input_jsonl:
-        print("ERROR: For now, use file mode. Example:\n  python -m phase4_normalization.cli --input-jsonl phase4_normalization\\sample_raw_documents.jsonl")
+        print("ERROR: Use --input-jsonl (file mode) or --db (DB mode). Example:\n  python -m phase4_normalization.cli --input-jsonl phase4_normalization\\sample_raw_documents.jsonl")
         return 2
+    if args.follow:
+        return _run_follow(args)
 
-    ok_events = []
-    quarantine = []
-    reject = []
+    cache = _open_cache(args)
+    ptr_pool = _open_ptr_pool(args)
+    store = _open_quarantine(args)
+    ok_events, quarantine, reject = _normalize_rows(_read_jsonl(args.input_jsonl), cache, ptr_pool, store)
 
-    for raw in _read_jsonl(args.input_jsonl):
-        res = normalize_raw_document(raw)
-        if res.status == "ok" and res.event:
-            ok_events.append(res.event)
-        elif res.status == "quarantine":
-            quarantine.append({"reason": res.reason, "raw": raw})
-        else:
-            reject.append({"reason": res.reason, "raw": raw})
+    if ptr_pool is not None:
+        ptr_pool.close()
+    if store is not None:
+        store.close()
+    if cache is not None:
+        _report_cache(cache)
+        cache.close()
 
     n_ok = _write_jsonl(args.output_jsonl, ok_events)
     n_q = _write_jsonl(args.quarantine_jsonl, quarantine)
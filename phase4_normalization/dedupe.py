@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from phase3_ingestion.db import fetchall
+
+
+# Fields that change on every run (scores, and the confidence derived from
+# freshness, decay with age; discovery time and the raw document that produced
+# the event vary) are not content. The event time falls back to the fetch time
+# when a record has no publication date; dates carried by the payload are still
+# covered through details_json.raw_payload.
+VOLATILE_FIELDS = frozenset({
+    "raw_document_id",
+    "discovered_at_utc",
+    "event_timestamp_utc",
+    "credibility_score",
+    "freshness_score",
+    "materiality_score",
+    "overall_score",
+    "confidence",
+    "content_digest",
+    # Assigned by versioning after the digest is taken.
+    "event_id",
+    "version",
+    "supersedes_event_id",
+    "version_key",
+})
+
+SQL_PROBE = "SELECT event_fingerprint, content_digest, event_id, version, is_suppressed FROM events WHERE event_fingerprint = ANY(%s)"
+
+# (event_id, version, content_digest) of a row already in `events`
+ExistingRow = Tuple[str, int, Optional[bytes]]
+
+NEW = "new"
+DUPLICATE = "duplicate"
+CHANGED = "changed"
+
+
+def content_digest(event: Dict[str, Any]) -> bytes:
+    """SHA-256 over the event's content fields (everything but VOLATILE_FIELDS)."""
+    content = {k: v for k, v in event.items() if k not in VOLATILE_FIELDS}
+    blob = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(blob.encode("utf-8")).digest()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    return str(value)
+
+
+@dataclasses.dataclass
+class DedupeResult:
+    new: List[Dict[str, Any]] = dataclasses.field(default_factory=list)
+    changed: List[Dict[str, Any]] = dataclasses.field(default_factory=list)
+    duplicates: int = 0
+    # Rows found in `events` for the changed fingerprints (versioning links to them).
+    existing: Dict[bytes, ExistingRow] = dataclasses.field(default_factory=dict)
+
+    def to_write(self) -> List[Dict[str, Any]]:
+        return self.new + self.changed
+
+
+class EventDeduper:
+    """
+    Classifies normalized events as new, identical duplicate or changed before writing.
+
+    Fingerprints already seen in this run are answered from an in-memory map
+    (fingerprint -> content digest); the rest are looked up in `events` with one
+    `event_fingerprint = ANY(%s)` query per `probe_size` fingerprints. Without a
+    connection only the in-run map is used.
+    """
+
+    def __init__(self, conn: Any = None, probe_size: int = 5000) -> None:
+        self.conn = conn
+        self.probe_size = max(probe_size, 1)
+        self.seen: Dict[bytes, Optional[bytes]] = {}
+        self.probes = 0
+
+    def _probe(self, fingerprints: List[bytes]) -> Dict[bytes, ExistingRow]:
+        found: Dict[bytes, ExistingRow] = {}
+        if self.conn is None:
+            return found
+        for i in range(0, len(fingerprints), self.probe_size):
+            chunk = fingerprints[i:i + self.probe_size]
+            self.probes += 1
+            for fp, digest, event_id, version, suppressed in fetchall(self.conn, SQL_PROBE, (chunk,)):
+                # A superseded row never counts as identical: matching it means the event reverted.
+                prior = bytes(digest) if digest is not None and not suppressed else None
+                found[bytes(fp)] = (str(event_id), version, prior)
+        return found
+
+    def forget(self, fingerprints: Iterable[bytes]) -> None:
+        """Rows that were superseded in this run: still known, but no longer identical to anything."""
+        for fp in fingerprints:
+            self.seen[bytes(fp)] = None
+
+    def classify(self, events: Iterable[Dict[str, Any]]) -> DedupeResult:
+        # Within one call the last event per fingerprint wins
+        # (ON CONFLICT DO UPDATE cannot touch the same row twice in one statement).
+        latest: Dict[bytes, Dict[str, Any]] = {}
+        for ev in events:
+            ev["content_digest"] = content_digest(ev)
+            latest[bytes(ev["event_fingerprint"])] = ev
+
+        unknown = [fp for fp in latest if fp not in self.seen]
+        existing = self._probe(unknown) if unknown else {}
+
+        out = DedupeResult()
+        for fp, ev in latest.items():
+            digest = ev["content_digest"]
+            if fp in self.seen:
+                prior: Optional[bytes] = self.seen[fp]
+                known = True
+            else:
+                known = fp in existing
+                prior = existing[fp][2] if known else None
+            if not known:
+                out.new.append(ev)
+            elif prior == digest:
+                out.duplicates += 1
+            else:
+                # Rows written before content_digest existed (NULL) count as changed once;
+                # versioning records the digest on them without cutting a version.
+                out.changed.append(ev)
+                if fp in existing:
+                    out.existing[fp] = existing[fp]
+            self.seen[fp] = digest
+        return out
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# DoD PIIDs: 6-char activity code, 2-digit fiscal year, instrument letter, 4-char serial
+# (e.g. W31P4Q-24-C-0001, N0001925D0012, FA8625-23-F-6002).
+_PIID_RE = re.compile(r"\b([A-Z][A-Z0-9]{5})-?(\d{2})-?([A-Z])-?([A-Z0-9]{4})\b")
+_AMOUNT_RE = re.compile(r"\$\s?([\d,]+(?:\.\d+)?)(\s*(?:million|billion))?", re.IGNORECASE)
+_AWARD_RE = re.compile(r"\b(?:(?:is|was|were|are|has been|have been|have each been|each) )?(?:being )?awarded\b", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_BRANCH_RE = re.compile(r"^[A-Z][A-Z .,&'()-]{2,60}$")
+# The comma closing the company name; small businesses are starred on either side of it
+# ("Acme Inc.,* Norfolk"). A comma before a corporate suffix ("Fluor, Inc.") is part of the name.
+_RECIPIENT_END_RE = re.compile(r"\*?,\*?\s+(?!(?:Inc|LLC|L\.L\.C|Corp|Co|Ltd|L\.?P|LLP|PLLC)\b)")
+
+
+class _ParagraphParser(HTMLParser):
+    """Collects the text of each <p> as it closes; everything outside paragraphs is ignored."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.done: List[str] = []
+        self._buf: Optional[List[str]] = None
+        self._skip = 0
+
+    def handle_starttag(self, tag: str, attrs: Any) -> None:
+        if tag in ("script", "style"):
+            self._skip += 1
+        elif tag == "p":
+            self._flush()
+            self._buf = []
+        elif tag == "br" and self._buf is not None:
+            self._buf.append(" ")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in ("script", "style"):
+            self._skip = max(0, self._skip - 1)
+        elif tag in ("p", "div", "article", "body"):
+            self._flush()
+
+    def handle_data(self, data: str) -> None:
+        if self._buf is not None and not self._skip:
+            self._buf.append(data)
+
+    def _flush(self) -> None:
+        if self._buf is not None:
+            text = _WS_RE.sub(" ", "".join(self._buf)).strip()
+            if text:
+                self.done.append(text)
+        self._buf = None
+
+
+def iter_paragraphs(html: str, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """Stream paragraph texts out of an HTML document."""
+    parser = _ParagraphParser()
+    for i in range(0, len(html), chunk_size):
+        parser.feed(html[i:i + chunk_size])
+        if parser.done:
+            yield from parser.done
+            parser.done = []
+    parser.close()
+    parser._flush()
+    yield from parser.done
+
+
+def _parse_amount(text: str) -> Optional[float]:
+    m = _AMOUNT_RE.search(text)
+    if not m:
+        return None
+    value = float(m.group(1).replace(",", ""))
+    scale = (m.group(2) or "").strip().lower()
+    if scale == "million":
+        value *= 1_000_000
+    elif scale == "billion":
+        value *= 1_000_000_000
+    return value
+
+
+def _piid(text: str) -> Optional[str]:
+    m = _PIID_RE.search(text)
+    return "-".join(m.groups()) if m else None
+
+
+def _is_branch_header(text: str) -> bool:
+    return bool(_BRANCH_RE.match(text)) and not any(c.isdigit() for c in text)
+
+
+def _recipient(segment: str) -> str:
+    # "Lockheed Martin Corp., Grand Prairie, Texas, ..." -> "Lockheed Martin Corp."
+    return _RECIPIENT_END_RE.split(segment, 1)[0].strip(" *;")
+
+
+def parse_award_paragraph(text: str, branch: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Split one announcement paragraph into award payloads.
+    Multiple-award paragraphs ("A, City (PIID); B, City (PIID); ... were awarded") yield one
+    payload per awardee with its own contract number.
+    """
+    m = _AWARD_RE.search(text)
+    if not m or "$" not in text:
+        return []
+
+    head = text[:m.start()]
+    amount = _parse_amount(text)
+    agency = branch.title() if branch else "DoD"
+    awards: List[Dict[str, Any]] = []
+
+    segments = [s for s in head.split(";") if s.strip()]
+    if len(segments) > 1 and all(_piid(s) for s in segments):
+        for seg in segments:
+            awards.append({"recipient": _recipient(re.sub(r"^\s*and\s+", "", seg)), "contract_number": _piid(seg)})
+    else:
+        awards.append({"recipient": _recipient(head or text), "contract_number": _piid(text)})
+
+    for a in awards:
+        a.update(agency=agency, service_branch=branch, obligated_amount=amount, award_text=text)
+    return awards
+
+
+def iter_dod_awards(html: str) -> Iterator[Dict[str, Any]]:
+    """Yield one payload per award announced in a defense.gov contracts article."""
+    branch: Optional[str] = None
+    seq = 0
+    for para in iter_paragraphs(html):
+        if _is_branch_header(para):
+            branch = para.rstrip(".").strip()
+            continue
+        for award in parse_award_paragraph(para, branch):
+            award["award_seq"] = seq
+            seq += 1
+            yield award
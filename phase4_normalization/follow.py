@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Line -> (row, None), or ({"line": text}, error) for lines that are not JSON objects.
+ParsedLine = Tuple[Dict[str, Any], Optional[str]]
+
+
+@dataclasses.dataclass
+class FollowCheckpoint:
+    """
+    Byte offset of the first unprocessed line of an append-only JSONL file.
+    The file's inode is kept so a rotated (replaced) file is read from the start.
+    """
+
+    path: str
+    offset: int = 0
+    inode: Optional[int] = None
+
+    @classmethod
+    def load(cls, checkpoint_path: str, input_path: str) -> "FollowCheckpoint":
+        try:
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls(path=input_path)
+        if data.get("path") != input_path:
+            # A checkpoint for another input says nothing about this one.
+            return cls(path=input_path)
+        return cls(path=input_path, offset=int(data.get("offset") or 0), inode=data.get("inode"))
+
+    def save(self, checkpoint_path: str) -> None:
+        # Write-then-rename: a crash leaves either the old or the new offset, never a torn file.
+        tmp = checkpoint_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(dataclasses.asdict(self), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, checkpoint_path)
+
+
+def _parse_line(line: bytes) -> ParsedLine:
+    try:
+        row = json.loads(line)
+    except ValueError as e:
+        return {"line": line.decode("utf-8", errors="replace")}, f"invalid JSON line: {e}"
+    if not isinstance(row, dict):
+        return {"line": line.decode("utf-8", errors="replace")}, "JSON line is not an object"
+    return row, None
+
+
+def read_new_lines(cp: FollowCheckpoint, max_bytes: int = 1 << 24) -> Tuple[List[ParsedLine], int, Optional[str]]:
+    """
+    Complete lines appended since `cp` (at most ~max_bytes per call).
+    A trailing line without its newline is left for the next call (the writer is mid-append).
+    Returns (parsed lines, new offset, reset note); the note is set when the file was
+    truncated or replaced and reading restarted at offset 0. `cp.inode` is updated.
+    """
+    try:
+        st = os.stat(cp.path)
+    except FileNotFoundError:
+        return [], cp.offset, None
+
+    offset, note = cp.offset, None
+    if cp.inode is not None and st.st_ino != cp.inode:
+        offset, note = 0, "input file was replaced; reading it from the start"
+    elif st.st_size < offset:
+        offset, note = 0, "input file was truncated; reading it from the start"
+    cp.inode = st.st_ino
+    if st.st_size == offset:
+        return [], offset, note
+
+    with open(cp.path, "rb") as f:
+        f.seek(offset)
+        chunk = f.read(max(max_bytes, 1))
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            if len(chunk) < max_bytes:
+                return [], offset, note
+            # One line longer than max_bytes: read until its newline.
+            rest = bytearray(chunk)
+            while True:
+                more = f.read(1 << 20)
+                if not more:
+                    return [], offset, note
+                nl = more.find(b"\n")
+                if nl >= 0:
+                    rest += more[:nl + 1]
+                    break
+                rest += more
+            chunk, end = bytes(rest), len(rest) - 1
+
+    lines = [_parse_line(line) for line in chunk[:end].split(b"\n") if line.strip()]
+    return lines, offset + end + 1, note
+
+
+def follow(
+    input_path: str,
+    checkpoint_path: str,
+    handle: Callable[[List[ParsedLine]], None],
+    poll_interval: float = 1.0,
+    max_bytes: int = 1 << 24,
+    should_stop: Optional[Callable[[], bool]] = None,
+    log: Callable[[str], None] = print,
+) -> None:
+    """
+    Tail `input_path` from its checkpoint: hand every batch of new complete lines to
+    `handle`, then advance the checkpoint. The checkpoint moves only after `handle`
+    returns, so a crash replays the last batch (at-least-once) and never skips lines.
+    Polls for growth every `poll_interval` seconds while the file is idle.
+    """
+    cp = FollowCheckpoint.load(checkpoint_path, input_path)
+    while not (should_stop and should_stop()):
+        lines, offset, note = read_new_lines(cp, max_bytes)
+        if note:
+            log(f"{input_path}: {note}")
+        if lines:
+            handle(lines)
+        if offset != cp.offset or lines or note:
+            cp.offset = offset
+            cp.save(checkpoint_path)
+        if not lines:
+            time.sleep(poll_interval)
@@ -2,14 +2,38 @@ from __future__ import annotations
 
 import dataclasses
 import datetime as dt
+import functools
 import hashlib
+import io
 import json
 import re
-from typing import Any, Dict, Optional, Tuple
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from phase3_ingestion.bulk_records import iter_senate_records
+
+from .dod_awards import iter_dod_awards
+from .ptr_extract import as_bytes
+from .registry import REGISTRY, MapperSpec, token
+
+# Optional: ijson gives a true streaming parser for large JSON pages.
+try:
+    import ijson  # type: ignore
+except Exception:
+    ijson = None
+
+# Errors a splitter raises on a malformed multi-record document; ijson's do not subclass ValueError.
+_SPLIT_ERRORS: Tuple[type, ...] = (ValueError, IndexError, ET.ParseError)
+if ijson is not None:
+    _SPLIT_ERRORS += (ijson.JSONError,)
 
 
 ISO_DT_KEYS = ("retrieved_at_utc", "published_at_utc", "event_timestamp_utc", "discovered_at_utc")
 
+_FUTURE_REASON = "event_timestamp_utc too far in future"
+
+_HEX64_RE = re.compile(r"[0-9a-f]{64}")
+
 
 @dataclasses.dataclass
 class NormalizationResult:
@@ -30,19 +54,26 @@ def _parse_dt(value: Any) -> Optional[dt.datetime]:
     if isinstance(value, (int, float)):
         return dt.datetime.fromtimestamp(float(value), tz=dt.timezone.utc)
     if isinstance(value, str):
-        s = value.strip()
-        if not s:
-            return None
-        # Accept "Z" suffix
-        s = s.replace("Z", "+00:00")
-        try:
-            t = dt.datetime.fromisoformat(s)
-            return t if t.tzinfo else t.replace(tzinfo=dt.timezone.utc)
-        except Exception:
-            return None
+        return _parse_dt_text(value)
     return None
 
 
+@functools.lru_cache(maxsize=8192)
+def _parse_dt_text(value: str) -> Optional[dt.datetime]:
+    # Memoized: a batch repeats the same retrieval/publication timestamps many times
+    # (every sub-record of a page or feed carries its parent's). datetimes are immutable.
+    s = value.strip()
+    if not s:
+        return None
+    # Accept "Z" suffix
+    s = s.replace("Z", "+00:00")
+    try:
+        t = dt.datetime.fromisoformat(s)
+        return t if t.tzinfo else t.replace(tzinfo=dt.timezone.utc)
+    except Exception:
+        return None
+
+
 def _is_https_url(url: str) -> bool:
     return isinstance(url, str) and url.lower().startswith("https://")
 
@@ -61,6 +92,54 @@ def _try_parse_json(text: Optional[str]) -> Optional[Any]:
         return None
 
 
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WS_RE = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_ws(text: str, i: int) -> int:
+    return _JSON_WS_RE.match(text, i).end()
+
+
+def _iter_json_array_items(text: str, key: str) -> Iterator[Any]:
+    """
+    Yield the elements of the top-level array `key` one at a time.
+    Uses ijson when installed; otherwise walks the text with JSONDecoder.raw_decode so
+    only one element (plus small sibling values) is materialized at a time.
+    """
+    if ijson is not None:
+        yield from ijson.items(io.BytesIO(text.encode("utf-8")), f"{key}.item", use_float=True)
+        return
+
+    i = _skip_ws(text, 0)
+    if text[i:i + 1] != "{":
+        return
+    i += 1
+    while True:
+        i = _skip_ws(text, i)
+        if text[i:i + 1] in ("}", ""):
+            return
+        k, i = _JSON_DECODER.raw_decode(text, i)
+        i = _skip_ws(text, i)
+        if text[i:i + 1] != ":":
+            raise ValueError(f"expected ':' at {i}")
+        i = _skip_ws(text, i + 1)
+        if k == key and text[i:i + 1] == "[":
+            i += 1
+            while True:
+                i = _skip_ws(text, i)
+                if text[i:i + 1] == "]":
+                    return
+                item, i = _JSON_DECODER.raw_decode(text, i)
+                yield item
+                i = _skip_ws(text, i)
+                if text[i:i + 1] == ",":
+                    i += 1
+        _, i = _JSON_DECODER.raw_decode(text, i)
+        i = _skip_ws(text, i)
+        if text[i:i + 1] == ",":
+            i += 1
+
+
 def _sha256_bytes(data: bytes) -> bytes:
     return hashlib.sha256(data).digest()
 
@@ -70,48 +149,63 @@ def _sha256_text(s: str) -> bytes:
 
 
 def _norm_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # str.split() splits on the same (Unicode) whitespace as r"\s+" without the regex machinery.
+    return " ".join((s or "").split())
+
+
+# Placeholder scoring constants, shared with the rescoring job (rescore.py).
+CREDIBILITY_PLACEHOLDER = 60
+MATERIALITY_PLACEHOLDER = 50
+# (max age in whole days, freshness score); older events get FRESHNESS_STALE.
+FRESHNESS_BUCKETS: Tuple[Tuple[int, int], ...] = ((1, 90), (7, 75), (30, 55))
+FRESHNESS_STALE = 35
+# (min freshness, confidence); below all thresholds -> "LOW".
+CONFIDENCE_THRESHOLDS: Tuple[Tuple[int, str], ...] = ((75, "HIGH"), (50, "MEDIUM"))
+
+
+def freshness_for_age(age_days: int) -> int:
+    for max_days, score in FRESHNESS_BUCKETS:
+        if age_days <= max_days:
+            return score
+    return FRESHNESS_STALE
 
 
-def _scores_placeholder(discovered_at: dt.datetime) -> Tuple[int, int, int, int, str]:
+def confidence_for_freshness(freshness: int) -> str:
+    for min_freshness, conf in CONFIDENCE_THRESHOLDS:
+        if freshness >= min_freshness:
+            return conf
+    return "LOW"
+
+
+def overall_score(credibility: int, freshness: int, materiality: int) -> int:
+    # 0.4 / 0.3 / 0.3 weights in integer arithmetic, rounding half up, so SQL can match it exactly.
+    return max(0, min(100, (4 * credibility + 3 * freshness + 3 * materiality + 5) // 10))
+
+
+def _scores_placeholder(discovered_at: dt.datetime, now: Optional[dt.datetime] = None) -> Tuple[int, int, int, int, str]:
     """
     Deterministic placeholder scoring until Phase 7.
     Returns: credibility, freshness, materiality, overall, confidence_enum(LOW/MEDIUM/HIGH)
     """
-    credibility = 60
-    materiality = 50
+    credibility = CREDIBILITY_PLACEHOLDER
+    materiality = MATERIALITY_PLACEHOLDER
 
     age_days = 9999
-    now = _now_utc()
+    now = now or _now_utc()
     if discovered_at:
         age = now - discovered_at
         age_days = max(0, int(age.total_seconds() // 86400))
 
-    if age_days <= 1:
-        freshness = 90
-    elif age_days <= 7:
-        freshness = 75
-    elif age_days <= 30:
-        freshness = 55
-    else:
-        freshness = 35
-
-    overall = int(round(0.4 * credibility + 0.3 * freshness + 0.3 * materiality))
-    overall = max(0, min(100, overall))
-
+    freshness = freshness_for_age(age_days)
+    overall = overall_score(credibility, freshness, materiality)
     # Confidence placeholder: if it's very fresh, bump.
-    if freshness >= 75:
-        conf = "HIGH"
-    elif freshness >= 50:
-        conf = "MEDIUM"
-    else:
-        conf = "LOW"
+    conf = confidence_for_freshness(freshness)
 
     return credibility, freshness, materiality, overall, conf
 
 
-def _base_event(raw: Dict[str, Any]) -> Tuple[Optional[dt.datetime], Optional[dt.datetime], Dict[str, Any]]:
-    discovered_at = _parse_dt(raw.get("retrieved_at_utc")) or _parse_dt(raw.get("discovered_at_utc")) or _now_utc()
+def _base_event(raw: Dict[str, Any], now: dt.datetime) -> Tuple[Optional[dt.datetime], Optional[dt.datetime], Dict[str, Any]]:
+    discovered_at = _parse_dt(raw.get("retrieved_at_utc")) or _parse_dt(raw.get("discovered_at_utc")) or now
     event_time = _parse_dt(raw.get("published_at_utc")) or _parse_dt(raw.get("event_timestamp_utc")) or discovered_at
 
     source_url = raw.get("source_url") or ""
@@ -145,7 +239,7 @@ def _compute_source_hash(raw: Dict[str, Any], fallback_seed: str) -> bytes:
     if isinstance(val, str):
         s = val.strip().lower()
         # hex?
-        if re.fullmatch(r"[0-9a-f]{64}", s):
+        if _HEX64_RE.fullmatch(s):
             return bytes.fromhex(s)
     return _sha256_text(fallback_seed)
 
@@ -154,11 +248,13 @@ def _compute_event_fingerprint(identity_parts: Tuple[str, ...]) -> bytes:
     return _sha256_text("|".join([p or "" for p in identity_parts]))
 
 
-def normalize_raw_document(raw: Dict[str, Any]) -> NormalizationResult:
+def normalize_raw_document(raw: Dict[str, Any], now: Optional[dt.datetime] = None) -> NormalizationResult:
     """
     Convert a raw_documents-like dict into an events table-like dict.
+    `now` is the clock for discovery fallback, the future check and scoring (default: current time).
     """
-    discovered_at, event_time, base = _base_event(raw)
+    now = now or _now_utc()
+    discovered_at, event_time, base = _base_event(raw, now)
 
     # Basic required checks
     if not _is_https_url(base["source_url"]):
@@ -171,9 +267,12 @@ def normalize_raw_document(raw: Dict[str, Any]) -> NormalizationResult:
         return NormalizationResult("quarantine", "missing summary; needs enrichment", None)
 
     # Timestamp sanity: allow up to 24h in future
-    now = _now_utc()
     if base["event_timestamp_utc"] and base["event_timestamp_utc"] > (now + dt.timedelta(hours=24)):
-        return NormalizationResult("quarantine", "event_timestamp_utc too far in future", None)
+        return NormalizationResult("quarantine", _FUTURE_REASON, None)
+
+    # Binary documents (PTR PDFs) whose text extraction failed upstream
+    if raw.get("extraction_error"):
+        return NormalizationResult("quarantine", f"extraction failed: {raw['extraction_error']}", None)
 
     # Determine payload
     payload = raw.get("payload_json")
@@ -182,42 +281,341 @@ def normalize_raw_document(raw: Dict[str, Any]) -> NormalizationResult:
     if payload is None:
         payload = {}
 
-    src_name = (raw.get("source_name") or "").lower()
-    src_type = (raw.get("source_type") or "").lower()
+    spec = route_mapper(raw)
+    if spec is None:
+        return NormalizationResult("quarantine", "unknown source routing; add mapper", None)
+    result = spec.func(raw, base, payload)
+    if result.event is not None:
+        _apply_scores(result.event, now)
+    return result
+
+
+def route_mapper(raw: Dict[str, Any]) -> Optional[MapperSpec]:
+    """The registered mapper for raw's (source_type, source_name), or None."""
+    return REGISTRY.resolve(raw.get("source_type"), raw.get("source_name"))
+
+
+def iter_normalized(
+    raw: Dict[str, Any],
+    cache: Any = None,
+    now: Optional[dt.datetime] = None,
+) -> Iterator[Tuple[Dict[str, Any], NormalizationResult]]:
+    """
+    Fan-out variant of normalize_raw_document.
+    Multi-record raw documents (USASpending result pages, SEC atom feeds) are split into
+    one sub-record per item and each is normalized on its own.
+    Yields (raw_or_sub_record, result) pairs.
+
+    With a `cache` (see cache.NormalizationCache), outcomes are looked up by
+    (outcome_key, mapper, mapper version) and only unchanged documents are skipped.
+    """
+    now = now or _now_utc()
+    # Extraction failures (timeouts, missing PDF library) may be transient: never cache them.
+    if cache is None or raw.get("extraction_error"):
+        yield from _iter_normalized(raw, now)
+        return
+
+    spec = route_mapper(raw)
+    if spec is None:
+        yield from _iter_normalized(raw, now)
+        return
+
+    key = outcome_key(raw)
+    hit = cache.get(key, spec.name, spec.version)
+    if hit is not None:
+        for rec, res in hit:
+            if res.event is not None:
+                res.event["raw_document_id"] = raw.get("raw_document_id")
+                _apply_scores(res.event, now)
+            yield (rec if rec is not None else raw), res
+        return
+
+    outcomes = list(_iter_normalized(raw, now))
+    # Time-dependent decisions must be re-evaluated on every run.
+    if not any(res.reason == _FUTURE_REASON for _, res in outcomes):
+        cache.put(key, spec.name, spec.version, [(None if rec is raw else rec, res) for rec, res in outcomes])
+    yield from outcomes
+
+
+def content_key(raw: Dict[str, Any]) -> bytes:
+    """Stable digest of the raw document: its content_sha256 when present, else a hash of the row."""
+    val = raw.get("content_sha256")
+    if isinstance(val, (bytes, bytearray)) and len(val) == 32:
+        return bytes(val)
+    if isinstance(val, str) and _HEX64_RE.fullmatch(val.strip().lower()):
+        return bytes.fromhex(val.strip())
+    row = {k: v for k, v in raw.items() if k != "raw_document_id"}
+    return _sha256_text(json.dumps(row, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str))
+
+
+# Row metadata that _base_event and the validators read besides the content.
+OUTCOME_KEY_FIELDS = (
+    "source_type",
+    "source_name",
+    "source_url",
+    "title",
+    "summary",
+    "retrieved_at_utc",
+    "discovered_at_utc",
+    "published_at_utc",
+    "event_timestamp_utc",
+)
+
+
+def outcome_key(raw: Dict[str, Any]) -> bytes:
+    """
+    Cache key of raw's normalization outcomes: content_key plus OUTCOME_KEY_FIELDS.
+    Two rows with the same content but a different URL, title or timestamps map to
+    different events (or decisions), so they must not share cached outcomes.
+    """
+    meta = json.dumps([raw.get(k) for k in OUTCOME_KEY_FIELDS], separators=(",", ":"), ensure_ascii=False, default=str)
+    return _sha256_bytes(content_key(raw) + meta.encode("utf-8"))
+
+
+@dataclasses.dataclass
+class NormalizedBatch:
+    """
+    Column-oriented output of normalize_batch: `columns` maps each event field to one
+    value per ok event (missing fields are None), so rows for a bulk insert are a zip away.
+    `failed` keeps the quarantined / rejected (record, result) pairs.
+    """
+
+    columns: Dict[str, List[Any]] = dataclasses.field(default_factory=dict)
+    failed: List[Tuple[Dict[str, Any], NormalizationResult]] = dataclasses.field(default_factory=list)
+    size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def rows(self, columns: Iterable[str]) -> List[Tuple[Any, ...]]:
+        """Row tuples in the given column order (e.g. worker.EVENT_COLUMNS) for execute_values / COPY."""
+        empty = [None] * self.size
+        return list(zip(*(self.columns.get(c, empty) for c in columns)))
+
+    def events(self) -> Iterator[Dict[str, Any]]:
+        """The ok events as dicts again (fields that were missing come back as None)."""
+        names = list(self.columns)
+        for values in zip(*(self.columns[n] for n in names)):
+            yield dict(zip(names, values))
+
+    def quarantined(self) -> List[Tuple[Dict[str, Any], NormalizationResult]]:
+        return [(rec, res) for rec, res in self.failed if res.status == "quarantine"]
+
+    def rejected(self) -> List[Tuple[Dict[str, Any], NormalizationResult]]:
+        return [(rec, res) for rec, res in self.failed if res.status != "quarantine"]
+
+
+def normalize_batch(
+    rows: Iterable[Dict[str, Any]],
+    now: Optional[dt.datetime] = None,
+    cache: Any = None,
+) -> NormalizedBatch:
+    """
+    Normalize many raw documents against one clock (`now`, default: the time of the call):
+    the discovery fallback, the future-timestamp check and freshness scoring all see the
+    same instant, so a batch scores consistently however long it takes to run.
+    """
+    now = now or _now_utc()
+    out = NormalizedBatch()
+    columns = out.columns
+    for raw in rows:
+        for rec, res in iter_normalized(raw, cache=cache, now=now):
+            event = res.event
+            if res.status != "ok" or not event:
+                out.failed.append((rec, res))
+                continue
+            for name, value in event.items():
+                col = columns.get(name)
+                if col is None:
+                    # A field first seen mid-batch: earlier events did not have it.
+                    col = columns[name] = [None] * out.size
+                col.append(value)
+            out.size += 1
+            if len(event) < len(columns):
+                for col in columns.values():
+                    if len(col) < out.size:
+                        col.append(None)
+    return out
+
+
+def _iter_normalized(raw: Dict[str, Any], now: dt.datetime) -> Iterator[Tuple[Dict[str, Any], NormalizationResult]]:
+    records = _split(raw)
+    if records is None:
+        yield raw, normalize_raw_document(raw, now)
+        return
+
+    n = 0
+    try:
+        for sub in records:
+            n += 1
+            yield sub, normalize_raw_document(sub, now)
+    except _SPLIT_ERRORS as e:
+        yield raw, NormalizationResult("quarantine", f"malformed multi-record document after {n} records: {e}", None)
+        return
+    if n == 0:
+        yield raw, NormalizationResult("quarantine", "multi-record document contained no records", None)
+
+
+def _split(raw: Dict[str, Any]) -> Optional[Iterator[Dict[str, Any]]]:
+    """Sub-records of a multi-record document, or None if `raw` is a single record."""
+    if raw.get("payload_json") is not None:
+        return None
+    text = raw.get("text_content")
+    if (not isinstance(text, str) or not text) and raw.get("raw_content") is None:
+        return None
+    spec = route_mapper(raw)
+    if spec is None or spec.splitter is None:
+        return None
+    return spec.splitter(raw)
+
+
+def _sub_record(raw: Dict[str, Any], payload: Any, **overrides: Any) -> Dict[str, Any]:
+    # Page-level title/summary/hash describe the container, not the record.
+    sub = dict(raw)
+    sub.update(payload_json=payload, title=None, summary=None, text_content=None, raw_content=None, content_sha256=None, source_hash=None)
+    sub.update(overrides)
+    return sub
 
-    # Route to mapper
-    if "politic" in src_name or "senate" in src_name or "house" in src_name or "disclosure" in src_type:
-        return _map_politician(raw, base, payload)
-    if "usaspending" in src_name or "usaspending" in src_type:
-        return _map_usaspending(raw, base, payload)
-    if "dod" in src_name or "defense" in src_name or "d o d" in src_name or "dod" in src_type:
-        return _map_dod_award(raw, base, payload)
-    if "sec" in src_name or "edgar" in src_name or "sec" in src_type:
-        return _map_sec(raw, base, payload)
 
-    return NormalizationResult("quarantine", "unknown source routing; add mapper", None)
+def _split_usaspending_page(raw: Dict[str, Any]) -> Optional[Iterator[Dict[str, Any]]]:
+    text = raw.get("text_content") or ""
+    if '"results"' not in text:
+        return None
+    return (_sub_record(raw, item) for item in _iter_json_array_items(text, "results") if isinstance(item, dict))
+
 
+def _split_dod_article(raw: Dict[str, Any]) -> Optional[Iterator[Dict[str, Any]]]:
+    text = raw.get("text_content") or ""
+    if "<p" not in text and "<P" not in text:
+        return None
+    return (_sub_record(raw, award, summary=award["award_text"]) for award in iter_dod_awards(text))
 
-def _finalize(raw: Dict[str, Any], base: Dict[str, Any], event_type: str, identity: Tuple[str, ...]) -> Dict[str, Any]:
-    discovered_at = base["discovered_at_utc"]
-    credibility, freshness, materiality, overall, conf = _scores_placeholder(discovered_at)
 
-    fallback_seed = f"{event_type}|{base['source_name']}|{base['source_url']}|{base['title']}|{base['event_timestamp_utc'].isoformat()}"
+_ATOM = "{http://www.w3.org/2005/Atom}"
+
+# Entry ids are URNs ("urn:tag:sec.gov,2008:accession-number=0001193125-25-012345");
+# titles read "8-K - APPLE INC (0000320193) (Filer)".
+_SEC_ACCESSION_RE = re.compile(r"(\d{10}-\d{2}-\d{6})")
+_SEC_FILER_RE = re.compile(r"^(?P<filer>.+?)\s*\((?P<cik>\d{1,10})\)\s*(?:\((?P<role>[^)]*)\))?$")
+
+
+def _sec_entry_fields(entry_id: Any, title: Any) -> Dict[str, Optional[str]]:
+    """accession_number / filer_name / cik / filer_role parsed from an EDGAR feed entry's id and title."""
+    accession_m = _SEC_ACCESSION_RE.search(entry_id) if isinstance(entry_id, str) else None
+    filer_m = None
+    if isinstance(title, str) and " - " in title:
+        filer_m = _SEC_FILER_RE.match(_norm_ws(title.split(" - ", 1)[1]))
+    return {
+        "accession_number": accession_m.group(1) if accession_m else None,
+        "filer_name": filer_m.group("filer") if filer_m else None,
+        "cik": filer_m.group("cik") if filer_m else None,
+        "filer_role": filer_m.group("role") if filer_m else None,
+    }
+
+
+def _iter_xml_elements(text: str, tag: str, chunk_size: int = 1 << 16) -> Iterator[ET.Element]:
+    """Incrementally parse `text`, yielding each completed `tag` element (caller clears it)."""
+    parser = ET.XMLPullParser(events=("end",))
+    for i in range(0, len(text), chunk_size):
+        parser.feed(text[i:i + chunk_size])
+        for _, elem in parser.read_events():
+            if elem.tag == tag:
+                yield elem
+    parser.close()
+    for _, elem in parser.read_events():
+        if elem.tag == tag:
+            yield elem
+
+
+def _split_sec_feed(raw: Dict[str, Any]) -> Optional[Iterator[Dict[str, Any]]]:
+    if not (raw.get("source_name") or "").lower().startswith("edgar_current_feed_") or "<feed" not in (raw.get("text_content") or "")[:2048]:
+        return None
+    return _iter_sec_feed_entries(raw)
+
+
+def _iter_sec_feed_entries(raw: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    form = (raw.get("source_name") or "")[len("edgar_current_feed_"):]
+    for elem in _iter_xml_elements(raw["text_content"], f"{_ATOM}entry"):
+        link_el = elem.find(f"{_ATOM}link")
+        link = link_el.get("href") if link_el is not None else None
+        payload = {
+            "form": form,
+            "id": elem.findtext(f"{_ATOM}id"),
+            "title": elem.findtext(f"{_ATOM}title"),
+            "link": link,
+            "updated": elem.findtext(f"{_ATOM}updated"),
+            "summary": elem.findtext(f"{_ATOM}summary"),
+        }
+        payload.update(_sec_entry_fields(payload["id"], payload["title"]))
+        elem.clear()
+        yield _sub_record(
+            raw,
+            payload,
+            source_url=link or raw.get("source_url"),
+            title=payload["title"],
+            published_at_utc=payload["updated"],
+        )
+
+
+def _split_senate_bulk(raw: Dict[str, Any]) -> Optional[Iterator[Dict[str, Any]]]:
+    # The bulk download is binary (zip) in raw_content; plain XML/CSV may arrive as text.
+    data = as_bytes(raw.get("raw_content"))
+    if data is None:
+        text = raw.get("text_content")
+        if not text:
+            return None
+        data = text.encode("utf-8")
+    return (_sub_record(raw, rec) for rec in iter_senate_records(data))
+
+
+def _finalize(
+    raw: Dict[str, Any],
+    base: Dict[str, Any],
+    event_type: str,
+    identity: Tuple[str, ...],
+    version_identity: Optional[Tuple[str, ...]] = None,
+) -> Dict[str, Any]:
+    # `identity` names one version of an event; `version_identity` is the stable part
+    # shared by all its versions (an award, a filing, a person's transaction).
+    # Seeded from the mapped payload, not the event time: without a publication date that
+    # is the fetch time, and an unchanged record fetched again must keep its source_hash.
+    payload = json.dumps(base["details_json"].get("raw_payload"), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    fallback_seed = f"{event_type}|{base['source_name']}|{base['source_url']}|{base['title']}|{payload}"
     source_hash = _compute_source_hash(raw, fallback_seed)
     event_fingerprint = _compute_event_fingerprint(identity)
 
     base["event_type"] = event_type
-    base["confidence"] = conf
-    base["credibility_score"] = credibility
-    base["freshness_score"] = freshness
-    base["materiality_score"] = materiality
-    base["overall_score"] = overall
     base["source_hash"] = source_hash
     base["event_fingerprint"] = event_fingerprint
+    base["version_key"] = _compute_event_fingerprint(version_identity) if version_identity else event_fingerprint
 
     return base
 
 
+def _apply_scores(event: Dict[str, Any], now: Optional[dt.datetime] = None) -> None:
+    credibility, freshness, materiality, overall, conf = _scores_placeholder(event["discovered_at_utc"], now)
+    event["confidence"] = conf
+    event["credibility_score"] = credibility
+    event["freshness_score"] = freshness
+    event["materiality_score"] = materiality
+    event["overall_score"] = overall
+
+
+def _split_politician(raw: Dict[str, Any]) -> Optional[Iterator[Dict[str, Any]]]:
+    # House PTR PDFs are expanded upstream (ptr_extract); only the Senate bulk file splits here.
+    if (raw.get("source_name") or "").lower() != "senate_disclosure_db":
+        return None
+    return _split_senate_bulk(raw)
+
+
+@REGISTRY.mapper(
+    "politician",
+    "4",
+    sources=[("congress", "senate_disclosure_db"), ("congress", "senate_disclosure_record"), ("congress", "house_ptr_pdf")],
+    type_patterns=["disclosure"],
+    name_patterns=[token("senate"), token("house"), r"(?<![a-z0-9])politic"],
+    splitter=_split_politician,
+)
 def _map_politician(raw: Dict[str, Any], base: Dict[str, Any], payload: Any) -> NormalizationResult:
     # Best-effort field extraction
     rp = _norm_ws(_get(payload, "reporting_person", "representative", "senator", "name"))
@@ -254,16 +652,26 @@ def _map_politician(raw: Dict[str, Any], base: Dict[str, Any], payload: Any) ->
     }
 
     identity = ("POLITICIAN_DISCLOSURE", rp.lower(), tx_date.lower(), tx_type.lower(), asset.lower(), amt_band.lower())
-    event = _finalize(raw, base, "POLITICIAN_DISCLOSURE", identity)
+    # A corrected amount band is a new version of the same transaction.
+    event = _finalize(raw, base, "POLITICIAN_DISCLOSURE", identity, identity[:-1])
     return NormalizationResult("ok", "mapped politician disclosure", event)
 
 
+@REGISTRY.mapper(
+    "usaspending",
+    "3",
+    sources=[("usaspending", "spending_by_award")],
+    type_patterns=["usaspending"],
+    name_patterns=["usaspending"],
+    splitter=_split_usaspending_page,
+)
 def _map_usaspending(raw: Dict[str, Any], base: Dict[str, Any], payload: Any) -> NormalizationResult:
-    award_id = _norm_ws(_get(payload, "generated_unique_award_id", "award_id", "id"))
-    piid = _norm_ws(_get(payload, "piid", "contract_number"))
-    agency = _norm_ws(_get(payload, "awarding_agency", "agency"))
-    recipient = _norm_ws(_get(payload, "recipient", "recipient_name", "awardee"))
-    obligation = _get(payload, "obligation", "obligated_amount")
+    # Title-cased keys are the spending_by_award result fields.
+    award_id = _norm_ws(_get(payload, "generated_unique_award_id", "generated_internal_id", "award_id", "id"))
+    piid = _norm_ws(_get(payload, "piid", "contract_number", "Award ID"))
+    agency = _norm_ws(_get(payload, "awarding_agency", "agency", "Awarding Agency"))
+    recipient = _norm_ws(_get(payload, "recipient", "recipient_name", "awardee", "Recipient Name"))
+    obligation = _get(payload, "obligation", "obligated_amount", "Award Amount")
     ceiling = _get(payload, "base_and_all_options_value", "ceiling_amount")
 
     if not (award_id or piid) or not agency or not recipient:
@@ -291,15 +699,24 @@ def _map_usaspending(raw: Dict[str, Any], base: Dict[str, Any], payload: Any) ->
 
     stable = award_id or piid
     identity = ("FED_AWARD", "USASPENDING", stable.lower(), agency.lower(), recipient.lower())
-    event = _finalize(raw, base, "FED_AWARD", identity)
+    event = _finalize(raw, base, "FED_AWARD", identity, identity[:3])
     return NormalizationResult("ok", "mapped usaspending award", event)
 
 
+@REGISTRY.mapper(
+    "dod",
+    "5",
+    sources=[("dod", "defense_contracts_article"), ("dod", "defense_contracts_landing")],
+    type_patterns=[token("dod")],
+    name_patterns=[token("dod"), "defense", token("d o d")],
+    splitter=_split_dod_article,
+)
 def _map_dod_award(raw: Dict[str, Any], base: Dict[str, Any], payload: Any) -> NormalizationResult:
     contract = _norm_ws(_get(payload, "contract_number", "piid", "award_id", "id"))
     recipient = _norm_ws(_get(payload, "recipient", "awardee", "company"))
     agency = _norm_ws(_get(payload, "agency", "awarding_agency")) or "DoD"
     amount = _get(payload, "obligated_amount", "amount")
+    seq = _get(payload, "award_seq")
 
     # DoD press releases often have only text; fallback to title parsing.
     if not recipient and isinstance(base.get("title"), str):
@@ -321,17 +738,32 @@ def _map_dod_award(raw: Dict[str, Any], base: Dict[str, Any], payload: Any) -> N
         "raw_payload": payload,
     }
 
-    stable = contract or base["source_url"]
+    # Awards split out of one article share its URL; the position keeps them distinct.
+    stable = contract or (f"{base['source_url']}#{seq}" if seq is not None else base["source_url"])
     identity = ("FED_AWARD", "DOD", stable.lower(), agency.lower(), (recipient or "").lower())
-    event = _finalize(raw, base, "FED_AWARD", identity)
+    event = _finalize(raw, base, "FED_AWARD", identity, identity[:3])
     return NormalizationResult("ok", "mapped dod award", event)
 
 
+@REGISTRY.mapper(
+    "sec",
+    "4",
+    sources=[("sec", "edgar_current_filing")],
+    type_patterns=[token("sec")],
+    name_patterns=[token("sec"), "edgar"],
+    splitter=_split_sec_feed,
+)
 def _map_sec(raw: Dict[str, Any], base: Dict[str, Any], payload: Any) -> NormalizationResult:
     form = _norm_ws(_get(payload, "filing_form", "form", "form_type"))
     filer = _norm_ws(_get(payload, "filer_name", "filer", "company_name", "issuer"))
     accession = _norm_ws(_get(payload, "accession_number", "accession", "accessionNo"))
+    amends = _norm_ws(_get(payload, "amends_accession", "original_accession", "amends"))
     filing_date = _norm_ws(_get(payload, "filing_date", "filed_at", "date"))
+    if not (accession and filer):
+        # Feed entries stored one per row by the ingestion connector carry only id and title.
+        entry = _sec_entry_fields(_get(payload, "id"), _get(payload, "title"))
+        accession = accession or _norm_ws(entry["accession_number"])
+        filer = filer or _norm_ws(entry["filer_name"])
 
     # SEC records can be incomplete early; quarantine if missing critical identifiers
     if not accession and not base["source_url"]:
@@ -343,6 +775,7 @@ def _map_sec(raw: Dict[str, Any], base: Dict[str, Any], payload: Any) -> Normali
             "filing_form": form,
             "filer_name": filer,
             "accession_number": accession,
+            "amends_accession": amends,
             "filing_date": filing_date,
         },
         "entities": [{"name": filer, "entity_type": "COMPANY", "role": "FILER"}] if filer else [],
@@ -354,7 +787,8 @@ def _map_sec(raw: Dict[str, Any], base: Dict[str, Any], payload: Any) -> Normali
 
     stable = accession or base["source_url"]
     identity = ("OTHER_PUBLIC_CATALYST", "SEC", stable.lower(), (form or "").lower(), (filer or "").lower())
-    event = _finalize(raw, base, "OTHER_PUBLIC_CATALYST", identity)
+    # An amendment (8-K/A) is a new version of the filing it amends.
+    event = _finalize(raw, base, "OTHER_PUBLIC_CATALYST", identity, ("OTHER_PUBLIC_CATALYST", "SEC", (amends or stable).lower()))
     return NormalizationResult("ok", "mapped sec filing", event)
 
 
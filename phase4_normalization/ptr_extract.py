@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import io
+import multiprocessing
+import os
+import re
+import signal
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None  # type: ignore
+
+
+PTR_SOURCE_NAME = "house_ptr_pdf"
+
+# Bump when parse_ptr_transactions changes: cached extractions of older versions are ignored.
+PTR_PARSER_VERSION = "1"
+
+TX_TYPES = {"P": "Purchase", "S": "Sale", "S (partial)": "Sale (partial)", "E": "Exchange"}
+
+_TX_RE = re.compile(
+    r"^(?:(?P<owner>SP|JT|DC)\s+)?(?P<asset>.+?)\s+"
+    r"(?P<type>S \(partial\)|P|S|E)\s+"
+    r"(?P<tx_date>\d{2}/\d{2}/\d{4})\s*(?P<notified>\d{2}/\d{2}/\d{4})\s*"
+    r"(?P<amount>\$[\d,]+\s*-\s*\$[\d,]+|Over \$[\d,]+|\$[\d,]+\s*\+)"
+)
+_NAME_RE = re.compile(r"Name:\s*(.+)")
+_DISTRICT_RE = re.compile(r"State/District:\s*([A-Z]{2}\d{0,2})")
+_SIGNED_RE = re.compile(r"Digitally Signed:.*?(\d{2}/\d{2}/\d{4})")
+_FILING_ID_RE = re.compile(r"Filing ID #?\s*(\d+)")
+_TICKER_RE = re.compile(r"\(([A-Z][A-Z.]{0,5})\)")
+_TABLE_START_RE = re.compile(r"^(?:ID\s+)?Owner\s+Asset\b")
+# Wrapped pieces of the column header row ("Type", "Date Notification", "Gains >", "$200?").
+_HEADER_RE = re.compile(r"^(?:(?:ID|Owner|Asset|Transaction|Type|Date|Notification|Amount|Cap\.|Gains|>|\$200\?)\s*)+$")
+# "Label: value" lines: filer metadata and per-row annotations ("F S: New", "Description: ...").
+_LABEL_RE = re.compile(r"^[A-Za-z][A-Za-z /]{0,30}:\s")
+_WS_RE = re.compile(r"\s+")
+
+
+def extract_pdf_text(pdf_bytes: bytes) -> str:
+    try:
+        from pypdf import PdfReader  # type: ignore
+    except ImportError as e:
+        raise RuntimeError("Install pypdf to extract House PTR PDFs.") from e
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def parse_ptr_transactions(text: str) -> List[Dict[str, Any]]:
+    """
+    Parse the transaction table of a House Periodic Transaction Report.
+    Asset names and amount bands often wrap across lines, so lines are accumulated
+    until they form a complete transaction row.
+    """
+    name_m = _NAME_RE.search(text)
+    district_m = _DISTRICT_RE.search(text)
+    signed_m = _SIGNED_RE.search(text)
+    filing_m = _FILING_ID_RE.search(text)
+
+    person = _WS_RE.sub(" ", name_m.group(1)).strip() if name_m else ""
+    common = {
+        "reporting_person": person,
+        "office": district_m.group(1) if district_m else "",
+        "filing_date": signed_m.group(1) if signed_m else "",
+        "filing_id": filing_m.group(1) if filing_m else "",
+    }
+
+    rows: List[Dict[str, Any]] = []
+    buf = ""
+    in_table = False
+    for line in text.splitlines():
+        line = line.strip()
+        if _TABLE_START_RE.match(line):
+            in_table, buf = True, ""
+            continue
+        if not in_table or not line or _HEADER_RE.match(line):
+            continue
+        if _LABEL_RE.match(line):
+            buf = ""
+            continue
+        buf = f"{buf} {line}" if buf else line
+        m = _TX_RE.search(buf)
+        if not m:
+            # Drop runaway buffers (page furniture between rows) but keep a possible row start.
+            if len(buf) > 400:
+                buf = line
+            continue
+        asset = _WS_RE.sub(" ", m.group("asset")).strip()
+        ticker_m = _TICKER_RE.search(asset)
+        rows.append({
+            **common,
+            "owner": m.group("owner") or "",
+            "asset_description": asset,
+            "ticker": ticker_m.group(1) if ticker_m else "",
+            "transaction_type": TX_TYPES[m.group("type")],
+            "transaction_date": m.group("tx_date"),
+            "notification_date": m.group("notified"),
+            "amount_band": _WS_RE.sub(" ", m.group("amount")).strip(),
+            "ptr_row": len(rows),
+        })
+        buf = ""
+    return rows
+
+
+def as_bytes(value: Any) -> Optional[bytes]:
+    """raw_content as bytes: BYTEA (bytes/memoryview), Postgres hex text ("\\x.."), or base64."""
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, str):
+        if value.startswith("\\x"):
+            return bytes.fromhex(value[2:])
+        try:
+            return base64.b64decode(value, validate=True)
+        except (binascii.Error, ValueError):
+            return None
+    return None
+
+
+def _limit_memory(mem_limit_mb: Optional[int]) -> None:
+    # Pool initializer: cap the worker's address space so a hostile PDF cannot take the host down.
+    if mem_limit_mb and resource is not None:
+        limit = mem_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _alarm(signum: int, frame: Any) -> None:
+    raise TimeoutError
+
+
+def _extract_task(pdf_bytes: bytes, timeout_sec: int) -> Tuple[str, Any]:
+    """Runs in a pool worker. Returns ("ok", rows) or ("error", reason)."""
+    use_alarm = hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _alarm)
+        signal.alarm(max(1, int(timeout_sec)))
+    try:
+        return "ok", parse_ptr_transactions(extract_pdf_text(pdf_bytes))
+    except TimeoutError:
+        return "error", f"timeout after {timeout_sec}s"
+    except MemoryError:
+        return "error", "memory limit exceeded"
+    except Exception as e:
+        return "error", f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+
+
+class _Task:
+    """A submitted document: its bytes are kept so it can be resubmitted to a recycled pool."""
+
+    __slots__ = ("pdf_bytes", "async_result")
+
+    def __init__(self, pdf_bytes: bytes, async_result: Any) -> None:
+        self.pdf_bytes = pdf_bytes
+        self.async_result = async_result
+
+
+class PtrExtractionPool:
+    """
+    Process pool for PDF -> transaction extraction.
+
+    Each document runs under a per-document timeout (SIGALRM inside the worker, plus a
+    hard deadline in the parent that recycles the pool if a worker stops responding)
+    and a per-worker address-space limit. Recycling resubmits the other documents still
+    in flight, so only the stuck one fails. Workers are recycled every
+    `max_tasks_per_child` documents. The pool is only started when the first PDF arrives.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout_sec: int = 30,
+        mem_limit_mb: Optional[int] = 512,
+        max_tasks_per_child: int = 50,
+    ) -> None:
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.timeout_sec = timeout_sec
+        self.mem_limit_mb = mem_limit_mb
+        self.max_tasks_per_child = max_tasks_per_child
+        self._pool: Any = None
+        self._inflight: Dict[int, _Task] = {}
+
+    def _ensure_pool(self) -> Any:
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(
+                self.workers,
+                initializer=_limit_memory,
+                initargs=(self.mem_limit_mb,),
+                maxtasksperchild=self.max_tasks_per_child,
+            )
+        return self._pool
+
+    def _apply(self, pdf_bytes: bytes) -> Any:
+        return self._ensure_pool().apply_async(_extract_task, (pdf_bytes, self.timeout_sec))
+
+    def submit(self, pdf_bytes: bytes) -> _Task:
+        task = _Task(pdf_bytes, self._apply(pdf_bytes))
+        self._inflight[id(task)] = task
+        return task
+
+    def result(self, task: _Task) -> Tuple[str, Any]:
+        self._inflight.pop(id(task), None)
+        try:
+            return task.async_result.get(timeout=self.timeout_sec + 10)
+        except multiprocessing.TimeoutError:
+            # The worker ignored its alarm (stuck in C code): replace the pool, keep the rest.
+            self._recycle()
+            return "error", f"hard timeout after {self.timeout_sec + 10}s"
+
+    def _recycle(self) -> None:
+        pending = [t for t in self._inflight.values() if not t.async_result.ready()]
+        self._terminate()
+        for t in pending:
+            t.async_result = self._apply(t.pdf_bytes)
+
+    def _terminate(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def close(self, terminate: bool = False) -> None:
+        self._inflight.clear()
+        if terminate:
+            self._terminate()
+        elif self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "PtrExtractionPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close(terminate=exc[0] is not None)
+
+
+def is_ptr_pdf(raw: Dict[str, Any]) -> bool:
+    return (raw.get("source_name") or "").lower() == PTR_SOURCE_NAME and raw.get("payload_json") is None
+
+
+def _expanded(raw: Dict[str, Any], status: str, value: Any) -> Iterator[Dict[str, Any]]:
+    from .normalize import _sub_record
+
+    if status != "ok":
+        yield {**raw, "extraction_error": value}
+    elif not value:
+        yield {**raw, "extraction_error": "no transactions found"}
+    else:
+        for tx in value:
+            yield _sub_record(raw, tx)
+
+
+def expand_ptr_rows(
+    rows: Iterable[Dict[str, Any]],
+    pool: PtrExtractionPool,
+    window: Optional[int] = None,
+    cache: Any = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Replace each House PTR PDF row with one politician-disclosure row per transaction.
+    Other rows pass through untouched and input order is preserved; up to `window`
+    PDFs are in flight at once. PDFs that cannot be extracted come back with
+    `extraction_error` set, which normalization quarantines.
+
+    With a `cache` (see cache.NormalizationCache), extracted transactions are looked
+    up by the PDF's content key before it is submitted; failures are never cached.
+    """
+    from .normalize import content_key
+
+    window = window or pool.workers * 4
+    pending: Deque[Tuple[Dict[str, Any], Any, Optional[bytes]]] = deque()
+
+    def drain_one() -> Iterator[Dict[str, Any]]:
+        raw, handle, key = pending.popleft()
+        if handle is None:
+            yield raw
+            return
+        status, value = pool.result(handle) if not isinstance(handle, tuple) else handle
+        if key is not None and status == "ok":
+            cache.put_extraction(key, PTR_PARSER_VERSION, value)
+        yield from _expanded(raw, status, value)
+
+    for raw in rows:
+        if not is_ptr_pdf(raw):
+            pending.append((raw, None, None))
+        else:
+            data = as_bytes(raw.get("raw_content"))
+            key = content_key(raw) if data and cache is not None else None
+            hit = cache.get_extraction(key, PTR_PARSER_VERSION) if key is not None else None
+            if hit is not None:
+                pending.append((raw, ("ok", hit), None))
+            else:
+                pending.append((raw, pool.submit(data) if data else ("error", "missing raw_content"), key))
+        while len(pending) > window:
+            yield from drain_one()
+    while pending:
+        yield from drain_one()
+
+
+def reextract_ptr_row(raw: Dict[str, Any], timeout_sec: int = 30) -> List[Dict[str, Any]]:
+    """
+    A quarantined PTR PDF row extracted again, in this process (for reprocessing).
+    The stored `extraction_error` is dropped; rows that are not PTR PDFs come back as they are.
+    """
+    if not raw.get("extraction_error") or not is_ptr_pdf(raw):
+        return [raw]
+    raw = {k: v for k, v in raw.items() if k != "extraction_error"}
+    data = as_bytes(raw.get("raw_content"))
+    status, value = _extract_task(data, timeout_sec) if data else ("error", "missing raw_content")
+    return list(_expanded(raw, status, value))
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .normalize import NormalizationResult, content_key, iter_normalized, route_mapper
+from .ptr_extract import reextract_ptr_row
+
+
+SQL_CREATE = """
+CREATE TABLE IF NOT EXISTS quarantine (
+  record_key       BLOB PRIMARY KEY,
+  raw_document_id  TEXT,
+  mapper           TEXT NOT NULL,
+  mapper_version   TEXT NOT NULL,
+  reason           TEXT NOT NULL,
+  record_json      TEXT NOT NULL,
+  created_at_utc   TEXT NOT NULL,
+  updated_at_utc   TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+SQL_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_quarantine_reason ON quarantine (reason)",
+    "CREATE INDEX IF NOT EXISTS ix_quarantine_mapper ON quarantine (mapper, mapper_version)",
+)
+
+SQL_UPSERT = """
+INSERT INTO quarantine VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (record_key) DO UPDATE SET
+  raw_document_id = excluded.raw_document_id,
+  mapper = excluded.mapper,
+  mapper_version = excluded.mapper_version,
+  reason = excluded.reason,
+  record_json = excluded.record_json,
+  updated_at_utc = excluded.updated_at_utc
+"""
+
+# Columns that hold bytes in raw_documents rows; stored as Postgres-style "\x<hex>" text.
+BYTES_COLUMNS = ("content_sha256", "raw_content", "source_hash")
+
+# Reprocessing outcome for one stored row: (record_key, [(record, result), ...])
+Reprocessed = Tuple[bytes, List[Tuple[Dict[str, Any], NormalizationResult]]]
+
+
+def rejected(reprocessed: Iterable[Reprocessed]) -> List[Tuple[Dict[str, Any], NormalizationResult]]:
+    """The (record, result) pairs that reprocessing rejected."""
+    return [(rec, res) for _, outcomes in reprocessed for rec, res in outcomes if res.status == "reject"]
+
+
+def _now_iso() -> str:
+    return dt.datetime.now(dt.timezone.utc).isoformat()
+
+
+def _encode_record(rec: Dict[str, Any]) -> str:
+    out = dict(rec)
+    for k in BYTES_COLUMNS:
+        if isinstance(out.get(k), (bytes, bytearray, memoryview)):
+            out[k] = "\\x" + bytes(out[k]).hex()
+    return json.dumps(out, ensure_ascii=False, default=str)
+
+
+def _decode_record(text: str) -> Dict[str, Any]:
+    rec = json.loads(text)
+    for k in BYTES_COLUMNS:
+        v = rec.get(k)
+        if isinstance(v, str) and v.startswith("\\x"):
+            rec[k] = bytes.fromhex(v[2:])
+    return rec
+
+
+def _reprocess_chunk(chunk: List[Tuple[bytes, str]]) -> List[Reprocessed]:
+    # Runs in a worker process: normalize each stored record again from scratch (no cache).
+    # PTR PDFs that failed extraction are extracted again rather than replaying the stored error.
+    return [
+        (key, [out for rec in reextract_ptr_row(_decode_record(text)) for out in iter_normalized(rec)])
+        for key, text in chunk
+    ]
+
+
+class QuarantineStore:
+    """
+    Durable (SQLite) store of quarantined records, indexed by reason and by the
+    mapper (and mapper version) that routed them.
+
+    A record is keyed by its content key, so re-quarantining the same record updates
+    it in place. reprocess() re-normalizes a selection in parallel; settle() then
+    removes the records that now produce events.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(SQL_CREATE)
+        for sql in SQL_INDEXES:
+            self.conn.execute(sql)
+
+    def add(self, rec: Dict[str, Any], result: NormalizationResult) -> None:
+        spec = route_mapper(rec)
+        now = _now_iso()
+        self.conn.execute(
+            SQL_UPSERT,
+            (
+                content_key(rec),
+                rec.get("raw_document_id"),
+                spec.name if spec else "",
+                spec.version if spec else "",
+                result.reason,
+                _encode_record(rec),
+                now,
+                now,
+            ),
+        )
+
+    def select(self, reason: Optional[str] = None, mapper: Optional[str] = None) -> Iterator[Tuple[bytes, str]]:
+        """(record_key, record_json) for rows whose reason starts with `reason` and/or routed to `mapper`."""
+        where: List[str] = []
+        params: List[Any] = []
+        if reason:
+            # Prefix range instead of LIKE so ix_quarantine_reason is used (reasons may carry details).
+            where.append("reason >= ? AND reason < ?")
+            params += [reason, reason + "\U0010ffff"]
+        if mapper is not None:
+            where.append("mapper = ?")
+            params.append(mapper)
+        sql = "SELECT record_key, record_json FROM quarantine"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        yield from self.conn.execute(sql, params)
+
+    def remove(self, key: bytes) -> None:
+        self.conn.execute("DELETE FROM quarantine WHERE record_key = ?", (key,))
+
+    def summary(self) -> List[Tuple[str, str, str, int]]:
+        """(mapper, mapper_version, reason, count), largest first."""
+        return self.conn.execute(
+            "SELECT mapper, mapper_version, reason, COUNT(*) FROM quarantine GROUP BY 1, 2, 3 ORDER BY 4 DESC"
+        ).fetchall()
+
+    def reprocess(
+        self,
+        reason: Optional[str] = None,
+        mapper: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 200,
+    ) -> Iterator[Reprocessed]:
+        """
+        Re-normalize the selected records across a process pool.
+        Yields (record_key, outcomes) per stored row. The store is not changed: callers
+        persist the ok outcomes first, then hand the results to settle().
+        """
+        rows = list(self.select(reason, mapper))
+        chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        if not chunks:
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for done in pool.map(_reprocess_chunk, chunks):
+                yield from done
+
+    def settle(self, reprocessed: Iterable[Reprocessed]) -> int:
+        """
+        Replace each reprocessed row by its new quarantine outcomes (if any) and commit.
+        Rejected outcomes leave the store like promoted ones, so callers record them first
+        (see rejected()). Returns how many were dropped.
+        """
+        dropped = 0
+        for key, outcomes in reprocessed:
+            self.remove(key)
+            for rec, res in outcomes:
+                if res.status == "quarantine":
+                    self.add(rec, res)
+                elif res.status == "reject":
+                    dropped += 1
+        self.commit()
+        return dropped
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self) -> "QuarantineStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        # Keep the store as it was if the block failed (e.g. promoted events were not persisted).
+        if exc[0] is not None:
+            self.conn.rollback()
+        self.close()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import dataclasses
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple
+
+
+# mapper(raw, base, payload) -> NormalizationResult
+MapperFn = Callable[[Dict[str, Any], Dict[str, Any], Any], Any]
+# splitter(raw) -> iterator of sub-records, or None when `raw` is a single record
+SplitterFn = Callable[[Dict[str, Any]], Optional[Iterator[Dict[str, Any]]]]
+
+
+def token(word: str) -> str:
+    """Regex matching `word` as a whole token ("sec" matches "sec_feed", not "second")."""
+    return rf"(?<![a-z0-9]){re.escape(word)}(?![a-z0-9])"
+
+
+@dataclasses.dataclass(frozen=True)
+class MapperSpec:
+    name: str
+    version: str
+    func: MapperFn
+    # Exact (source_type, source_name) pairs, compared lowercased.
+    sources: Tuple[Tuple[str, str], ...] = ()
+    # Fallback regexes, searched in the lowercased source_type / source_name.
+    type_patterns: Tuple[Pattern[str], ...] = ()
+    name_patterns: Tuple[Pattern[str], ...] = ()
+    splitter: Optional[SplitterFn] = None
+
+    def matches(self, source_type: str, source_name: str) -> bool:
+        return any(p.search(source_type) for p in self.type_patterns) or any(p.search(source_name) for p in self.name_patterns)
+
+
+class MapperRegistry:
+    """
+    Declarative mapper routing.
+
+    Mappers declare the (source_type, source_name) pairs they handle; those resolve with
+    one dict lookup. Anything else falls back to the declared patterns, tried in
+    registration order, and the outcome (including "no mapper") is memoized per pair.
+    """
+
+    def __init__(self) -> None:
+        self._specs: Dict[str, MapperSpec] = {}
+        self._exact: Dict[Tuple[str, str], MapperSpec] = {}
+        self._resolved: Dict[Tuple[str, str], Optional[MapperSpec]] = {}
+
+    def register(
+        self,
+        name: str,
+        version: str,
+        func: MapperFn,
+        sources: Iterable[Tuple[str, str]] = (),
+        type_patterns: Sequence[str] = (),
+        name_patterns: Sequence[str] = (),
+        splitter: Optional[SplitterFn] = None,
+    ) -> MapperSpec:
+        if name in self._specs:
+            raise ValueError(f"mapper already registered: {name}")
+        spec = MapperSpec(
+            name=name,
+            version=version,
+            func=func,
+            sources=tuple((t.lower(), n.lower()) for t, n in sources),
+            type_patterns=tuple(re.compile(p) for p in type_patterns),
+            name_patterns=tuple(re.compile(p) for p in name_patterns),
+            splitter=splitter,
+        )
+        for pair in spec.sources:
+            if pair in self._exact:
+                raise ValueError(f"source {pair} already handled by mapper {self._exact[pair].name}")
+            self._exact[pair] = spec
+        self._specs[name] = spec
+        self._resolved.clear()
+        return spec
+
+    def mapper(self, name: str, version: str, **kwargs: Any) -> Callable[[MapperFn], MapperFn]:
+        """Decorator form of register()."""
+        def deco(func: MapperFn) -> MapperFn:
+            self.register(name, version, func, **kwargs)
+            return func
+        return deco
+
+    def resolve(self, source_type: Optional[str], source_name: Optional[str]) -> Optional[MapperSpec]:
+        key = ((source_type or "").lower(), (source_name or "").lower())
+        spec = self._exact.get(key)
+        if spec is not None:
+            return spec
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+        found = next((s for s in self._specs.values() if s.matches(*key)), None)
+        self._resolved[key] = found
+        return found
+
+    def get(self, name: str) -> MapperSpec:
+        return self._specs[name]
+
+    def specs(self) -> List[MapperSpec]:
+        return list(self._specs.values())
+
+    def versions(self) -> Dict[str, str]:
+        return {name: spec.version for name, spec in self._specs.items()}
+
+
+REGISTRY = MapperRegistry()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any, List, Optional
+
+from phase3_ingestion.checkpoints import get_checkpoint, set_checkpoint
+from phase3_ingestion.models import Checkpoint
+
+from .normalize import CONFIDENCE_THRESHOLDS, FRESHNESS_BUCKETS, FRESHNESS_STALE, _now_utc
+
+
+CHECKPOINT_NAME = "phase4_rescore"
+
+# An event changes freshness bucket when its age reaches max_days + 1 whole days.
+BOUNDARY_DAYS = tuple(max_days + 1 for max_days, _ in FRESHNESS_BUCKETS)
+
+
+def _freshness_sql(age: str) -> str:
+    whens = " ".join(f"WHEN {age} <= {max_days} THEN {score}" for max_days, score in FRESHNESS_BUCKETS)
+    return f"CASE {whens} ELSE {FRESHNESS_STALE} END"
+
+
+def _confidence_sql(freshness: str) -> str:
+    whens = " ".join(f"WHEN {freshness} >= {min_f} THEN '{conf}'" for min_f, conf in CONFIDENCE_THRESHOLDS)
+    return f"CASE {whens} ELSE 'LOW' END"
+
+
+# Same arithmetic as normalize.overall_score (integer division, half up).
+SQL_RESCORE = f"""
+WITH s AS (
+  SELECT e.event_id, {_freshness_sql("a.age_days")} AS freshness
+  FROM events e
+  CROSS JOIN LATERAL (
+    SELECT GREATEST(0, floor(extract(epoch FROM (%(now)s::timestamptz - e.discovered_at_utc)) / 86400))::int AS age_days
+  ) a
+  WHERE {{window}}
+)
+UPDATE events e
+SET freshness_score = s.freshness,
+    overall_score = LEAST(100, GREATEST(0, (4 * e.credibility_score + 3 * s.freshness + 3 * e.materiality_score + 5) / 10)),
+    confidence = {_confidence_sql("s.freshness")}
+FROM s
+WHERE e.event_id = s.event_id
+  AND e.freshness_score <> s.freshness
+"""
+
+
+def _window(since: Optional[dt.datetime]) -> str:
+    # Events whose age crossed a boundary between `since` and `now`: one index range per boundary.
+    # Hours, not days: '1 day' follows the session time zone across DST changes; ages here are 86400 s days.
+    if since is None:
+        return f"e.discovered_at_utc <= %(now)s::timestamptz - interval '{min(BOUNDARY_DAYS) * 24} hours'"
+    ranges: List[str] = [
+        f"(e.discovered_at_utc > %(since)s::timestamptz - interval '{d * 24} hours' "
+        f"AND e.discovered_at_utc <= %(now)s::timestamptz - interval '{d * 24} hours')"
+        for d in BOUNDARY_DAYS
+    ]
+    return " OR ".join(ranges)
+
+
+def rescore(conn: Any, now: Optional[dt.datetime] = None) -> int:
+    """
+    Recompute freshness_score / overall_score / confidence for the events whose age
+    crossed a freshness bucket boundary since the previous run, in one UPDATE.
+    The first run (no checkpoint) covers every event older than the first boundary.
+    Returns the number of events updated.
+    """
+    now = now or _now_utc()
+    cp = get_checkpoint(conn, CHECKPOINT_NAME)
+    since = cp.last_since_utc
+    if since is not None and since >= now:
+        return 0
+
+    with conn.cursor() as cur:
+        cur.execute(SQL_RESCORE.format(window=_window(since)), {"now": now, "since": since})
+        updated = cur.rowcount
+
+    set_checkpoint(conn, Checkpoint(connector_name=CHECKPOINT_NAME, last_since_utc=now, meta={"updated": updated}))
+    return updated
@@ -0,0 +1,47 @@
+import hashlib
+import json
+import unittest
+
+from phase4_normalization.cache import NormalizationCache
+from phase4_normalization.normalize import iter_normalized
+
+
+def _filing(source_url: str, retrieved_at: str = "2025-12-01T06:00:00Z") -> dict:
+    payload = {"form": "8-K", "accession_number": "0000320193-25-000001", "filer_name": "Apple Inc."}
+    return {
+        "raw_document_id": retrieved_at,
+        "source_type": "sec",
+        "source_name": "edgar_current_filing",
+        "source_url": source_url,
+        "retrieved_at_utc": retrieved_at,
+        "title": "8-K - Apple Inc.",
+        "content_sha256": hashlib.sha256(b"same filing").hexdigest(),
+        "payload_json": payload,
+        "text_content": json.dumps(payload),
+    }
+
+
+class TestNormalizationCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = NormalizationCache(":memory:")
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_row_metadata_is_part_of_the_key(self):
+        [(_, rejected)] = list(iter_normalized(_filing("http://www.sec.gov/a"), cache=self.cache))
+        [(_, ok)] = list(iter_normalized(_filing("https://www.sec.gov/a"), cache=self.cache))
+        self.assertEqual((rejected.status, ok.status), ("reject", "ok"))
+        self.assertEqual(ok.event["source_url"], "https://www.sec.gov/a")
+
+    def test_hit_replays_the_same_row(self):
+        first = list(iter_normalized(_filing("https://www.sec.gov/a"), cache=self.cache))
+        again = list(iter_normalized(_filing("https://www.sec.gov/a"), cache=self.cache))
+        later = list(iter_normalized(_filing("https://www.sec.gov/a", "2025-12-02T06:00:00Z"), cache=self.cache))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        self.assertEqual(again[0][1].event["event_fingerprint"], first[0][1].event["event_fingerprint"])
+        self.assertEqual(later[0][1].event["discovered_at_utc"].day, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import json
+import unittest
+
+from phase4_normalization.dedupe import EventDeduper
+from phase4_normalization.normalize import iter_normalized
+
+
+def _page(retrieved_at: str, amount: int = 5000) -> dict:
+    award = {"generated_unique_award_id": "CONT_AWD_1", "Awarding Agency": "Department of Defense", "Recipient Name": "Acme Inc.", "Award Amount": amount}
+    return {
+        "raw_document_id": retrieved_at,
+        "source_type": "usaspending",
+        "source_name": "spending_by_award",
+        "source_url": "https://api.usaspending.gov/api/v2/search/spending_by_award/",
+        "retrieved_at_utc": retrieved_at,
+        "title": "USAspending spending_by_award page",
+        "text_content": json.dumps({"results": [award]}),
+    }
+
+
+def _events(raw: dict) -> list:
+    return [res.event for _, res in iter_normalized(raw) if res.event is not None]
+
+
+class TestContentDigest(unittest.TestCase):
+    def test_refetched_record_is_a_duplicate(self):
+        deduper = EventDeduper()
+        first = deduper.classify(_events(_page("2025-12-01T06:00:00Z")))
+        again = deduper.classify(_events(_page("2025-12-02T06:00:00Z")))
+        self.assertEqual(len(first.new), 1)
+        self.assertEqual((again.new, again.changed, again.duplicates), ([], [], 1))
+
+    def test_changed_payload_is_changed(self):
+        deduper = EventDeduper()
+        deduper.classify(_events(_page("2025-12-01T06:00:00Z")))
+        again = deduper.classify(_events(_page("2025-12-02T06:00:00Z", amount=7500)))
+        self.assertEqual((len(again.changed), again.duplicates), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from phase4_normalization.dod_awards import iter_dod_awards, parse_award_paragraph
+
+ARTICLE = """
+<html><body><article>
+<p>NAVY</p>
+<p>Marine Hydraulics International LLC,* Norfolk, Virginia, is awarded a $12,345,678 firm-fixed-price
+contract for the USS Bataan (LHD 5) fiscal 2025 selected restricted availability. Work will be performed in
+Norfolk, Virginia, and is expected to be completed by March 2026. Fiscal 2025 operation and maintenance (Navy)
+funds will be obligated at time of award and will not expire at the end of the current fiscal year. This
+contract was competitively procured via the SAM.gov website, with two offers received. The Navy's Mid-Atlantic
+Regional Maintenance Center, Norfolk, Virginia, is the contracting activity (N50054-25-C-0012).</p>
+<p>ARMY</p>
+<p>Alion Science and Technology Corp., McLean, Virginia (W912DY-25-D-0001); Fluor Intercontinental, Inc.,
+Greenville, South Carolina (W912DY-25-D-0002); and Tetra Tech Inc.,* Pasadena, California
+(W912DY-25-D-0003), were awarded a $99,000,000 firm-fixed-price multiple-award contract for environmental
+remediation services. Bids were solicited via the internet with five received. Work locations and funding
+will be determined with each order, with an estimated completion date of Jan. 31, 2030. U.S. Army Corps of
+Engineers, Huntsville, Alabama, is the contracting activity.</p>
+<p>DEFENSE LOGISTICS AGENCY</p>
+<p>Sikorsky Aircraft Corp., a Lockheed Martin Co., Stratford, Connecticut, has been awarded a maximum
+$48,000,000 modification exercising the second one-year option period of a one-year base contract with four
+one-year option periods for H-60 helicopter spare parts. Location of performance is Connecticut, with a
+Sept. 30, 2026, ordering period end date.</p>
+<p>*Small business</p>
+</article></body></html>
+"""
+
+
+class TestDodAwards(unittest.TestCase):
+    def test_article(self):
+        awards = list(iter_dod_awards(ARTICLE))
+        self.assertEqual(
+            [(a["recipient"], a["contract_number"], a["service_branch"], a["award_seq"]) for a in awards],
+            [
+                ("Marine Hydraulics International LLC", "N50054-25-C-0012", "NAVY", 0),
+                ("Alion Science and Technology Corp.", "W912DY-25-D-0001", "ARMY", 1),
+                ("Fluor Intercontinental, Inc.", "W912DY-25-D-0002", "ARMY", 2),
+                ("Tetra Tech Inc.", "W912DY-25-D-0003", "ARMY", 3),
+                ("Sikorsky Aircraft Corp.", None, "DEFENSE LOGISTICS AGENCY", 4),
+            ],
+        )
+        self.assertEqual([a["obligated_amount"] for a in awards], [12345678.0] + [99000000.0] * 3 + [48000000.0])
+
+    def test_small_business_marker_before_the_comma(self):
+        [award] = parse_award_paragraph("Acme Inc.*, Norfolk, Virginia, was awarded a $1.5 million contract (N00024-25-C-4101).", None)
+        self.assertEqual((award["recipient"], award["contract_number"], award["agency"]), ("Acme Inc.", "N00024-25-C-4101", "DoD"))
+        self.assertEqual(award["obligated_amount"], 1_500_000)
+
+    def test_paragraphs_without_an_award(self):
+        self.assertEqual(parse_award_paragraph("*Small business", "NAVY"), [])
+        self.assertEqual(parse_award_paragraph("The contract was awarded on time.", "NAVY"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
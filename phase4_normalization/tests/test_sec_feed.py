@@ -0,0 +1,68 @@
+import json
+import unittest
+
+from phase4_normalization.normalize import iter_normalized
+
+FEED = """<?xml version="1.0" encoding="ISO-8859-1" ?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Latest Filings</title>
+<entry>
+<title>8-K - APPLE INC (0000320193) (Filer)</title>
+<link rel="alternate" type="text/html" href="https://www.sec.gov/Archives/edgar/data/320193/000032019325000071/0000320193-25-000071-index.htm"/>
+<summary type="html"> &lt;b&gt;Filed:&lt;/b&gt; 2025-12-01 &lt;b&gt;AccNo:&lt;/b&gt; 0000320193-25-000071 &lt;b&gt;Size:&lt;/b&gt; 301 KB</summary>
+<updated>2025-12-01T16:30:12-05:00</updated>
+<id>urn:tag:sec.gov,2008:accession-number=0000320193-25-000071</id>
+</entry>
+<entry>
+<title>8-K/A - Lockheed Martin Corp (0000936468) (Filer)</title>
+<link rel="alternate" type="text/html" href="https://www.sec.gov/Archives/edgar/data/936468/000093646825000114/0000936468-25-000114-index.htm"/>
+<summary type="html"> &lt;b&gt;Filed:&lt;/b&gt; 2025-12-01</summary>
+<updated>2025-12-01T16:05:40-05:00</updated>
+<id>urn:tag:sec.gov,2008:accession-number=0000936468-25-000114</id>
+</entry>
+</feed>
+"""
+
+
+def _raw(**kw) -> dict:
+    raw = {
+        "raw_document_id": "feed-1",
+        "source_type": "sec",
+        "source_name": "edgar_current_feed_8-K",
+        "source_url": "https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&type=8-K&output=atom",
+        "retrieved_at_utc": "2025-12-01T22:00:00Z",
+        "title": "EDGAR current feed",
+        "text_content": FEED,
+    }
+    raw.update(kw)
+    return raw
+
+
+class TestSecFeed(unittest.TestCase):
+    def test_entries_carry_accession_and_filer(self):
+        events = [res.event for _, res in iter_normalized(_raw())]
+        details = [ev["details_json"]["type_specific"] for ev in events]
+        self.assertEqual(
+            [(d["accession_number"], d["filer_name"]) for d in details],
+            [("0000320193-25-000071", "APPLE INC"), ("0000936468-25-000114", "Lockheed Martin Corp")],
+        )
+        self.assertEqual(events[0]["details_json"]["raw_payload"]["cik"], "0000320193")
+        self.assertNotEqual(events[0]["event_fingerprint"], events[1]["event_fingerprint"])
+
+    def test_single_entry_row_from_the_connector(self):
+        payload = {
+            "form": "8-K",
+            "id": "urn:tag:sec.gov,2008:accession-number=0000320193-25-000071",
+            "title": "8-K - APPLE INC (0000320193) (Filer)",
+            "link": "https://www.sec.gov/Archives/edgar/data/320193/000032019325000071/0000320193-25-000071-index.htm",
+            "updated": "2025-12-01T21:30:12Z",
+            "summary": "Filed: 2025-12-01",
+        }
+        raw = _raw(source_name="edgar_current_filing", source_url=payload["link"], title=payload["title"], text_content=json.dumps(payload))
+        [(_, res)] = list(iter_normalized(raw))
+        details = res.event["details_json"]["type_specific"]
+        self.assertEqual((details["accession_number"], details["filer_name"]), ("0000320193-25-000071", "APPLE INC"))
+
+
+if __name__ == "__main__":
+    unittest.main()
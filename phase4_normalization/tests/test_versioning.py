@@ -0,0 +1,50 @@
+import json
+import unittest
+
+from phase4_normalization.dedupe import content_digest
+from phase4_normalization.normalize import iter_normalized
+from phase4_normalization.versioning import VersioningEngine
+
+
+def _award(retrieved_at: str, amount: int = 5000) -> dict:
+    raw = {
+        "raw_document_id": retrieved_at,
+        "source_type": "usaspending",
+        "source_name": "spending_by_award",
+        "source_url": "https://api.usaspending.gov/api/v2/search/spending_by_award/",
+        "retrieved_at_utc": retrieved_at,
+        "title": "USAspending spending_by_award page",
+        "text_content": json.dumps({"results": [
+            {"generated_unique_award_id": "CONT_AWD_1", "Awarding Agency": "Department of Defense", "Recipient Name": "Acme Inc.", "Award Amount": amount},
+        ]}),
+    }
+    [(_, res)] = list(iter_normalized(raw))
+    res.event["content_digest"] = content_digest(res.event)
+    return res.event
+
+
+class TestVersionPlan(unittest.TestCase):
+    def test_refetched_record_cuts_no_version(self):
+        engine = VersioningEngine()
+        first = engine.plan([_award("2025-12-01T06:00:00Z")])
+        again = engine.plan([_award("2025-12-02T06:00:00Z")])
+        self.assertEqual([ev["version"] for ev in first.events], [1])
+        self.assertEqual((again.events, again.superseded, again.duplicates), ([], [], 1))
+
+    def test_changed_payload_supersedes_the_head(self):
+        engine = VersioningEngine()
+        [v1] = engine.plan([_award("2025-12-01T06:00:00Z")]).events
+        plan = engine.plan([_award("2025-12-02T06:00:00Z", amount=7500)])
+        self.assertEqual([(ev["version"], ev["supersedes_event_id"]) for ev in plan.events], [(2, v1["event_id"])])
+        self.assertEqual(plan.superseded, [v1["event_id"]])
+
+    def test_row_without_digest_is_updated_in_place(self):
+        ev = _award("2025-12-02T06:00:00Z")
+        existing = {bytes(ev["event_fingerprint"]): ("6f1c0d4e-0000-4000-8000-000000000001", 1, None)}
+        plan = VersioningEngine().plan([ev], existing)
+        self.assertEqual([(e["event_id"], e["version"]) for e in plan.events], [("6f1c0d4e-0000-4000-8000-000000000001", 1)])
+        self.assertEqual((plan.superseded, plan.new_versions), ([], 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from phase3_ingestion.db import execute, execute_values, fetchall
+
+from .dedupe import ExistingRow
+
+
+# Latest version per version_key. FOR UPDATE serializes workers extending the same chain.
+SQL_HEADS = """
+SELECT version_key, event_id, version, content_digest
+FROM event_version_heads
+WHERE version_key = ANY(%s)
+FOR UPDATE
+"""
+
+# FOR UPDATE only locks heads that exist: two workers meeting a new version_key would
+# both plan version 1. A transaction-scoped advisory lock per key (taken in sorted order,
+# so workers cannot deadlock) serializes planning for new and existing keys alike.
+SQL_LOCK_KEYS = "SELECT pg_advisory_xact_lock(k) FROM unnest(%s::bigint[]) AS k"
+
+SQL_UPSERT_HEADS = "INSERT INTO event_version_heads (version_key, event_id, version, content_digest, updated_at_utc)"
+
+HEAD_TEMPLATE = "(%s, %s::uuid, %s, %s, now())"
+
+SQL_UPSERT_HEADS_CONFLICT = """
+ON CONFLICT (version_key)
+DO UPDATE SET
+  event_id = EXCLUDED.event_id,
+  version = EXCLUDED.version,
+  content_digest = EXCLUDED.content_digest,
+  updated_at_utc = now()
+"""
+
+SQL_SUPPRESS = "UPDATE events SET is_suppressed = TRUE WHERE event_id = ANY(%s::uuid[])"
+
+
+@dataclasses.dataclass
+class Head:
+    event_id: str
+    version: int
+    content_digest: Optional[bytes]
+    # Known when the head was written or probed in this run (not stored in the heads table).
+    event_fingerprint: Optional[bytes] = None
+
+
+@dataclasses.dataclass
+class VersionPlan:
+    events: List[Dict[str, Any]] = dataclasses.field(default_factory=list)
+    superseded: List[str] = dataclasses.field(default_factory=list)
+    superseded_fingerprints: List[bytes] = dataclasses.field(default_factory=list)
+    heads: Dict[bytes, Head] = dataclasses.field(default_factory=dict)
+    duplicates: int = 0
+    new_versions: int = 0
+
+
+def _lock_id(version_key: bytes) -> int:
+    # Advisory locks take a bigint; sharing one between two keys only serializes them.
+    return int.from_bytes(version_key[:8], "big", signed=True)
+
+
+def versioned_fingerprint(version_key: bytes, version: int) -> bytes:
+    """event_fingerprint of version >= 2 (version 1 keeps its identity fingerprint)."""
+    return hashlib.sha256(version_key + f"|v{version}".encode("ascii")).digest()
+
+
+class VersioningEngine:
+    """
+    Assigns event_id / version / supersedes_event_id to events about to be written.
+    A version is cut only when the content digest differs from the head's: an unchanged
+    record fetched again is a duplicate, whatever its fetch time.
+
+    Versions of one event share a `version_key` (award id, accession, person+transaction).
+    `event_version_heads` maps each key to its latest version, so finding the predecessor
+    is a primary-key lookup (one `= ANY(%s)` query per batch) and never scans `events`.
+    Planning holds an advisory lock per version_key until the transaction ends, so
+    concurrent workers extend a chain one at a time.
+    Events written before the heads table existed are picked up from the dedupe probe.
+    """
+
+    def __init__(self, conn: Any = None, probe_size: int = 5000) -> None:
+        self.conn = conn
+        self.probe_size = max(probe_size, 1)
+        self.heads: Dict[bytes, Head] = {}
+
+    def _load_heads(self, keys: List[bytes]) -> None:
+        """Lock `keys` for this transaction and read their heads from the table.
+
+        Heads cached by earlier batches are re-read: another worker may have moved
+        them, or the batch that wrote them may have rolled back.
+        """
+        if self.conn is None or not keys:
+            return
+        execute(self.conn, SQL_LOCK_KEYS, (sorted({_lock_id(k) for k in keys}),))
+        cached = {k: self.heads.pop(k) for k in keys if k in self.heads}
+        for i in range(0, len(keys), self.probe_size):
+            for vk, event_id, version, digest in fetchall(self.conn, SQL_HEADS, (keys[i:i + self.probe_size],)):
+                vk = bytes(vk)
+                prior = cached.get(vk)
+                # The fingerprint is not stored in the heads table; keep it if the head is the one this run wrote.
+                fp = prior.event_fingerprint if prior is not None and prior.event_id == str(event_id) else None
+                self.heads[vk] = Head(str(event_id), version, bytes(digest) if digest is not None else None, fp)
+
+    def plan(self, events: List[Dict[str, Any]], existing: Optional[Dict[bytes, ExistingRow]] = None) -> VersionPlan:
+        existing = existing or {}
+        keys = sorted({bytes(ev.get("version_key") or ev["event_fingerprint"]) for ev in events})
+        self._load_heads(keys)
+
+        out = VersionPlan()
+        for ev in events:
+            fp = bytes(ev["event_fingerprint"])
+            vk = bytes(ev.get("version_key") or fp)
+            digest = ev.get("content_digest")
+
+            head = self.heads.get(vk)
+            if head is None and fp in existing:
+                event_id, version, prior_digest = existing[fp]
+                head = Head(event_id, version, prior_digest, fp)
+            if head is not None and head.content_digest == digest:
+                out.duplicates += 1
+                continue
+
+            event_id = str(uuid.uuid4())
+            if head is None:
+                version, supersedes = 1, None
+            elif head.content_digest is None and head.event_fingerprint == fp:
+                # Written before content digests existed, so nothing shows the content changed:
+                # the upsert records the digest on that row (keeping its event_id and version).
+                event_id, version, supersedes = head.event_id, head.version, None
+            else:
+                version, supersedes = head.version + 1, head.event_id
+                out.superseded.append(head.event_id)
+                if head.event_fingerprint is not None:
+                    out.superseded_fingerprints.append(head.event_fingerprint)
+                out.new_versions += 1
+                ev["event_fingerprint"] = versioned_fingerprint(vk, version)
+
+            ev["event_id"] = event_id
+            ev["version"] = version
+            ev["supersedes_event_id"] = supersedes
+            ev["version_key"] = vk
+            head = Head(ev["event_id"], version, digest, bytes(ev["event_fingerprint"]))
+            self.heads[vk] = head
+            out.heads[vk] = head
+            out.events.append(ev)
+        return out
+
+    def apply(self, plan: VersionPlan) -> None:
+        """Write the heads and suppress superseded versions (events themselves are written by the caller)."""
+        if plan.superseded:
+            execute(self.conn, SQL_SUPPRESS, (plan.superseded,))
+        if plan.heads:
+            rows: List[Tuple[Any, ...]] = [(vk, h.event_id, h.version, h.content_digest) for vk, h in plan.heads.items()]
+            execute_values(self.conn, SQL_UPSERT_HEADS, rows, HEAD_TEMPLATE, SQL_UPSERT_HEADS_CONFLICT)
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from phase3_ingestion.db import execute_values, iter_rows
+
+from .dedupe import EventDeduper
+from .normalize import NormalizationResult, _now_utc, iter_normalized
+from .versioning import VersioningEngine
+from .ptr_extract import PtrExtractionPool, expand_ptr_rows
+
+
+RAW_COLUMNS = (
+    "raw_document_id",
+    "source_type",
+    "source_name",
+    "source_url",
+    "canonical_url",
+    "retrieved_at_utc",
+    "published_at_utc",
+    "title",
+    "mime_type",
+    "text_content",
+    "content_sha256",
+    "headers_json",
+    "raw_content",
+)
+
+# raw_content is only needed for binary documents (PTR PDFs); text documents store a copy
+# of text_content there, so it is not shipped for them.
+_RAW_SELECT = ", ".join(RAW_COLUMNS[:-1]) + ", CASE WHEN text_content IS NULL THEN raw_content END AS raw_content"
+
+# Claim a batch of RAW rows. SKIP LOCKED lets several workers (on any host) run
+# concurrently: rows locked by another open transaction are simply passed over.
+SQL_CLAIM = f"""
+SELECT {_RAW_SELECT}
+FROM raw_documents
+WHERE parse_status = 'RAW'
+ORDER BY retrieved_at_utc
+LIMIT %s
+FOR UPDATE SKIP LOCKED
+"""
+
+EVENT_COLUMNS = (
+    "event_id",
+    "version",
+    "supersedes_event_id",
+    "raw_document_id",
+    "event_type",
+    "title",
+    "summary",
+    "event_timestamp_utc",
+    "discovered_at_utc",
+    "source_type",
+    "source_name",
+    "source_url",
+    "source_hash",
+    "corroborating_sources",
+    "theme_tags",
+    "confidence",
+    "credibility_score",
+    "freshness_score",
+    "materiality_score",
+    "overall_score",
+    "details_json",
+    "ambiguity_notes",
+    "event_fingerprint",
+    "content_digest",
+)
+
+SQL_UPSERT_EVENTS = f"INSERT INTO events ({', '.join(EVENT_COLUMNS)})"
+
+EVENT_TEMPLATE = "(%s::uuid, %s, %s::uuid, %s::uuid, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, %s)"
+
+SQL_UPSERT_EVENTS_CONFLICT = """
+ON CONFLICT (event_fingerprint)
+DO UPDATE SET
+  raw_document_id = EXCLUDED.raw_document_id,
+  title = EXCLUDED.title,
+  summary = EXCLUDED.summary,
+  event_timestamp_utc = EXCLUDED.event_timestamp_utc,
+  source_hash = EXCLUDED.source_hash,
+  theme_tags = EXCLUDED.theme_tags,
+  confidence = EXCLUDED.confidence,
+  credibility_score = EXCLUDED.credibility_score,
+  freshness_score = EXCLUDED.freshness_score,
+  materiality_score = EXCLUDED.materiality_score,
+  overall_score = EXCLUDED.overall_score,
+  details_json = EXCLUDED.details_json,
+  content_digest = EXCLUDED.content_digest
+"""
+
+SQL_MARK_PARSED = """
+UPDATE raw_documents AS r
+SET parse_status = v.parse_status,
+    parse_error = v.parse_error
+FROM (
+"""
+
+MARK_TEMPLATE = "(%s::uuid, %s, %s)"
+
+SQL_MARK_PARSED_WHERE = """
+) AS v(raw_document_id, parse_status, parse_error)
+WHERE r.raw_document_id = v.raw_document_id
+"""
+
+
+@dataclasses.dataclass
+class WorkerStats:
+    batches: int = 0
+    claimed: int = 0
+    parsed: int = 0
+    failed: int = 0
+    events_written: int = 0
+    events_changed: int = 0
+    new_versions: int = 0
+    duplicates: int = 0
+    quarantined: int = 0
+    rejected: int = 0
+
+
+def _row_to_raw(row: tuple) -> Dict[str, Any]:
+    raw = dict(zip(RAW_COLUMNS, row))
+    raw["raw_document_id"] = str(raw["raw_document_id"])
+    # psycopg2 returns BYTEA as memoryview
+    for col in ("content_sha256", "raw_content"):
+        if raw.get(col) is not None:
+            raw[col] = bytes(raw[col])
+    return raw
+
+
+def _event_params(event: Dict[str, Any]) -> tuple:
+    params: List[Any] = []
+    for col in EVENT_COLUMNS:
+        val = event.get(col)
+        if col in ("details_json", "corroborating_sources"):
+            val = json.dumps(val, ensure_ascii=False, default=str) if val is not None else None
+        params.append(val)
+    return tuple(params)
+
+
+def _parse_outcome(results: List[NormalizationResult]) -> Tuple[str, Optional[str]]:
+    """A raw document is PARSED if it produced at least one event, else FAILED with the first reason."""
+    if any(r.status == "ok" and r.event for r in results):
+        return "PARSED", None
+    if not results:
+        return "FAILED", "no events produced"
+    first = results[0]
+    return "FAILED", f"{first.status}: {first.reason}"
+
+
+def persist_events(
+    conn: Any,
+    events: List[Dict[str, Any]],
+    deduper: EventDeduper,
+    versioning: VersioningEngine,
+    stats: WorkerStats,
+) -> None:
+    """Dedupe, version and write normalized events; counts go to `stats`."""
+    dedup = deduper.classify(events)
+    plan = versioning.plan(dedup.to_write(), dedup.existing)
+    to_write = plan.events
+    if to_write:
+        # ON CONFLICT stays as a guard against concurrent workers writing the same fingerprint.
+        execute_values(conn, SQL_UPSERT_EVENTS, [_event_params(ev) for ev in to_write], EVENT_TEMPLATE, SQL_UPSERT_EVENTS_CONFLICT)
+    # After the insert: a batch may supersede versions it has just written.
+    versioning.apply(plan)
+    deduper.forget(plan.superseded_fingerprints)
+
+    stats.events_written += len(to_write)
+    stats.events_changed += len(dedup.changed)
+    stats.new_versions += plan.new_versions
+    stats.duplicates += dedup.duplicates + plan.duplicates
+
+
+def mark_parsed(conn: Any, marks: List[tuple]) -> None:
+    """marks: (raw_document_id, parse_status, parse_error)"""
+    if marks:
+        execute_values(conn, SQL_MARK_PARSED, marks, MARK_TEMPLATE, SQL_MARK_PARSED_WHERE)
+
+
+def process_batch(
+    conn: Any,
+    batch_size: int,
+    itersize: int = 200,
+    cache: Any = None,
+    ptr_pool: Optional[PtrExtractionPool] = None,
+    deduper: Optional[EventDeduper] = None,
+    versioning: Optional[VersioningEngine] = None,
+    quarantine: Any = None,
+) -> WorkerStats:
+    """
+    Claim up to `batch_size` RAW rows, normalize them and persist the outcome in one transaction.
+    Events identical to what `events` already holds are not rewritten.
+    """
+    stats = WorkerStats()
+    deduper = deduper or EventDeduper(conn)
+    versioning = versioning or VersioningEngine(conn)
+    events: List[Dict[str, Any]] = []
+    # One clock per batch: every event in a transaction is scored against the same instant.
+    now = _now_utc()
+    results_by_doc: Dict[str, List[NormalizationResult]] = {}
+
+    def claimed() -> Iterator[Dict[str, Any]]:
+        for row in iter_rows(conn, SQL_CLAIM, (batch_size,), name="phase4_claim", itersize=itersize):
+            stats.claimed += 1
+            raw = _row_to_raw(row)
+            results_by_doc[raw["raw_document_id"]] = []
+            yield raw
+
+    raws = claimed()
+    if ptr_pool is not None:
+        # PTR PDFs become one row per transaction, all sharing the PDF's raw_document_id.
+        raws = expand_ptr_rows(raws, ptr_pool, cache=cache)
+
+    for raw in raws:
+        results = results_by_doc[raw["raw_document_id"]]
+        for rec, res in iter_normalized(raw, cache=cache, now=now):
+            results.append(res)
+            if res.status == "ok" and res.event:
+                events.append(res.event)
+            elif res.status == "quarantine":
+                stats.quarantined += 1
+                if quarantine is not None:
+                    quarantine.add(rec, res)
+            else:
+                stats.rejected += 1
+
+    marks: List[tuple] = []
+    for raw_document_id, results in results_by_doc.items():
+        status, error = _parse_outcome(results)
+        if status == "PARSED":
+            stats.parsed += 1
+        else:
+            stats.failed += 1
+        marks.append((raw_document_id, status, error))
+
+    persist_events(conn, events, deduper, versioning, stats)
+    mark_parsed(conn, marks)
+
+    stats.batches = 1 if stats.claimed else 0
+    return stats
+
+
+def run_worker(
+    conn: Any,
+    batch_size: int = 500,
+    max_batches: Optional[int] = None,
+    cache: Any = None,
+    ptr_pool: Optional[PtrExtractionPool] = None,
+    quarantine: Any = None,
+) -> WorkerStats:
+    """Drain RAW rows batch by batch; each batch commits (or rolls back) independently."""
+    total = WorkerStats()
+    # One deduper per run: fingerprints written by earlier batches are not probed again.
+    deduper = EventDeduper(conn)
+    versioning = VersioningEngine(conn)
+    while max_batches is None or total.batches < max_batches:
+        try:
+            stats = process_batch(conn, batch_size, cache=cache, ptr_pool=ptr_pool, deduper=deduper, versioning=versioning, quarantine=quarantine)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        if cache is not None:
+            cache.commit()
+        if quarantine is not None:
+            quarantine.commit()
+
+        if not stats.claimed:
+            break
+        for f in dataclasses.fields(WorkerStats):
+            setattr(total, f.name, getattr(total, f.name) + getattr(stats, f.name))
+    return total